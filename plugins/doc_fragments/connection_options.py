@@ -15,10 +15,11 @@ class ModuleDocFragment(object):
     DOCUMENTATION = r"""
     options:
       connection:
-        required: True
         type: dict
         description:
           - I(connection) describes Tatlin Storage Processor (SP) connection configuration.
+          - Required unless the task runs with C(ansible.netcommon.httpapi) connection
+            and C(yadro.tatlin_uni.tatlin) network OS, which keeps one session for the play.
           - Only session connection supported.
           - Authorization is executed automatically with corresponding endpoint. 'auth/login' by default.
           - Client receives x-auth-token and uses it for following requests.
@@ -27,6 +28,14 @@ class ModuleDocFragment(object):
             required: True
             type: str
             description: Tatlin REST API entrypoint.
+          management_addresses:
+            type: list
+            elements: str
+            description:
+              - Other management addresses of the same system, for example addresses of both storage processors.
+              - Read-only requests are spread between responding addresses.
+              - Other requests are sent to one address and are sent to the next one if it stops responding.
+              - Ignored with C(ansible.netcommon.httpapi) connection.
           username:
             type: str
             description: Tatlin username to login.
@@ -43,4 +52,92 @@ class ModuleDocFragment(object):
             type: int
             default: 60
             description: Tatlin REST API request timeout.
+          keep_alive:
+            type: bool
+            default: False
+            description:
+              - Reuse persistent HTTP connections for requests sent during the task.
+              - Saves TCP and TLS handshake for every request except the first one.
+              - Proxy settings from environment are not used with persistent connections.
+          retries:
+            type: int
+            default: 0
+            description:
+              - How many times to repeat idempotent requests which failed with connection error
+                or with 502, 503 or 504 status.
+              - C(PUT) and C(DELETE) requests are repeated as well, so a change which was applied
+                by Tatlin before the connection was lost may be sent again.
+              - Every attempt may take up to I(timeout) seconds.
+              - Delay between attempts grows exponentially with random jitter.
+              - Retries are disabled by default.
+          coalesce_window:
+            type: float
+            default: 0
+            description:
+              - Identical read requests made within this number of seconds share one response.
+              - Concurrent identical read requests always share one response.
+              - Any changing request makes the next read requests go to Tatlin again.
+              - Status polling, like waiting for a port or a pool to become ready, gets responses
+                up to this number of seconds old, so every poll may be delayed by it.
+          stream_json:
+            type: bool
+            default: False
+            description:
+              - Decode large collections, like hosts and resources, while their response is read.
+              - Reduces memory usage on systems with thousands of objects.
+          write_through:
+            type: bool
+            default: False
+            description:
+              - Update objects from sent changes instead of requesting them again after every change.
+              - Objects are requested again if Tatlin computes the result, like capacity after resize.
+          session_cache:
+            type: bool
+            default: False
+            description:
+              - Reuse session token between tasks instead of login and logout in every task.
+              - Tokens are stored in I(session_cache_path) by I(base_url) and I(username).
+              - Stored token is used only with the same I(password) and until it expires.
+              - Module logs in again if Tatlin rejects the stored token.
+          session_cache_path:
+            type: path
+            description:
+              - File to store session tokens in if I(session_cache) is enabled.
+              - The file is created with permissions for its owner only.
+              - Defaults to C(~/.ansible/tatlin_uni_sessions.json).
+          session_cache_ttl:
+            type: int
+            default: 600
+            description:
+              - Number of seconds a stored session token is reused for.
+              - Should not exceed session lifetime configured on Tatlin.
+                Module logs in again anyway if Tatlin rejects an expired token.
+          response_cache:
+            type: bool
+            default: False
+            description:
+              - Keep responses of large read endpoints, like drives, ports, hosts and resources, between tasks.
+              - Cached response is revalidated with C(If-None-Match) or C(If-Modified-Since) headers
+                and is not downloaded again if it was not modified.
+              - Responses without validators are reused for 10 seconds.
+              - Any changing request drops cached responses of the system.
+              - Ignored with C(ansible.netcommon.httpapi) connection.
+          response_cache_path:
+            type: path
+            description:
+              - Directory to store responses in if I(response_cache) is enabled.
+              - Files are created with permissions for their owner only.
+              - Defaults to C(~/.ansible/tatlin_uni_responses).
+      debug_metrics:
+        type: bool
+        default: False
+        description:
+          - Return metrics of requests sent to Tatlin in the C(debug_metrics) key of the result.
+          - Requests are aggregated by method, endpoint and status. Every entry has
+            count, latency histogram and request and response bytes.
+      debug_metrics_path:
+        type: path
+        description:
+          - File to append metrics of every request to as JSON lines.
+          - Can be used with or without I(debug_metrics).
 """
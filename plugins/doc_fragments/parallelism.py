@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r"""
+    options:
+      parallelism:
+        type: int
+        default: 1
+        description:
+          - Maximum number of read-only requests sent to Tatlin at the same time.
+          - Independent requests are sent one after another if set to 1.
+          - Results are returned in the same order regardless of the value.
+"""
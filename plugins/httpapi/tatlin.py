@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+---
+name: tatlin
+short_description: HttpApi plugin for Tatlin Storage Processor REST API
+description:
+  - Keeps one authenticated session to Tatlin Storage Processor (SP)
+    for all tasks of the play which run against the host.
+  - Modules of the collection send their requests through this session
+    instead of login, logout and new connection in every task.
+  - Use it with C(ansible_connection=ansible.netcommon.httpapi) and
+    C(ansible_network_os=yadro.tatlin_uni.tatlin). I(connection) module
+    parameter is not needed then.
+  - Requires C(ansible.netcommon) collection.
+version_added: "1.0.0"
+author: "Sergey Kovalev (@kvlvs)"
+"""
+
+import json
+from base64 import b64decode, b64encode
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.ansible.netcommon.plugins.plugin_utils.httpapi_base import HttpApiBase
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+
+
+class HttpApi(HttpApiBase):
+
+    def login(self, username, password):
+        response, response_data = self.connection.send(
+            '/' + eps.LOGIN_ENDPOINT,
+            json.dumps({'name': username, 'secret': password}),
+            method='POST',
+            headers={'Content-Type': 'application/json'},
+        )
+
+        if response.getcode() != 200:
+            raise ConnectionError(
+                'Tatlin login failed with status {0}: {1}'.format(
+                    response.getcode(), response_data.getvalue(),
+                )
+            )
+
+        token = json.loads(response_data.getvalue())['token']
+        self.connection._auth = {'X-Auth-Token': token}
+
+    def logout(self):
+        if self.connection._auth:
+            self.connection.send(
+                '/' + eps.LOGOUT_ENDPOINT, None, method='POST',
+            )
+            self.connection._auth = None
+
+    def update_auth(self, response, response_text):
+        # Token received on login is used for the whole session
+        return None
+
+    def handle_httperror(self, exc):
+        # Session could expire during a long play
+        if exc.code == 401 and self.connection._auth:
+            self.connection._auth = None
+            self.login(
+                self.connection.get_option('remote_user'),
+                self.connection.get_option('password'),
+            )
+            return True
+
+        # Other errors are returned to the module as responses,
+        # so it handles them the same way as with direct requests
+        return exc
+
+    def send_request(self, path, method='GET', body=None, headers=None):
+        """Sends request on behalf of a module.
+
+        Body of request and response are base64 encoded, because module
+        talks to the persistent connection with JSON-RPC
+        """
+        response, response_data = self.connection.send(
+            path,
+            b64decode(body) if body is not None else None,
+            method=method,
+            headers=headers or {},
+        )
+
+        return {
+            'status': response.getcode(),
+            'reason': getattr(response, 'reason', None) or '',
+            'headers': dict(response.headers or {}),
+            'body': b64encode(response_data.getvalue()).decode('ascii'),
+        }
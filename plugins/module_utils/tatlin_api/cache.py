@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+from collections import OrderedDict
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
+
+try:
+    from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+except ImportError:
+    Any = Callable = Dict = Hashable = Optional = Tuple = None
+
+
+RESOURCES_MAPPING = 'resources_mapping'
+
+COLLECTIONS = inv.COLLECTIONS + (RESOURCES_MAPPING,)
+
+DEFAULT_TTL = 60
+DEFAULT_MAXSIZE = 16
+
+# Collections which are changed by other clients more often
+# live shorter, rarely changed ones live longer
+DEFAULT_TTLS = {
+    inv.RESOURCES: 30,
+    RESOURCES_MAPPING: 30,
+    inv.PORTS: 120,
+    inv.USERS: 300,
+    inv.USER_GROUPS: 300,
+}
+
+# Collections which become outdated after a write to the endpoint.
+# The longest matching prefix is used, writes to unknown endpoints
+# drop everything
+ENDPOINT_COLLECTIONS = (
+    (eps.LOGIN_ENDPOINT, ()),
+    (eps.LOGOUT_ENDPOINT, ()),
+    (eps.USERS_ENDPOINT, (inv.USERS,)),
+    (eps.GROUPS_ENDPOINT, (inv.USER_GROUPS, inv.USERS)),
+    (eps.LDAP_ENDPOINT, (inv.USERS, inv.USER_GROUPS)),
+    (eps.CERTIFICATE_ENDPOINT, ()),
+    (eps.CONFIGURATION_ENDPOINT, ()),
+    (eps.NOTIFICATION_ENDPOINT, ()),
+    (eps.NETCONFIG_ENDPOINT, ()),
+    (eps.REBOOT_ENDPOINT.split('{', 1)[0], ()),
+    (eps.PORTS_ENDPOINT, (inv.PORTS,)),
+    (eps.HEALTH_POOLS_ENDPOINT, (
+        inv.POOLS, inv.DRIVE_GROUPS, inv.RESOURCES, RESOURCES_MAPPING,
+    )),
+    (eps.DASHBOARD_RESOURCES_ENDPOINT, (
+        inv.RESOURCES, inv.POOLS, RESOURCES_MAPPING, inv.SUBNETS,
+    )),
+    (eps.DASHBOARD_SUBNETS_ENDPOINT, (inv.SUBNETS, inv.RESOURCES)),
+    (eps.PERSONALITIES_AUTH_ENDPOINT, (inv.RESOURCES,)),
+    (eps.PERSONALITIES_ENDPOINT, (
+        inv.RESOURCES, RESOURCES_MAPPING, inv.SUBNETS,
+    )),
+    (eps.PERSONALITIES_HOSTS_ENDPOINT, (
+        inv.HOSTS, inv.HOST_GROUPS, RESOURCES_MAPPING,
+    )),
+    (eps.PERSONALITIES_HOST_GROUPS_ENDPOINT, (
+        inv.HOST_GROUPS, RESOURCES_MAPPING,
+    )),
+)
+
+
+def get_affected_collections(path):  # type: (str) -> Tuple[str, ...]
+    """Returns collections which may be changed by a write to path"""
+    path = path.lstrip('/')
+    rv = COLLECTIONS
+    matched_len = -1
+
+    for prefix, collections in ENDPOINT_COLLECTIONS:
+        if path.startswith(prefix) and len(prefix) > matched_len:
+            rv = collections
+            matched_len = len(prefix)
+
+    return rv
+
+
+class TTLCache:
+    """Thread-safe cache split into collections
+
+    Every collection has its own time to live and maximum number of
+    entries. Entries of a collection are evicted in least recently used
+    order when the limit is reached.
+    """
+
+    def __init__(
+        self,
+        ttls=None,  # type: Dict[str, float]
+        default_ttl=DEFAULT_TTL,  # type: float
+        maxsize=DEFAULT_MAXSIZE,  # type: int
+    ):  # type: (...) -> None
+
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+
+        self._lock = threading.RLock()
+        self._data = {}  # type: Dict[str, OrderedDict]
+
+    def get(self, collection, key=None):
+        # type: (str, Hashable) -> Optional[Any]
+        with self._lock:
+            entries = self._data.get(collection)
+            if not entries or key not in entries:
+                return None
+
+            expires_at, value = entries[key]
+            if expires_at <= time.time():
+                del entries[key]
+                return None
+
+            # Move entry to the end as the most recently used
+            del entries[key]
+            entries[key] = (expires_at, value)
+            return value
+
+    def get_or_load(self, collection, loader, key=None):
+        # type: (str, Callable[[], Any], Hashable) -> Any
+        rv = self.get(collection, key)
+        if rv is None:
+            # Loader is called without lock because it may make requests
+            # which invalidate the cache
+            rv = loader()
+            self.set(collection, rv, key)
+        return rv
+
+    def invalidate(self, *collections):  # type: (*str) -> None
+        """Drops passed collections or the whole cache if none passed"""
+        with self._lock:
+            if not collections:
+                self._data = {}
+                return
+
+            for collection in collections:
+                self._data.pop(collection, None)
+
+    def set(self, collection, value, key=None):
+        # type: (str, Any, Hashable) -> None
+        ttl = self.ttls.get(collection, self.default_ttl)
+
+        with self._lock:
+            entries = self._data.setdefault(collection, OrderedDict())
+            entries.pop(key, None)
+            entries[key] = (time.time() + ttl, value)
+
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
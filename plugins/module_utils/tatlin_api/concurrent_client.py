@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import sys
+import threading
+from ansible.module_utils.six import reraise
+from ansible.module_utils.six.moves import queue
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import raise_errors
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.rest_client import AUTH_SESSION
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.tatlin_client import TatlinClient
+
+try:
+    from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+    from ansible.module_utils.connection import Connection
+    from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import Middleware
+    from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.session_cache import SessionCache
+except ImportError:
+    Any = Callable = Dict = Iterable = List = Optional = Tuple = Connection = None
+    Middleware = SessionCache = None
+
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class ConcurrentTatlinClient(TatlinClient):
+    """TatlinClient which can make independent requests at the same time
+
+    Calls passed to gather are run by worker threads, so the client keeps
+    the same models and methods as TatlinClient. It is not an asyncio
+    client: module utils must stay compatible with Python 2.7, that is
+    why asyncio is not used.
+    The number of requests in flight is bounded by max_concurrency for
+    all gather calls of the client, including nested ones.
+    """
+
+    def __init__(
+        self,
+        base_url,  # type: str
+        username=None,  # type: Optional[str]
+        password=None,  # type: Optional[str]
+        validate_certs=True,  # type: Optional[bool]
+        timeout=60,  # type: Optional[int]
+        auth_method=AUTH_SESSION,  # type: Optional[str]
+        keep_alive=False,  # type: Optional[bool]
+        cache_ttls=None,  # type: Optional[Dict[str, float]]
+        session_cache=None,  # type: Optional[SessionCache]
+        connection=None,  # type: Optional[Connection]
+        stream_json=False,  # type: bool
+        middlewares=None,  # type: Optional[Iterable[Middleware]]
+        coalesce_window=0,  # type: float
+        write_through=False,  # type: bool
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,  # type: int
+    ):  # type: (...) -> None
+
+        super(ConcurrentTatlinClient, self).__init__(
+            base_url=base_url,
+            username=username,
+            password=password,
+            validate_certs=validate_certs,
+            timeout=timeout,
+            auth_method=auth_method,
+            keep_alive=keep_alive,
+            cache_ttls=cache_ttls,
+            session_cache=session_cache,
+            connection=connection,
+            stream_json=stream_json,
+            middlewares=middlewares,
+            coalesce_window=coalesce_window,
+            write_through=write_through,
+        )
+
+        self.max_concurrency = max_concurrency
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+
+    def gather(self, *calls):  # type: (*Callable[[], Any]) -> List[Any]
+        """Runs calls concurrently and returns their results in order.
+
+        If any call raises an exception, the exception of the first such
+        call is raised after all calls are finished
+        """
+        if len(calls) < 2 or self.max_concurrency < 2:
+            return [call() for call in calls]
+
+        results, errors = self._run_concurrently(calls)
+        if errors:
+            reraise(*errors[min(errors)])
+
+        return results
+
+    def gather_all(self, *calls):  # type: (*Callable[[], Any]) -> List[Any]
+        """Runs calls concurrently and returns their results in order.
+
+        Every call is made even if others fail. Single error is raised
+        as is, several errors are raised together as TatlinMultipleErrors
+        """
+        if len(calls) < 2 or self.max_concurrency < 2:
+            return super(ConcurrentTatlinClient, self).gather_all(*calls)
+
+        results, errors = self._run_concurrently(calls)
+        raise_errors([errors[index] for index in sorted(errors)])
+        return results
+
+    def _run_concurrently(self, calls):
+        # type: (Iterable[Callable[[], Any]]) -> Tuple[List[Any], Dict[int, Tuple]]
+        calls = list(calls)
+        results = [None] * len(calls)
+        errors = {}
+        pending = queue.Queue()
+        for index, call in enumerate(calls):
+            pending.put((index, call))
+
+        def worker():
+            while True:
+                try:
+                    index, call = pending.get_nowait()
+                except queue.Empty:
+                    return
+
+                try:
+                    results[index] = call()
+                except Exception:
+                    errors[index] = sys.exc_info()
+
+        workers = [
+            threading.Thread(target=worker)
+            for i in range(min(len(calls), self.max_concurrency))
+        ]
+
+        for thread in workers:
+            thread.daemon = True
+            thread.start()
+
+        for thread in workers:
+            thread.join()
+
+        return results, errors
+
+    def _make_request(self, url, request_body, **request_kwargs):
+        # Semaphore is held only for the HTTP exchange itself, so nested
+        # gather calls and login after 401 can't lock each other
+        with self._semaphore:
+            return super(ConcurrentTatlinClient, self)._make_request(
+                url, request_body, **request_kwargs
+            )
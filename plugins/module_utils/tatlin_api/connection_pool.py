@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from typing import Dict, List, Tuple
+except ImportError:
+    # Satisfy Python 2 which doesn't have typing.
+    Dict = List = Tuple = None
+
+import socket
+import ssl
+import threading
+import time
+from io import BytesIO
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import urlsplit
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.retry import IDEMPOTENT_METHODS
+
+
+class PooledResponse:
+    """Response which was read completely and detached from its connection.
+
+    It mimics the part of the open_url response interface which
+    is used by RestResponse, so both transports are interchangeable
+    """
+
+    def __init__(self, status, reason, headers, body):
+        # type: (int, str, 'http_client.HTTPMessage', bytes) -> None
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = BytesIO(body)
+
+    def getcode(self):  # type: () -> int
+        return self.status
+
+    def read(self, amt=None):  # type: (int) -> bytes
+        return self._body.read() if amt is None else self._body.read(amt)
+
+
+def _connection_error(error, is_sent):  # type: (Exception, bool) -> URLError
+    """Returns URLError which tells whether the request could be
+    processed by server, like RESTClientConnectionError does"""
+    rv = URLError(error)
+    rv.request_sent = is_sent
+    return rv
+
+
+class _RequestNotSent(Exception):
+    """Connection failed before the request was written"""
+
+    def __init__(self, error):  # type: (Exception) -> None
+        super(_RequestNotSent, self).__init__(str(error))
+        self.error = error
+
+
+class ConnectionPool:
+    """Keeps reusable keep-alive connections for every host
+
+    Connections are checked out for one request and returned to the pool
+    after the response body is read. Idle connections older than
+    idle_timeout seconds are closed instead of being reused, because
+    server may have already dropped them.
+
+    Note:
+        Pooled connections are direct. Proxy settings and redirects
+        are not handled, unlike open_url.
+    """
+
+    def __init__(
+        self,
+        validate_certs=True,  # type: bool
+        timeout=60,  # type: int
+        maxsize=4,  # type: int
+        idle_timeout=30,  # type: int
+    ):  # type: (...) -> None
+
+        self.validate_certs = validate_certs
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._idle = {}  # type: Dict[Tuple[str, str], List[Tuple[http_client.HTTPConnection, float]]]
+        self._ssl_context = None
+
+    def close(self):  # type: () -> None
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for conn, last_used in connections:
+                conn.close()
+
+    def request(self, method, url, body=None, headers=None):
+        # type: (str, str, bytes, Dict) -> PooledResponse
+        """Sends request through pooled connection.
+
+        Raises HTTPError for unsuccessful status codes and URLError
+        for connection problems, the same way as open_url does
+        """
+
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        conn, is_reused = self._get_connection(key)
+        try:
+            rv, will_close = self._send(conn, method, path, body, headers)
+        except (_RequestNotSent, http_client.HTTPException, socket.error) as e:
+            conn.close()
+            is_sent = not isinstance(e, _RequestNotSent)
+            error = e.error if not is_sent else e
+
+            # Server could close idle keep-alive connection at any moment,
+            # so one retry with new one is made. Request which was sent
+            # could be processed, so only idempotent ones are repeated
+            if not is_reused or \
+                    (is_sent and method.upper() not in IDEMPOTENT_METHODS):
+                raise _connection_error(error, is_sent)
+
+            if hasattr(body, 'seek'):
+                body.seek(0)
+            conn = self._new_connection(key)
+            try:
+                rv, will_close = self._send(conn, method, path, body, headers)
+            except _RequestNotSent as e:
+                conn.close()
+                raise _connection_error(e.error, is_sent=False)
+            except (http_client.HTTPException, socket.error) as e:
+                conn.close()
+                raise _connection_error(e, is_sent=True)
+
+        if will_close:
+            conn.close()
+        else:
+            self._put_connection(key, conn)
+
+        if rv.status >= 400:
+            raise HTTPError(
+                url, rv.status, rv.reason, rv.headers, BytesIO(rv.read()),
+            )
+
+        return rv
+
+    def _get_connection(self, key):
+        # type: (Tuple[str, str]) -> Tuple[http_client.HTTPConnection, bool]
+        now = time.time()
+        expired = []
+        rv = None
+
+        with self._lock:
+            connections = self._idle.get(key, [])
+            while connections:
+                conn, last_used = connections.pop()
+                if now - last_used > self.idle_timeout:
+                    expired.append(conn)
+                else:
+                    rv = conn
+                    break
+
+        for conn in expired:
+            conn.close()
+
+        if rv is not None:
+            return rv, True
+
+        return self._new_connection(key), False
+
+    def _put_connection(self, key, conn):
+        # type: (Tuple[str, str], http_client.HTTPConnection) -> None
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < self.maxsize:
+                connections.append((conn, time.time()))
+                return
+
+        conn.close()
+
+    def _new_connection(self, key):
+        # type: (Tuple[str, str]) -> http_client.HTTPConnection
+        scheme, netloc = key
+        if scheme == 'https':
+            return http_client.HTTPSConnection(
+                netloc,
+                timeout=self.timeout,
+                context=self._get_ssl_context(),
+            )
+        return http_client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _get_ssl_context(self):  # type: () -> ssl.SSLContext
+        # Workers of ConcurrentTatlinClient open connections concurrently
+        with self._lock:
+            if self._ssl_context is None:
+                context = ssl.create_default_context()
+                if not self.validate_certs:
+                    context.check_hostname = False
+                    context.verify_mode = ssl.CERT_NONE
+                self._ssl_context = context
+            return self._ssl_context
+
+    @staticmethod
+    def _send(conn, method, path, body, headers):
+        # type: (...) -> Tuple[PooledResponse, bool]
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+        except (http_client.HTTPException, socket.error) as e:
+            raise _RequestNotSent(e)
+
+        response = conn.getresponse()
+
+        # Body must be read completely before connection can be reused
+        rv = PooledResponse(
+            status=response.status,
+            reason=response.reason,
+            headers=response.msg,
+            body=response.read(),
+        )
+
+        return rv, response.will_close
@@ -9,6 +9,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+from ansible.module_utils.six import reraise
+
 
 class RESTClientError(Exception):
     pass
@@ -23,7 +25,9 @@ class RESTClientRequestError(Exception):
 
 
 class RESTClientConnectionError(Exception):
-    pass
+    # Request could reach the server before the error, so it could be
+    # processed. Such requests are repeated only if they are idempotent
+    request_sent = True
 
 
 class RESTClientUnauthorized(Exception):
@@ -52,3 +56,26 @@ class TatlinTaskError(Exception):
 
 class WrongResourceNameTemplate(Exception):
     pass
+
+
+class TatlinMultipleErrors(TatlinClientError):
+    """Several independent calls failed, errors are in calls order"""
+
+    def __init__(self, errors):  # type: (list) -> None
+        self.errors = errors
+        super(TatlinMultipleErrors, self).__init__(
+            '{0} calls failed: {1}'.format(
+                len(errors), '; '.join(str(e) for e in errors),
+            )
+        )
+
+
+def raise_errors(errors):  # type: (list) -> None
+    """Raises single error as is or several errors as TatlinMultipleErrors.
+
+    Errors are sys.exc_info() tuples, nothing is raised if there are none
+    """
+    if len(errors) == 1:
+        reraise(*errors[0])
+    elif errors:
+        raise TatlinMultipleErrors([error[1] for error in errors])
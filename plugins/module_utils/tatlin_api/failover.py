@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+from ansible.module_utils.six.moves.urllib.parse import urlsplit, urlunsplit
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
+    RESTClientConnectionError,
+)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import Middleware
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.retry import IDEMPOTENT_METHODS
+
+try:
+    from typing import Dict, Iterable, List
+except ImportError:
+    Dict = Iterable = List = None
+
+
+DEFAULT_COOLDOWN = 30
+
+
+def get_host(address):  # type: (str) -> str
+    """Returns host part of address which may be passed with scheme"""
+    return address.split('://', 1)[-1].rstrip('/')
+
+
+class FailoverMiddleware(Middleware):
+    """Spreads requests between management addresses of one system.
+
+    GET requests are sent to healthy addresses in turn. Other requests
+    are sent to the active address, which is changed only when it
+    stops responding. A request which fails with connection error is
+    sent to the next address, and the failed one is not used for
+    cooldown seconds unless all addresses failed. Non-idempotent
+    requests are sent to the next address only if they failed before
+    they were written, like when the connection was refused.
+
+    Requests to hosts which are not in the list, like ones sent while
+    client host is changed by Port, are passed as is.
+    All controllers of a system share sessions, so the same token
+    is valid for every address.
+    """
+
+    def __init__(self, hosts, cooldown=DEFAULT_COOLDOWN):
+        # type: (Iterable[str], float) -> None
+        self.hosts = []  # type: List[str]
+        for host in hosts:
+            host = get_host(host)
+            if host not in self.hosts:
+                self.hosts.append(host)
+
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._down_until = {}  # type: Dict[str, float]
+        self._active = 0
+        self._next_read = 0
+
+    @property
+    def active_host(self):  # type: () -> str
+        return self.hosts[self._active]
+
+    def handle(self, request, send):
+        parts = urlsplit(request.url)
+        if len(self.hosts) < 2 or parts.netloc not in self.hosts:
+            return send(request)
+
+        error = None
+        for host in self._get_candidates(request.method):
+            request.url = urlunsplit(
+                (parts.scheme, host, parts.path, parts.query, parts.fragment)
+            )
+            try:
+                response = send(request)
+            except RESTClientConnectionError as e:
+                self._mark_down(host)
+                # Request which could be processed by the failed
+                # controller is sent again only if it is idempotent
+                if e.request_sent \
+                        and request.method.upper() not in IDEMPOTENT_METHODS:
+                    raise
+                error = e
+                continue
+
+            self._mark_up(host, is_read=request.method == 'GET')
+            return response
+
+        raise error
+
+    def is_healthy(self, host):  # type: (str) -> bool
+        return self._down_until.get(host, 0) <= time.time()
+
+    def _get_candidates(self, method):  # type: (str) -> List[str]
+        with self._lock:
+            if method == 'GET':
+                start = self._next_read
+                self._next_read = (self._next_read + 1) % len(self.hosts)
+            else:
+                start = self._active
+
+        ordered = self.hosts[start:] + self.hosts[:start]
+
+        # Hosts which failed recently are tried last,
+        # they could be up again before cooldown ends
+        return [h for h in ordered if self.is_healthy(h)] + \
+            [h for h in ordered if not self.is_healthy(h)]
+
+    def _mark_down(self, host):  # type: (str) -> None
+        with self._lock:
+            self._down_until[host] = time.time() + self.cooldown
+
+    def _mark_up(self, host, is_read):  # type: (str, bool) -> None
+        with self._lock:
+            self._down_until.pop(host, None)
+            if not is_read or not self.is_healthy(self.active_host):
+                self._active = self.hosts.index(host)
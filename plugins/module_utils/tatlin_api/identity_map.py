@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import weakref
+
+try:
+    from typing import Any, Callable, Hashable, Optional
+except ImportError:
+    Any = Callable = Hashable = Optional = None
+
+
+class IdentityMap:
+    """Keeps one instance per object of the system
+
+    Objects are keyed by their class and id. When an object is fetched
+    again, the known instance gets new data in place with _set_data,
+    so changes are seen through every reference. Instances are held
+    weakly and are forgotten when nothing else refers to them.
+    """
+
+    def __init__(self):  # type: () -> None
+        self._lock = threading.Lock()
+        self._objects = weakref.WeakValueDictionary()
+
+    def __len__(self):  # type: () -> int
+        return len(self._objects)
+
+    def clear(self):  # type: () -> None
+        with self._lock:
+            self._objects.clear()
+
+    def discard(self, cls, obj_id):  # type: (type, Hashable) -> None
+        with self._lock:
+            self._objects.pop((cls, obj_id), None)
+
+    def get(self, cls, obj_id):  # type: (type, Hashable) -> Optional[Any]
+        return self._objects.get((cls, obj_id))
+
+    def resolve(self, cls, obj_id, data, create):
+        # type: (type, Optional[Hashable], Any, Callable[[], Any]) -> Any
+        """Returns known instance refreshed with data or the one
+        made by create. Objects without id are not tracked"""
+        if obj_id is None:
+            return create()
+
+        key = (cls, obj_id)
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is None:
+                obj = self._objects[key] = create()
+                return obj
+
+        obj._set_data(data)
+        return obj
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+
+try:
+    from typing import Any, Dict, List, Optional
+except ImportError:
+    Any = Dict = List = Optional = None
+
+
+POOLS = 'pools'
+DRIVE_GROUPS = 'drive_groups'
+HOSTS = 'hosts'
+HOST_GROUPS = 'host_groups'
+SUBNETS = 'subnets'
+PORTS = 'ports'
+USERS = 'users'
+USER_GROUPS = 'user_groups'
+RESOURCES = 'resources'
+
+COLLECTIONS = (
+    POOLS,
+    DRIVE_GROUPS,
+    HOSTS,
+    HOST_GROUPS,
+    SUBNETS,
+    PORTS,
+    USERS,
+    USER_GROUPS,
+    RESOURCES,
+)
+
+# Objects of these collections have no id attribute,
+# so another unique attribute is used instead
+ID_ATTRIBUTES = {
+    PORTS: 'name',
+    USERS: 'uid',
+    USER_GROUPS: 'gid',
+}
+
+
+class TatlinInventory:
+    """Snapshot of Tatlin objects indexed by name and id
+
+    Every collection is filled by a single fetch of the corresponding
+    list endpoint and is used for lookups until it is invalidated.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._objects = {}  # type: Dict[str, List[Any]]
+        self._by_name = {}  # type: Dict[str, Dict[str, Any]]
+        self._by_id = {}  # type: Dict[str, Dict[str, Any]]
+
+    def get_by_id(self, collection, obj_id):  # type: (str, str) -> Optional[Any]
+        return self._by_id.get(collection, {}).get(obj_id)
+
+    def get_by_name(self, collection, name):  # type: (str, str) -> Optional[Any]
+        return self._by_name.get(collection, {}).get(name)
+
+    def invalidate(self, *collections):  # type: (*str) -> None
+        """Drops passed collections or the whole snapshot if none passed"""
+        with self._lock:
+            for collection in collections or COLLECTIONS:
+                self._objects.pop(collection, None)
+                self._by_name.pop(collection, None)
+                self._by_id.pop(collection, None)
+
+    def is_loaded(self, collection):  # type: (str) -> bool
+        return collection in self._objects
+
+    def update(self, collection, objects):  # type: (str, List[Any]) -> None
+        if collection not in COLLECTIONS:
+            raise ValueError(
+                'Unknown inventory collection: {0}'.format(collection)
+            )
+
+        id_attr = ID_ATTRIBUTES.get(collection, 'id')
+        by_name = {}
+        by_id = {}
+
+        for obj in objects:
+            # The first object wins if names are duplicated,
+            # the same as it was with linear search
+            by_name.setdefault(obj.name, obj)
+            by_id.setdefault(getattr(obj, id_attr), obj)
+
+        with self._lock:
+            self._objects[collection] = list(objects)
+            self._by_name[collection] = by_name
+            self._by_id[collection] = by_id
+
+    def values(self, collection):  # type: (str) -> List[Any]
+        return list(self._objects.get(collection, []))
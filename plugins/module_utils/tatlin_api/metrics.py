@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import re
+import threading
+import time
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+from ansible.module_utils.common.text.converters import to_bytes
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import Middleware
+
+try:
+    from typing import Any, Dict, List, Tuple
+except ImportError:
+    Any = Dict = List = Tuple = None
+
+
+# Upper bounds of latency histogram buckets in milliseconds
+LATENCY_BUCKETS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_ID_SEGMENT = re.compile(
+    r'^([0-9]+|[0-9a-fA-F]{16,}|'
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$'
+)
+
+# Endpoints which have object names in path, names are replaced
+# with placeholders, None keeps the segment as is
+NAMED_ENDPOINTS = (
+    (eps.USERS_ENDPOINT, ('{name}',)),
+    (eps.GROUPS_ENDPOINT, ('{name}',)),
+    (eps.PORTS_ENDPOINT, (None, '{name}')),
+    (eps.REBOOT_ENDPOINT.split('{', 1)[0].rstrip('/'), ('{node}',)),
+)
+
+
+def endpoint_template(path):  # type: (str) -> str
+    """Returns path with ids and names replaced by placeholders,
+    so requests to different objects are aggregated together"""
+    path = path.split('?', 1)[0].strip('/')
+
+    for prefix, placeholders in NAMED_ENDPOINTS:
+        if path.startswith(prefix + '/'):
+            segments = path[len(prefix) + 1:].split('/')
+            for i, placeholder in enumerate(placeholders):
+                if i < len(segments) and placeholder is not None \
+                        and segments[i] != 'status':
+                    segments[i] = placeholder
+            return '/'.join([prefix] + [
+                '{id}' if _ID_SEGMENT.match(s) else s for s in segments
+            ])
+
+    return '/'.join(
+        '{id}' if _ID_SEGMENT.match(s) else s for s in path.split('/')
+    )
+
+
+class _CountingResponse:
+    """Proxy of transport response which counts bytes of read body"""
+
+    def __init__(self, response, record):  # type: (Any, Dict) -> None
+        self._response = response
+        self._record = record
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def read(self, *args):
+        data = self._response.read(*args)
+        self._record['response_bytes'] += len(data or b'')
+        return data
+
+
+class MetricsMiddleware(Middleware):
+    """Records method, endpoint template, status, latency and payload
+    sizes of every request.
+
+    Records are aggregated by method, endpoint and status in summary.
+    Response bytes are counted while the body is read, so they are
+    complete only after the response is consumed.
+    """
+
+    def __init__(self):  # type: () -> None
+        self._lock = threading.Lock()
+        self._records = []  # type: List[Dict[str, Any]]
+
+    @property
+    def records(self):  # type: () -> List[Dict[str, Any]]
+        with self._lock:
+            return [dict(record) for record in self._records]
+
+    def dump(self, path):  # type: (str) -> None
+        """Appends records to path as JSON lines"""
+        lines = [json.dumps(record) + '\n' for record in self.records]
+        with open(path, 'a') as f:
+            f.writelines(lines)
+
+    def handle(self, request, send):
+        record = {
+            'method': request.method,
+            'endpoint': endpoint_template(request.path),
+            'status': None,
+            'latency': 0.0,
+            'request_bytes': _get_size(request.body),
+            'response_bytes': 0,
+        }
+
+        start = time.time()
+        try:
+            response = send(request)
+        except Exception as e:
+            record['status'] = getattr(e, 'status', None)
+            record['error'] = type(e).__name__
+            self._add(record, start)
+            raise
+
+        record['status'] = response.getcode()
+        self._add(record, start)
+        return _CountingResponse(response, record)
+
+    def summary(self):  # type: () -> List[Dict[str, Any]]
+        """Returns aggregated metrics, the slowest endpoints first"""
+        groups = {}  # type: Dict[Tuple, Dict[str, Any]]
+
+        for record in self.records:
+            key = (record['method'], record['endpoint'], record['status'])
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {
+                    'method': record['method'],
+                    'endpoint': record['endpoint'],
+                    'status': record['status'],
+                    'count': 0,
+                    'errors': 0,
+                    'latency_total': 0.0,
+                    'latency_min': record['latency'],
+                    'latency_max': 0.0,
+                    'latency_histogram': _empty_histogram(),
+                    'request_bytes': 0,
+                    'response_bytes': 0,
+                }
+
+            latency = record['latency']
+            group['count'] += 1
+            group['errors'] += 1 if 'error' in record else 0
+            group['latency_total'] += latency
+            group['latency_min'] = min(group['latency_min'], latency)
+            group['latency_max'] = max(group['latency_max'], latency)
+            group['latency_histogram'][_bucket(latency)] += 1
+            group['request_bytes'] += record['request_bytes']
+            group['response_bytes'] += record['response_bytes']
+
+        rv = sorted(
+            groups.values(), key=lambda g: g['latency_total'], reverse=True,
+        )
+        for group in rv:
+            group['latency_avg'] = group['latency_total'] / group['count']
+        return rv
+
+    def _add(self, record, start):  # type: (Dict[str, Any], float) -> None
+        record['latency'] = time.time() - start
+
+        with self._lock:
+            self._records.append(record)
+
+
+def _get_size(body):  # type: (Any) -> int
+    if body is None:
+        return 0
+    if hasattr(body, 'read'):
+        # Streamed body knows its length without reading
+        return len(body)
+    return len(to_bytes(body))
+
+
+def _bucket(latency):  # type: (float) -> str
+    ms = latency * 1000
+    for bound in LATENCY_BUCKETS:
+        if ms <= bound:
+            return '<={0}ms'.format(bound)
+    return '>{0}ms'.format(LATENCY_BUCKETS[-1])
+
+
+def _empty_histogram():  # type: () -> Dict[str, int]
+    rv = dict(('<={0}ms'.format(bound), 0) for bound in LATENCY_BUCKETS)
+    rv['>{0}ms'.format(LATENCY_BUCKETS[-1])] = 0
+    return rv
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from ansible.module_utils.common.text.converters import to_bytes
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.connection_pool import PooledResponse
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.retry import RetryPolicy
+
+try:
+    from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+    from ansible.module_utils.six.moves.http_client import HTTPResponse
+except ImportError:
+    Any = Callable = Dict = Iterable = List = Optional = Tuple = Union = None
+    HTTPResponse = None
+
+
+class RestRequest:
+    """Request passed through middleware chain of RestClient.
+
+    Middlewares may change any attribute before the request is sent.
+    Options are passed to transport as is, meta is a place
+    for middlewares to share data about the request
+    """
+
+    def __init__(
+        self,
+        method,  # type: str
+        path,  # type: str
+        url,  # type: str
+        body=None,  # type: Optional[Union[str, bytes]]
+        headers=None,  # type: Optional[Dict[str, str]]
+        options=None,  # type: Optional[Dict[str, Any]]
+    ):  # type: (...) -> None
+        self.method = method
+        self.path = path
+        self.url = url
+        self.body = body
+        self.headers = headers if headers is not None else {}
+        self.options = options if options is not None else {}
+        self.meta = {}  # type: Dict[str, Any]
+
+
+class Middleware:
+    """Base class of RestClient middlewares.
+
+    Simple middlewares override before_request and after_response.
+    before_request may return a response to skip sending the request,
+    after_response must return response to be passed further.
+    Middlewares which control sending itself, like retries,
+    override handle.
+    """
+
+    def handle(self, request, send):
+        # type: (RestRequest, Callable[[RestRequest], HTTPResponse]) -> HTTPResponse
+        response = self.before_request(request)
+        if response is None:
+            response = send(request)
+        return self.after_response(request, response)
+
+    def before_request(self, request):
+        # type: (RestRequest) -> Optional[HTTPResponse]
+        return None
+
+    def after_response(self, request, response):
+        # type: (RestRequest, HTTPResponse) -> HTTPResponse
+        return response
+
+
+def build_chain(middlewares, send):
+    # type: (Iterable[Middleware], Callable[[RestRequest], HTTPResponse]) -> Callable[[RestRequest], HTTPResponse]
+    """Returns handler which passes request through middlewares in order
+    and then to send"""
+    handler = send
+    for middleware in reversed(list(middlewares)):
+        handler = _bind(middleware, handler)
+    return handler
+
+
+def _bind(middleware, send):
+    def handler(request):
+        return middleware.handle(request, send)
+    return handler
+
+
+class TimingMiddleware(Middleware):
+    """Measures duration of every request, including failed ones.
+
+    Records are (method, path, seconds) tuples
+    """
+
+    def __init__(self):  # type: () -> None
+        self.records = []  # type: List[Tuple[str, str, float]]
+        self._lock = threading.Lock()
+
+    def handle(self, request, send):
+        start = time.time()
+        try:
+            return send(request)
+        finally:
+            elapsed = time.time() - start
+            request.meta['elapsed'] = elapsed
+            with self._lock:
+                self.records.append((request.method, request.path, elapsed))
+
+    @property
+    def total(self):  # type: () -> float
+        with self._lock:
+            return sum(record[2] for record in self.records)
+
+
+class RetryMiddleware(Middleware):
+    """Repeats failed requests according to retry policy"""
+
+    def __init__(self, policy=None):  # type: (Optional[RetryPolicy]) -> None
+        self.policy = policy or RetryPolicy()
+
+    def handle(self, request, send):
+        return self.policy.call(lambda: send(request), method=request.method)
+
+
+class ResponseCacheMiddleware(Middleware):
+    """Serves repeated GET requests from memory for ttl seconds.
+
+    Any other request drops the whole cache, because it may change
+    data returned by cached endpoints
+    """
+
+    def __init__(self, ttl=5, maxsize=64):  # type: (float, int) -> None
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # type: OrderedDict
+
+    def clear(self):  # type: () -> None
+        with self._lock:
+            self._entries.clear()
+
+    def handle(self, request, send):
+        if request.method != 'GET':
+            self.clear()
+            return send(request)
+
+        key = request.url
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[key]
+                entry = None
+
+        if entry is not None:
+            request.meta['cached'] = True
+            return _replay(entry[1])
+
+        stored = _store(send(request))
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + self.ttl, stored)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return _replay(stored)
+
+
+class _Flight:
+
+    def __init__(self):  # type: () -> None
+        self.done = threading.Event()
+        self.finished_at = None  # type: Optional[float]
+        self.stored = None  # type: Optional[Tuple]
+        self.error = None  # type: Optional[Exception]
+
+
+class SingleFlightMiddleware(Middleware):
+    """Shares one response between identical GET requests.
+
+    Requests which are made while the same request is in flight wait
+    for its response instead of sending their own. Response is also
+    shared with requests made within window seconds after it was
+    received. Any other request drops all shared responses, because
+    the same data is served by several services. Failed requests
+    are not shared after they finish.
+    Streamed requests and paths starting with excluded prefixes
+    are always sent.
+    """
+
+    def __init__(self, window=0, exclude=()):
+        # type: (float, Iterable[str]) -> None
+        self.window = window
+        self.exclude = tuple(prefix.strip('/') for prefix in exclude)
+        self._lock = threading.Lock()
+        self._flights = {}  # type: Dict[Tuple, _Flight]
+
+    def clear(self):  # type: () -> None
+        with self._lock:
+            self._flights = {}
+
+    def handle(self, request, send):
+        if request.method != 'GET':
+            self.clear()
+            return send(request)
+
+        if request.meta.get('stream') \
+                or request.path.strip('/').startswith(self.exclude):
+            return send(request)
+
+        key = (request.url, tuple(sorted(request.headers.items())))
+        now = time.time()
+
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and flight.finished_at is not None \
+                    and now - flight.finished_at >= self.window:
+                flight = None
+
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            request.meta['coalesced'] = True
+            return _replay(flight.stored)
+
+        try:
+            flight.stored = _store(send(request))
+        except Exception as e:
+            flight.error = e
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            raise
+        finally:
+            flight.finished_at = time.time()
+            flight.done.set()
+
+        return _replay(flight.stored)
+
+
+def _store(response):  # type: (HTTPResponse) -> Tuple
+    return (
+        response.getcode(), getattr(response, 'reason', ''),
+        response.headers, to_bytes(response.read()),
+    )
+
+
+def _replay(stored):  # type: (Tuple) -> PooledResponse
+    status, reason, headers, body = stored
+    return PooledResponse(
+        status=status, reason=reason, headers=headers, body=body,
+    )
+
+
+class LoggingMiddleware(Middleware):
+    """Logs method, path, status and duration of every request.
+
+    Headers and bodies are never logged, they contain
+    session tokens and passwords
+    """
+
+    def __init__(self, log=None):  # type: (Optional[Callable[[str], Any]]) -> None
+        self._log = log or logging.getLogger(__name__).debug
+
+    def handle(self, request, send):
+        start = time.time()
+        try:
+            response = send(request)
+        except Exception as e:
+            self._log('{0} {1} failed after {2:.3f}s: {3}: {4}'.format(
+                request.method, request.path, time.time() - start,
+                type(e).__name__, e,
+            ))
+            raise
+
+        self._log('{0} {1} {2} {3:.3f}s'.format(
+            request.method, request.path, response.getcode(),
+            time.time() - start,
+        ))
+        return response
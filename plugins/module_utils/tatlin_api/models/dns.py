@@ -10,11 +10,12 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import DNS_CONFIG_ENDPOINT
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import apply_changes
 
 try:
-    from typing import Union, List
+    from typing import Dict, Union, List
 except ImportError:
-    Union = List = None
+    Dict = Union = List = None
 
 
 class DnsConfig:
@@ -35,10 +36,7 @@ class DnsConfig:
         self.update(search_list=self.search_list + [suffix])
 
     def load(self):  # type: () -> None
-        dns_data = self._client.get(self._endpoint).json
-
-        self.servers = dns_data['dns_static_servers']
-        self.search_list = dns_data['dns_static_search_list']
+        self._set_data(self._client.get(self._endpoint).json)
 
     def remove_server(self, server):  # type: (str) -> None
         self.update(servers=[s for s in self.servers if s != server])
@@ -63,12 +61,13 @@ class DnsConfig:
         body_search_list = [body_search_list] \
             if isinstance(body_search_list, str) else body_search_list
 
-        self._client.put(
-            path=self._endpoint,
-            body={
-                'dns_static_servers': body_servers,
-                'dns_static_search_list': body_search_list,
-            }
-        )
+        body = {
+            'dns_static_servers': body_servers,
+            'dns_static_search_list': body_search_list,
+        }
+        response = self._client.put(path=self._endpoint, body=body)
+        apply_changes(self, response, changes=body)
 
-        self.load()
+    def _set_data(self, dns_data):  # type: (Dict) -> None
+        self.servers = dns_data['dns_static_servers']
+        self.search_list = dns_data['dns_static_search_list']
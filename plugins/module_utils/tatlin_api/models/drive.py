@@ -22,6 +22,10 @@ class DRIVE_STATUS:
 
 
 class Drive:
+    __slots__ = (
+        '_client', '_state', '_topology_path', '_bay', 'drive_group',
+        'id', 'model', 'serial_number', 'size', 'slot', 'pool',
+    )
 
     def __init__(self, client, drive_group, pool, **drive_data):
         self._client = client
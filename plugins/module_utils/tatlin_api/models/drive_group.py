@@ -29,12 +29,19 @@ class DRIVE_GROUP_STATUS:
 
 class DriveGroup:
 
-    def __init__(self, client, **drive_group_data):
+    def __init__(self, client, pools_data=None, **drive_group_data):
+        """
+        Args:
+            pools_data: Response of pools endpoint. If passed, it is used
+                to bind drives to pools instead of fetching pools again
+        """
+
         self._client = client
         self._data = drive_group_data
 
         self.drives = []
-        self.load_drives()
+        self.pools = []
+        self.load_drives(pools_data=pools_data)
 
     @property
     def capacity_available(self):  # type: () -> int
@@ -181,10 +188,12 @@ class DriveGroup:
     def get_pool(self, name):  # type: (str) -> Optional[Pool]
         return next((p for p in self.get_pools() if p.name == name), None)
 
-    def get_pools(self):  # type: () -> List[Pool]
+    def get_pools(self, pools_data=None):  # type: (List[Dict]) -> List[Pool]
         rv = []
 
-        pools_data = self._client.get(eps.HEALTH_POOLS_ENDPOINT).json
+        if pools_data is None:
+            pools_data = self._client.get(eps.HEALTH_POOLS_ENDPOINT).json
+
         for pool_data in pools_data:
             pool_drive_group = pool_data['media']['model']
             if self.id == pool_drive_group:
@@ -249,20 +258,21 @@ class DriveGroup:
 
         self.load_drives()
 
-    def load_drives(self):
+    def load_drives(self, pools_data=None):  # type: (List[Dict]) -> None
         self.drives = []
-        pools = self.get_pools()
+        self.pools = pools = self.get_pools(pools_data=pools_data)
 
-        for drive_data in self._data.get('disks', []):
-            drive_pool = next((
-                pool for pool in pools
-                if drive_data['id'] in pool.get_drive_ids()
-            ), None)
+        # The first pool wins if drive is listed in several pools
+        pool_by_drive_id = {}  # type: Dict[str, Pool]
+        for pool in pools:
+            for drive_id in pool.get_drive_ids():
+                pool_by_drive_id.setdefault(drive_id, pool)
 
+        for drive_data in self._data.get('disks', []):
             self.drives.append(Drive(
                 client=self._client,
                 drive_group=self,
-                pool=drive_pool,
+                pool=pool_by_drive_id.get(drive_data['id']),
                 **drive_data
             ))
 
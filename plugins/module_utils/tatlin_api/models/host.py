@@ -10,15 +10,19 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
-from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import get_iscsi_auth_for_request
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import (
+    apply_changes, get_iscsi_auth_for_request,
+)
 
 try:
-    from typing import List, Union
+    from typing import Dict, List, Union
 except ImportError:
-    List = Union = None
+    Dict = List = Union = None
 
 
 class Host:
+    __slots__ = ('_client', '_data', '__weakref__')
 
     def __init__(self, client, **host_data):
         self._client = client
@@ -65,11 +69,15 @@ class Host:
         return self._data.get('auth', {}).get('internal_name')
 
     def get_resources(self):  # type: () -> List
-        rv = []
-        for resource in self._client.get_resources():
-            if self in resource.hosts:
-                rv.append(resource)
-        return rv
+        mapping = self._client.get_cached_resource_mapping()
+        resource_ids = mapping.get_host_resource_ids(self.id)
+        if not resource_ids:
+            return []
+
+        return [
+            resource for resource in self._client.get_cached(inv.RESOURCES)
+            if resource.id in resource_ids
+        ]
 
     def load(self):  # type: () -> None
         self._data = self._client.get(
@@ -79,6 +87,9 @@ class Host:
             )
         ).json
 
+    def _set_data(self, data):  # type: (Dict) -> None
+        self._data = data
+
     def update(
         self,
         auth=None,  # type: str
@@ -106,19 +117,25 @@ class Host:
         ports = [ports] if isinstance(ports, str) else ports
         tags = [tags] if isinstance(tags, str) else tags
 
-        self._client.post(
+        initiators = ports if ports is not None else self.ports
+        tags = tags if tags is not None else self.tags
+
+        response = self._client.post(
             path=eps.PERSONALITIES_HOSTS_ENDPOINT,
             body={
                 'id': self.id,
                 'name': self.name,
                 'port_type': self._data.get('port_type'),
-                'initiators': ports if ports is not None else self.ports,
-                'tags': tags if tags is not None else self.tags,
+                'initiators': initiators,
+                'tags': tags,
                 'auth': auth_body,
             }
         )
 
-        self.load()
+        # Auth is stored in another format than it is sent
+        apply_changes(self, response, changes=dict(
+            initiators=initiators, tags=tags,
+        ) if auth_body is None else None)
 
     def __eq__(self, other):
         if isinstance(other, Host):
@@ -10,15 +10,18 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.host import Host
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import apply_changes
 
 try:
-    from typing import List, Union
+    from typing import Dict, List, Union
 except ImportError:
-    List = Union = None
+    Dict = List = Union = None
 
 
 class HostGroup:
+    __slots__ = ('_client', '_data', '__weakref__')
 
     def __init__(self, client, **host_group_data):
         self._client = client
@@ -50,11 +53,15 @@ class HostGroup:
         return self._data.get('tags') or []
 
     def get_resources(self):  # type: () -> List
-        rv = []
-        for resource in self._client.get_resources():
-            if self in resource.host_groups:
-                rv.append(resource)
-        return rv
+        mapping = self._client.get_cached_resource_mapping()
+        resource_ids = mapping.get_host_group_resource_ids(self.id)
+        if not resource_ids:
+            return []
+
+        return [
+            resource for resource in self._client.get_cached(inv.RESOURCES)
+            if resource.id in resource_ids
+        ]
 
     def load(self):  # type: () -> None
         self._data = self._client.get(
@@ -64,27 +71,32 @@ class HostGroup:
             )
         ).json
 
+    def _set_data(self, data):  # type: (Dict) -> None
+        self._data = data
+
     def set_hosts(self, hosts):  # type: (Union[List[Host], Host]) -> None
         if isinstance(hosts, Host):
             hosts = [hosts]
 
-        self._client.post(
+        host_ids = [host.id for host in hosts]
+
+        response = self._client.post(
             path=eps.PERSONALITIES_HOST_GROUPS_ENDPOINT,
             body={
                 'id': self.id,
                 'name': self.name,
-                'host_ids': [host.id for host in hosts],
+                'host_ids': host_ids,
                 'tags': self._data['tags'],
             }
         )
 
-        self.load()
+        apply_changes(self, response, changes={'host_ids': host_ids})
 
     def set_tags(self, tags):  # type: (Union[List[str], str]) -> None
         if isinstance(tags, str):
             tags = [tags]
 
-        self._client.post(
+        response = self._client.post(
             path=eps.PERSONALITIES_HOST_GROUPS_ENDPOINT,
             body={
                 'id': self.id,
@@ -94,7 +106,7 @@ class HostGroup:
             }
         )
 
-        self.load()
+        apply_changes(self, response, changes={'tags': tags})
 
     def __eq__(self, other):
         if isinstance(other, HostGroup):
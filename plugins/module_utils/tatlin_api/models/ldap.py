@@ -17,6 +17,7 @@ except ImportError:
 
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinClientError
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import LDAP_CONFIG_ENDOPINT
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import apply_changes
 
 
 ENCRYPTION_TLS = 'tls'
@@ -40,10 +41,11 @@ class LdapConfig:
         self._ldap_config_endpoint = LDAP_CONFIG_ENDOPINT
 
     def load(self):  # type: () -> None
-        data = self._client.get(
+        self._set_data(self._client.get(
             self._ldap_config_endpoint,
-        ).json
+        ).json)
 
+    def _set_data(self, data):  # type: (Dict) -> None
         self.host = data['host']
         self.port = data['port']
         self.lookup_user = data['lookUpUserName']
@@ -132,9 +134,8 @@ class LdapConfig:
                 rootCa=params.get('cert'),
             )
 
-        self._client.put(
+        response = self._client.put(
             self._ldap_config_endpoint,
             body=request_body,
         )
-
-        self.load()
+        apply_changes(self, response, changes=request_body)
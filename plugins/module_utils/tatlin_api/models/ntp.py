@@ -10,12 +10,13 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import NTP_SERVERS_ENDPOINT
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import apply_changes
 
 try:
-    from typing import List
+    from typing import Dict, List
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    List = None
+    Dict = List = None
 
 
 class NtpConfig:
@@ -31,8 +32,7 @@ class NtpConfig:
         self.set_servers(self.servers + [server])
 
     def load(self):  # type: () -> None
-        data = self._client.get(self._servers_endpoint).json
-        self.servers = data['ntp_server_list']
+        self._set_data(self._client.get(self._servers_endpoint).json)
 
     def remove_server(self, server):  # type: (str) -> None
         self.set_servers([s for s in self.servers if s != server])
@@ -41,8 +41,9 @@ class NtpConfig:
         self.set_servers([])
 
     def set_servers(self, servers):  # type: (List) -> None
-        self._client.put(
-            self._servers_endpoint,
-            body={'ntp_server_list': servers},
-        )
-        self.load()
+        body = {'ntp_server_list': servers}
+        response = self._client.put(self._servers_endpoint, body=body)
+        apply_changes(self, response, changes=body)
+
+    def _set_data(self, data):  # type: (Dict) -> None
+        self.servers = data['ntp_server_list']
@@ -11,20 +11,21 @@ __metaclass__ = type
 
 from uuid import uuid4
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.resource import (
-    ResourceBase,
     ResourceBlock,
     ResourceFile,
     RESOURCE_TYPE,
+    group_resources_by_pool,
 )
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.task import Task
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinClientError
-from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import to_bytes
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import apply_changes, to_bytes
 
 try:
-    from typing import List, Union, Dict, Tuple, Optional, TYPE_CHECKING
+    from typing import List, Union, Dict, Tuple, Optional, FrozenSet, TYPE_CHECKING
 except ImportError:
-    List = Union = Dict = Tuple = Optional = TYPE_CHECKING = None
+    List = Union = Dict = Tuple = Optional = FrozenSet = TYPE_CHECKING = None
 
 if TYPE_CHECKING:
     from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.port import Port
@@ -45,6 +46,7 @@ class Pool:
         self._client = client
         self._data = pool_data
         self._ep = '{0}/{1}'.format(eps.HEALTH_POOLS_ENDPOINT, self.id)
+        self._drive_id_set = None  # type: Optional[FrozenSet[str]]
 
         self.drive_group = drive_group
 
@@ -78,13 +80,11 @@ class Pool:
 
     @property
     def drives(self):  # type: () -> List['Drive']
-        rv = []
-
-        drive_id_list = self._data.get('disks_list', [])
-        for drive in self.drive_group.drives:
-            if drive.id in drive_id_list:
-                rv.append(drive)
-        return rv
+        drive_ids = self.get_drive_id_set()
+        return [
+            drive for drive in self.drive_group.drives
+            if drive.id in drive_ids
+        ]
 
     @property
     def id(self):  # type: () -> str
@@ -194,7 +194,11 @@ class Pool:
             }
         ).json
 
-        return Task(client=self._client, **task_data)
+        return Task(
+            client=self._client,
+            path=eps.DASHBOARD_RESOURCES_ENDPOINT,
+            **task_data
+        )
 
     def create_resource_file(
         self,
@@ -306,11 +310,22 @@ class Pool:
             }
         ).json
 
-        return Task(client=self._client, **task_data)
+        return Task(
+            client=self._client,
+            path=eps.DASHBOARD_RESOURCES_ENDPOINT,
+            **task_data
+        )
 
-    def get_drive_ids(self):
+    def get_drive_ids(self):  # type: () -> List[str]
         return self._data.get('disks_list', [])
 
+    def get_drive_id_set(self):  # type: () -> FrozenSet[str]
+        """Returns drive ids for membership checks, set is built
+        once per loaded pool data"""
+        if self._drive_id_set is None:
+            self._drive_id_set = frozenset(self.get_drive_ids())
+        return self._drive_id_set
+
     def get_resource(self, name):
         # type: (str) -> Optional[Union[ResourceBlock, ResourceFile]]
         for resource in self.get_resources():
@@ -318,37 +333,53 @@ class Pool:
                 return resource
         return None
 
-    def get_resources(self):
-        # type: () -> List[Union[ResourceBlock, ResourceFile]]
-        rv = []
-
-        ResourceBase.clear_cache()
+    def get_resources(self, resources_data=None):
+        # type: (List[Dict]) -> List[Union[ResourceBlock, ResourceFile]]
+        """
+        Args:
+            resources_data: Personalities response or its part. It is used
+                instead of cached personalities response if passed
+        """
 
-        resources_data = self._client.get(
-            eps.HEALTH_PERSONALITIES_ENDPOINT
-        ).json
+        if resources_data is None:
+            resources_data = self._get_cached_resources_data()
 
+        rv = []
         for resource_data in resources_data:
             if resource_data['poolId'] == self.id:
                 resource_type = resource_data.get('type')
                 if resource_type == RESOURCE_TYPE.BLOCK:
-                    rv.append(ResourceBlock(
-                        client=self._client,
-                        pool=self,
-                        **resource_data
-                    ))
+                    resource_cls = ResourceBlock
                 elif resource_type in (RESOURCE_TYPE.NFS, RESOURCE_TYPE.CIFS):
-                    rv.append(ResourceFile(
-                        client=self._client,
-                        pool=self,
-                        **resource_data
-                    ))
+                    resource_cls = ResourceFile
                 else:
                     raise TatlinClientError(
                         'Unknown resource type: {0}'.format(resource_type)
                     )
+
+                resource = self._client.identity_map.resolve(
+                    resource_cls, resource_data.get('id'), resource_data,
+                    lambda: resource_cls(
+                        client=self._client, pool=self, **resource_data
+                    ),
+                )
+                # Pools are built again on every fetch
+                resource.pool = self
+                rv.append(resource)
         return rv
 
+    def _get_cached_resources_data(self):  # type: () -> List[Dict]
+        """Returns this pool part of personalities response. Response is
+        fetched once and split between pools with the resources cache"""
+        buckets = self._client.cache.get_or_load(
+            inv.RESOURCES,
+            lambda: group_resources_by_pool(self._client.get_json_items(
+                eps.HEALTH_PERSONALITIES_ENDPOINT,
+            )),
+            key='data_by_pool',
+        )
+        return buckets.get(self.id, [])
+
     def is_deleting(self):  # type: () -> bool
         return self.status.lower() == 'deleting'
 
@@ -359,7 +390,7 @@ class Pool:
         return self._data['resizing']
 
     def load(self):  # type: () -> None
-        self._data = self._client.get(self._ep).json
+        self._set_data(self._client.get(self._ep).json)
 
     def remove(self):  # type: () -> None
         if len(self.get_resources()) > 0:
@@ -377,8 +408,10 @@ class Pool:
                     len(self.drives), drives_count)
             )
 
-        self._client.put(self._ep + '/resize', body={'disks': drives_count})
-        self.load()
+        response = self._client.put(
+            self._ep + '/resize', body={'disks': drives_count},
+        )
+        apply_changes(self, response)
 
     def set_size(self, size):  # type: (Union[str, int]) -> None
         if isinstance(size, str):
@@ -391,12 +424,17 @@ class Pool:
                     self.capacity_total, size)
             )
 
-        self._client.put(self._ep + '/resize', body={'bytes': str(size)})
-        self.load()
+        response = self._client.put(
+            self._ep + '/resize', body={'bytes': str(size)},
+        )
+        apply_changes(self, response)
 
     def set_spare_count(self, spare_count):  # type: (int) -> None
-        self._client.put(self._ep, body={'spare': str(spare_count)})
-        self.load()
+        response = self._client.put(
+            self._ep, body={'spare': str(spare_count)},
+        )
+        # Spare drives change capacity, which is computed by Tatlin
+        apply_changes(self, response)
 
     def set_thresholds(
         self,
@@ -421,8 +459,12 @@ class Pool:
         if critical_threshold is not None:
             req_body['critical_alert_threshold'] = critical_threshold
 
-        self._client.put(self._ep + '/alerts', body=req_body)
-        self.load()
+        response = self._client.put(self._ep + '/alerts', body=req_body)
+        apply_changes(self, response, changes=req_body)
+
+    def _set_data(self, data):  # type: (Dict) -> None
+        self._data = data
+        self._drive_id_set = None
 
     def _file_resource_legacy(self):  # type: () -> bool
         """Tatlin 2.6 does not support bulk file resources creation"""
@@ -463,7 +505,11 @@ class Pool:
             }
         ).json
 
-        return Task(client=self._client, **task_data)
+        return Task(
+            client=self._client,
+            path=eps.DASHBOARD_RESOURCES_ENDPOINT,
+            **task_data
+        )
 
     def __eq__(self, other):
         if isinstance(other, Pool):
@@ -10,13 +10,13 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import sys
-import time
 
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import (
     build_url, PORTS_ENDPOINT)
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
     TatlinClientError, RESTClientConnectionError, RESTClientUnauthorized, RESTClientNotFoundError,
 )
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.retry import RetryPolicy
 
 try:
     from typing import Union, List, Dict, Tuple, Optional
@@ -27,6 +27,24 @@ if sys.version_info[0] >= 3:
     unicode = str
 
 
+# Up to about 25 seconds of waiting for interface after its ip is changed
+INTERFACE_UP_POLICY = RetryPolicy(
+    max_attempts=16,
+    backoff_factor=0.1,
+    max_backoff=2,
+    jitter=False,
+    retry_exceptions=(RESTClientConnectionError, RESTClientNotFoundError),
+)
+
+# Repeats requests sent right after interfaces are reconfigured
+RECONFIGURATION_POLICY = RetryPolicy(
+    max_attempts=5,
+    backoff_factor=0.5,
+    max_backoff=2,
+    jitter=False,
+)
+
+
 def get_ip_and_mask(address):  # type: (str) -> Tuple[str, str]
     try:
         ip, mask = address.split('/')
@@ -63,22 +81,10 @@ class Port:
         self._client = client
         self.name = port_data['id']
         self.type = port_data['meta']['type']
-        self.gateway = port_data['params']['gateway']
-        self.mtu = port_data['params']['mtu']
         self.mac = port_data['params'].get('mac')
         self.wwpn = port_data['params'].get('wwpn')
-        self.virtual_address = self._retrieve_virtual_address(
-            port_data['params']['failover']
-        )
-
         self.nodes = {}
-        self._init_nodes(
-            nodes_data=port_data['params']['nodes']
-        )
-
-        self._data_role = port_data['meta'].get('data_role', False)
-        self._replication_role = port_data['meta'].get(
-            'replication_role', False)
+        self._set_data(port_data)
 
         self._changed_host = ChangedHost(self._client)
         self._ep = build_url(PORTS_ENDPOINT, self.type, self.name)
@@ -90,18 +96,7 @@ class Port:
         return self.name == 'mgmt'
 
     def load(self):  # type: () -> None
-        port_data = self._client.get(self._ep_status).json
-
-        self.gateway = port_data['params']['gateway']
-        self.mtu = port_data['params']['mtu']
-        self.virtual_address = self._retrieve_virtual_address(
-            port_data['params']['failover']
-        )
-        self._init_nodes(port_data['params']['nodes'])
-
-        self._data_role = port_data['meta'].get('data_role', False)
-        self._replication_role = port_data['meta'].get(
-            'replication_role', False)
+        self._set_data(self._client.get(self._ep_status).json)
 
     def update(self, virtual_address=None, gateway=None, mtu=None, nodes=None):
         # type: (str, str, int, Dict[str, Union[str, List[str]]]) -> None
@@ -181,11 +176,18 @@ class Port:
                 nodes=nodes,
             )
 
+            # Tatlin can still reset connections for a while after new
+            # interfaces are up, so requests which follow the change
+            # are repeated on connection errors
             if ip_for_reconnect is not None:
                 # Reconnecting to new ip address if it was changed
-                self._client.reconnect(host=ip_for_reconnect)
+                RECONFIGURATION_POLICY.call(
+                    lambda: self._client.reconnect(host=ip_for_reconnect),
+                )
 
-        self.load()
+            RECONFIGURATION_POLICY.call(self.load)
+        else:
+            self.load()
 
     def _get_ip_for_reconnect(self, new_virtual_address=None, nodes=None):
         # type: (str, Dict[str, Union[str, List[str]]]) -> Optional[str]
@@ -213,6 +215,18 @@ class Port:
                 if host in old_ips and host not in new_ips:
                     return new_ips[0]
 
+    def _set_data(self, port_data):  # type: (Dict) -> None
+        self.gateway = port_data['params']['gateway']
+        self.mtu = port_data['params']['mtu']
+        self.virtual_address = self._retrieve_virtual_address(
+            port_data['params']['failover']
+        )
+        self._init_nodes(port_data['params']['nodes'])
+
+        self._data_role = port_data['meta'].get('data_role', False)
+        self._replication_role = port_data['meta'].get(
+            'replication_role', False)
+
     def _init_nodes(self, nodes_data):
         # type: (Dict) -> None
         new_nodes = {}
@@ -296,35 +310,25 @@ class Port:
 
         # Tatlin can reconfigure interfaces with undefined delay after
         # changing ips, and when this happens, it can reset current
-        # connection. Because of requests are sent thick and fast, one
-        # of them can be sent at the reconfiguration moment and will fail.
-        # Sleeping for 5 seconds behaves well at testing, in spite of it's
-        # a kind of crutch. If you find better solution, you're welcome to
-        # suggest it.
-        # Problem was detected with connection to virtual ip and changing it,
-        # but it doesn't mean that it can't happen with other addresses
-        time.sleep(5)
-
-        attempts = 15
+        # connection. Instead of a fixed settle sleep, status of every
+        # new interface is polled with growing intervals until the
+        # interface answers on its new ip, so the wait takes as long as
+        # reconfiguration does. Resets are repeated by the policy
+        def check_status():
+            try:
+                self._client.get(self._ep_status)
+            except RESTClientUnauthorized:
+                # Interface answers, session just isn't valid for it
+                pass
+
         for ip in new_ips:
-            is_up = False
             with self._changed_host(ip):
-                for attempt in range(attempts):
-                    try:
-                        self._client.get(self._ep_status)
-                        is_up = True
-                    except RESTClientUnauthorized:
-                        is_up = True
-                    except (RESTClientConnectionError, RESTClientNotFoundError):
-                        time.sleep(1)
-
-                    if is_up:
-                        break
-
-            if not is_up:
-                raise TatlinClientError(
-                    'Interface {0} was not up'.format(ip)
-                )
+                try:
+                    INTERFACE_UP_POLICY.call(check_status)
+                except INTERFACE_UP_POLICY.retry_exceptions:
+                    raise TatlinClientError(
+                        'Interface {0} was not up'.format(ip)
+                    )
 
     def __repr__(self):
         return 'Port ' + self.name
@@ -339,6 +343,7 @@ class Port:
 
 
 class Node:
+    __slots__ = ('_client', 'port', 'name', 'addresses')
 
     def __init__(self, client, port, name, addresses):
         # type: ('TatlinClient', Port, str, List[NodeAddress]) -> None
@@ -364,6 +369,8 @@ class Node:
 
 
 class BaseAddress:
+    __slots__ = ('ip', 'mask')
+
     def __init__(self, ip, mask):  # type: (str, str) -> None
         self.ip = ip
         self.mask = mask
@@ -373,6 +380,7 @@ class BaseAddress:
 
 
 class NodeAddress(BaseAddress):
+    __slots__ = ('address_id', 'status')
 
     def __init__(self, ip, mask, address_id, status):
         # type: (str, str, str, str) -> None
@@ -390,6 +398,7 @@ class NodeAddress(BaseAddress):
 
 
 class VirtualAddress(BaseAddress):
+    __slots__ = ()
 
     def __eq__(self, other):
         if isinstance(other, VirtualAddress):
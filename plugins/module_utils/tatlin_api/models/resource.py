@@ -9,15 +9,18 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+from functools import partial
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.cache import RESOURCES_MAPPING
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinClientError
-from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import to_bytes
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import apply_changes, to_bytes
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.task import Task
 
 try:
-    from typing import List, Dict, Tuple, Union, TYPE_CHECKING
+    from typing import Any, Iterable, List, Dict, Set, Tuple, Union, TYPE_CHECKING
 except ImportError:
-    List = Dict = Tuple = Union = TYPE_CHECKING = None
+    Any = Iterable = List = Dict = Set = Tuple = Union = TYPE_CHECKING = None
 
 if TYPE_CHECKING:
     from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.port import Port
@@ -34,13 +37,57 @@ class RESOURCE_TYPE:
     CIFS = 'cifs'
 
 
-class ResourceBase:
+def group_resources_by_pool(resources_data):
+    # type: (Iterable[Dict]) -> Dict[str, List[Dict]]
+    """Splits personalities response into buckets by pool id"""
+    rv = {}
+    for resource_data in resources_data:
+        rv.setdefault(resource_data['poolId'], []).append(resource_data)
+    return rv
+
+
+class ResourceMapping:
+    """Resource mapping response indexed in both directions"""
+
+    def __init__(self, mapping_data):  # type: (Iterable[Dict]) -> None
+        self._resource_hosts = {}  # type: Dict[str, Set[str]]
+        self._resource_host_groups = {}  # type: Dict[str, Set[str]]
+        self._host_resources = {}  # type: Dict[str, Set[str]]
+        self._host_group_resources = {}  # type: Dict[str, Set[str]]
+
+        for item in mapping_data:
+            resource_id = item.get('resource_id')
+            host_id = item.get('host_id')
+            host_group_id = item.get('host_group_id')
+
+            if host_id is not None:
+                self._resource_hosts.setdefault(
+                    resource_id, set()).add(host_id)
+                self._host_resources.setdefault(
+                    host_id, set()).add(resource_id)
+
+            if host_group_id is not None:
+                self._resource_host_groups.setdefault(
+                    resource_id, set()).add(host_group_id)
+                self._host_group_resources.setdefault(
+                    host_group_id, set()).add(resource_id)
 
-    _cache = {}
+    def get_host_ids(self, resource_id):  # type: (str) -> Set[str]
+        return self._resource_hosts.get(resource_id, set())
 
-    @classmethod
-    def clear_cache(cls):
-        cls._cache = {}
+    def get_host_group_ids(self, resource_id):  # type: (str) -> Set[str]
+        return self._resource_host_groups.get(resource_id, set())
+
+    def get_host_resource_ids(self, host_id):  # type: (str) -> Set[str]
+        return self._host_resources.get(host_id, set())
+
+    def get_host_group_resource_ids(self, host_group_id):
+        # type: (str) -> Set[str]
+        return self._host_group_resources.get(host_group_id, set())
+
+
+class ResourceBase:
+    __slots__ = ('_client', '_data', 'pool', '__weakref__')
 
     def __init__(self, client, pool, **data):
         self._client = client
@@ -101,9 +148,7 @@ class ResourceBase:
             item['port'] for item in self._data.get('ports', [])
         ]
 
-        ports = self._cache.get('ports')
-        if ports is None:
-            ports = self._cache['ports'] = self._client.get_ports()
+        ports = self._client.get_cached(inv.PORTS)
 
         for port in ports:
             if port.name in self_port_names:
@@ -113,19 +158,44 @@ class ResourceBase:
     def load(self):
         raise NotImplementedError
 
+    def _set_data(self, data):  # type: (Dict) -> None
+        self._data = data
+
     def update(self, *args, **kwargs):
         raise NotImplementedError
 
     def _get_resources_mapping(self):  # type: () -> List[Dict]
-        rv = self._cache.get('resources_mapping')
-        if rv is None:
-            rv = self._cache['resources_mapping'] = self._client.get(
-                eps.PERSONALITIES_RESOURCE_MAPPING_ENDPOINT
-            ).json
-        return rv
+        return self._client.get_cached(RESOURCES_MAPPING)
+
+    def _get_mapping_index(self):  # type: () -> ResourceMapping
+        return self._client.cache.get_or_load(
+            RESOURCES_MAPPING,
+            lambda: ResourceMapping(self._get_resources_mapping()),
+            key='index',
+        )
+
+    def _get_mapped(self, collection, ids):
+        # type: (str, Set[str]) -> List[Any]
+        """Returns cached objects with passed ids in collection order"""
+        cache = self._client.cache
+
+        def get_positions():
+            objects = self._client.get_cached(collection)
+            return dict(
+                (obj.id, (position, obj))
+                for position, obj in enumerate(objects)
+            )
+
+        positions = cache.get_or_load(
+            collection, get_positions, key='positions',
+        )
+
+        found = sorted(positions[i] for i in ids if i in positions)
+        return [obj for position, obj in found]
 
 
 class ResourceBlock(ResourceBase):
+    __slots__ = ()
 
     @property
     def type(self):  # type: () -> str
@@ -134,39 +204,20 @@ class ResourceBlock(ResourceBase):
     @property
     def host_groups(self):
         # type: () -> List['HostGroup']
+        mapped_group_ids = self._get_mapping_index().get_host_group_ids(
+            self.id)
+        if not mapped_group_ids:
+            return []
 
-        mapping = self._get_resources_mapping()
-        mapped_group_ids = set()
-
-        for item in mapping:
-            resource_id = item.get('resource_id')
-            host_group_id = item.get('host_group_id')
-            if resource_id == self.id and host_group_id is not None:
-                mapped_group_ids.add(host_group_id)
-
-        all_groups = self._cache.get('host_groups')
-        if all_groups is None:
-            all_groups = self._cache['host_groups'] = \
-                self._client.get_host_groups()
-
-        return [group for group in all_groups if group.id in mapped_group_ids]
+        return self._get_mapped(inv.HOST_GROUPS, mapped_group_ids)
 
     @property
     def hosts(self):  # type: () -> List['Host']
-        mapping = self._get_resources_mapping()
-        mapped_host_ids = set()
+        mapped_host_ids = self._get_mapping_index().get_host_ids(self.id)
+        if not mapped_host_ids:
+            return []
 
-        for item in mapping:
-            resource_id = item.get('resource_id')
-            host_id = item.get('host_id')
-            if resource_id == self.id and host_id is not None:
-                mapped_host_ids.add(host_id)
-
-        all_hosts = self._cache.get('hosts')
-        if all_hosts is None:
-            all_hosts = self._cache['hosts'] = self._client.get_hosts()
-
-        return [host for host in all_hosts if host.id in mapped_host_ids]
+        return self._get_mapped(inv.HOSTS, mapped_host_ids)
 
     @property
     def subnets(self):  # type: () -> List
@@ -214,8 +265,9 @@ class ResourceBlock(ResourceBase):
         if warning_threshold is not None:
             req_body['alert_threshold'] = warning_threshold
 
+        response = None
         if len(req_body) > 0:
-            self._client.post(
+            response = self._client.post(
                 path='{ep}/block/{id}'.format(
                     ep=eps.PERSONALITIES_ENDPOINT,
                     id=self.id,
@@ -232,119 +284,95 @@ class ResourceBlock(ResourceBase):
         if host_groups is not None:
             self._set_host_groups(host_groups)
 
-        self.load()
-        self.clear_cache()
+        # Hosts and host groups are kept in resources mapping.
+        # Resized capacity and ports are known after load only
+        if size is None and ports is None:
+            apply_changes(self, response, changes=req_body)
+        else:
+            self.load()
 
     def _set_host_groups(self, host_groups):
         # type: (List['HostGroup']) -> None
 
-        desired_group_names = [group.name for group in host_groups]
-        self_group_names = [group.name for group in self.host_groups]
-
-        groups_to_remove = []
-        groups_to_add = []
-
-        for group_name in self_group_names:
-            if group_name not in desired_group_names:
-                groups_to_remove.append(
-                    self._client.get_host_group(group_name).id
-                )
-
-        for group in host_groups:
-            if group.name not in self_group_names:
-                groups_to_add.append(group.id)
-
-        for group_id in groups_to_remove:
-            self._client.delete(
-                path='{ep}/block/{resource_id}/groups/{group_id}'.format(
-                    ep=eps.PERSONALITIES_ENDPOINT,
-                    resource_id=self.id,
-                    group_id=group_id,
-                )
-            )
-
-        for group_id in groups_to_add:
-            self._client.put(
-                path='{ep}/block/{resource_id}/groups/{group_id}'.format(
-                    ep=eps.PERSONALITIES_ENDPOINT,
-                    resource_id=self.id,
-                    group_id=group_id,
-                )
-            )
+        desired_group_names = set(group.name for group in host_groups)
+        self_groups = self.host_groups
+        self_group_names = set(group.name for group in self_groups)
+
+        self._set_mapping(
+            'groups',
+            ids_to_remove=[
+                group.id for group in self_groups
+                if group.name not in desired_group_names
+            ],
+            ids_to_add=[
+                group.id for group in host_groups
+                if group.name not in self_group_names
+            ],
+        )
 
     def _set_hosts(self, hosts):
         # type: (List['Host']) -> None
 
-        desired_host_names = [host.name for host in hosts]
-        self_host_names = [host.name for host in self.hosts]
-
-        hosts_to_remove = []
-        hosts_to_add = []
-
-        for host_name in self_host_names:
-            if host_name not in desired_host_names:
-                hosts_to_remove.append(
-                    self._client.get_host(host_name).id
-                )
-
-        for host in hosts:
-            if host.name not in self_host_names:
-                hosts_to_add.append(host.id)
-
-        for host_id in hosts_to_remove:
-            self._client.delete(
-                path='{ep}/block/{resource_id}/hosts/{host_id}'.format(
-                    ep=eps.PERSONALITIES_ENDPOINT,
-                    resource_id=self.id,
-                    host_id=host_id,
-                )
-            )
-
-        for host_id in hosts_to_add:
-            self._client.put(
-                path='{ep}/block/{resource_id}/hosts/{host_id}'.format(
-                    ep=eps.PERSONALITIES_ENDPOINT,
-                    resource_id=self.id,
-                    host_id=host_id,
-                )
-            )
+        desired_host_names = set(host.name for host in hosts)
+        self_hosts = self.hosts
+        self_host_names = set(host.name for host in self_hosts)
+
+        self._set_mapping(
+            'hosts',
+            ids_to_remove=[
+                host.id for host in self_hosts
+                if host.name not in desired_host_names
+            ],
+            ids_to_add=[
+                host.id for host in hosts
+                if host.name not in self_host_names
+            ],
+        )
 
     def _set_ports(self, ports):
         # type: (List['Port']) -> None
 
-        desired_port_names = [port.name for port in ports]
+        desired_port_names = set(port.name for port in ports)
         self_port_names = [
             item['port'] for item in self._data.get('ports', [])
         ]
 
-        ports_to_remove = []
-        ports_to_add = []
-
-        for port_name in self_port_names:
-            if port_name not in desired_port_names:
-                ports_to_remove.append(port_name)
-
-        for port in ports:
-            if port.name not in self_port_names:
-                ports_to_add.append(port.name)
+        self._set_mapping(
+            'ports',
+            ids_to_remove=[
+                port_name for port_name in self_port_names
+                if port_name not in desired_port_names
+            ],
+            ids_to_add=[
+                port.name for port in ports
+                if port.name not in self_port_names
+            ],
+        )
 
-        for port_name in ports_to_remove:
-            self._client.delete(
-                path='{ep}/block/{resource_id}/ports/{port_id}'.format(
-                    ep=eps.PERSONALITIES_ENDPOINT,
-                    resource_id=self.id,
-                    port_id=port_name,
-                )
+    def _set_mapping(self, kind, ids_to_remove, ids_to_add):
+        # type: (str, List[str], List[str]) -> None
+        """Removes and then adds mapped items of kind.
+
+        Requests of every step are independent, ConcurrentTatlinClient
+        sends them concurrently. All of them are sent even if some fail
+        """
+        def get_path(item_id):
+            return '{ep}/block/{resource_id}/{kind}/{item_id}'.format(
+                ep=eps.PERSONALITIES_ENDPOINT,
+                resource_id=self.id,
+                kind=kind,
+                item_id=item_id,
             )
 
-        for port_id in ports_to_add:
-            self._client.put(
-                path='{ep}/block/{resource_id}/ports/{port_id}'.format(
-                    ep=eps.PERSONALITIES_ENDPOINT,
-                    resource_id=self.id,
-                    port_id=port_id,
-                )
-            )
+        self._client.gather_all(*[
+            partial(self._client.delete, path=get_path(item_id))
+            for item_id in ids_to_remove
+        ])
+
+        self._client.gather_all(*[
+            partial(self._client.put, path=get_path(item_id))
+            for item_id in ids_to_add
+        ])
 
     def __eq__(self, other):
         if isinstance(other, ResourceBlock):
@@ -356,6 +384,7 @@ class ResourceBlock(ResourceBase):
 
 
 class ResourceFile(ResourceBase):
+    __slots__ = ()
 
     @property
     def type(self):  # type: () -> str
@@ -373,9 +402,7 @@ class ResourceFile(ResourceBase):
     def subnets(self):  # type: () -> List['Subnet']
         rv = []
 
-        all_subnets = self._cache.get('subnets')
-        if all_subnets is None:
-            all_subnets = self._cache['subnets'] = self._client.get_subnets()
+        all_subnets = self._client.get_cached(inv.SUBNETS)
 
         for subnet in all_subnets:
             if self in subnet.resources:
@@ -387,9 +414,7 @@ class ResourceFile(ResourceBase):
     def users(self):  # type: () -> List['User']
         rv = []
 
-        all_users = self._cache.get('users')
-        if all_users is None:
-            all_users = self._cache['users'] = self._client.get_users()
+        all_users = self._client.get_cached(inv.USERS)
 
         for item in self._data.get('acl', []):
             kind = item.get('principal', {}).get('kind')
@@ -415,10 +440,7 @@ class ResourceFile(ResourceBase):
 
         rv = []
 
-        all_groups = self._cache.get('user_groups')
-        if all_groups is None:
-            all_groups = self._cache['user_groups'] = \
-                self._client.get_user_groups()
+        all_groups = self._client.get_cached(inv.USER_GROUPS)
 
         for item in self._data.get('acl', []):
             kind = item.get('principal', {}).get('kind')
@@ -552,9 +574,12 @@ class ResourceFile(ResourceBase):
         ).json
 
         self.load()
-        self.clear_cache()
 
-        return Task(client=self._client, **task_data)
+        return Task(
+            client=self._client,
+            path=eps.DASHBOARD_RESOURCES_ENDPOINT,
+            **task_data
+        )
 
     @staticmethod
     def get_permissions_for_request(permissions):
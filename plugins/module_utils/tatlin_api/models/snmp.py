@@ -11,11 +11,12 @@ __metaclass__ = type
 
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinClientError
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import SNMP_ENDPOINT
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import apply_changes
 
 try:
-    from typing import List
+    from typing import Dict, List
 except ImportError:
-    List = None
+    Dict = List = None
 
 
 class SnmpConfig:
@@ -37,9 +38,7 @@ class SnmpConfig:
         self.update(servers=self.servers + [server])
 
     def load(self):  # type: () -> None
-        snmp_data = self._client.get(self._endpoint).json
-        self.community = snmp_data.get('community', None)
-        self.servers = list(snmp_data.get('recipients', {}).keys())
+        self._set_data(self._client.get(self._endpoint).json)
 
     def remove_server(self, server):  # type: (str) -> None
         """
@@ -90,12 +89,13 @@ class SnmpConfig:
 
         req_servers = servers if servers is not None else self.servers
 
-        self._client.put(
-            self._endpoint,
-            body={
-                'community': community or self.community,
-                'recipients': dict((server, {}) for server in req_servers)
-            }
-        )
+        body = {
+            'community': community or self.community,
+            'recipients': dict((server, {}) for server in req_servers)
+        }
+        response = self._client.put(self._endpoint, body=body)
+        apply_changes(self, response, changes=body)
 
-        self.load()
+    def _set_data(self, snmp_data):  # type: (Dict) -> None
+        self.community = snmp_data.get('community', None)
+        self.servers = list(snmp_data.get('recipients', {}).keys())
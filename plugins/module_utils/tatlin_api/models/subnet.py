@@ -10,22 +10,18 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.task import Task
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinClientError
 
 try:
-    from typing import List, Optional
+    from typing import Dict, List, Optional
 except ImportError:
-    List = Optional = None
+    Dict = List = Optional = None
 
 
 class Subnet:
-
-    _cache = {}
-
-    @classmethod
-    def clear_cache(cls):
-        cls._cache = {}
+    __slots__ = ('_client', '_data', '__weakref__')
 
     def __init__(self, client, **data):
         self._client = client
@@ -62,10 +58,7 @@ class Subnet:
     def resources(self):  # type: () -> List['models.resource.Resource']
         rv = []
 
-        resources = self._cache.get('resources')
-        if resources is None:
-            resources = self._cache['resources'] = \
-                self._client.get_resources()
+        resources = self._client.get_cached(inv.RESOURCES)
 
         for resource in resources:
             if resource.id in (self._data['resources'] or []):
@@ -79,7 +72,10 @@ class Subnet:
             id=self.id,
         ))
 
-        self.clear_cache()
+        self._client.invalidate_cache(inv.RESOURCES)
+
+    def _set_data(self, data):  # type: (Dict) -> None
+        self._data = data
 
     def update(self, ip_start=None, ip_end=None):  # type: (str, str) -> Task
         task_data = self._client.put(
@@ -96,7 +92,11 @@ class Subnet:
             }
         ).json
 
-        return Task(client=self._client, **task_data)
+        return Task(
+            client=self._client,
+            path=eps.DASHBOARD_SUBNETS_ENDPOINT,
+            **task_data
+        )
 
     def remove(self):  # type: () -> Task
         task_data = self._client.put('{ep}/delete/{id}'.format(
@@ -104,7 +104,11 @@ class Subnet:
             id=self.id,
         )).json
 
-        return Task(client=self._client, **task_data)
+        return Task(
+            client=self._client,
+            path=eps.DASHBOARD_SUBNETS_ENDPOINT,
+            **task_data
+        )
 
     def __eq__(self, other):
         if isinstance(other, Subnet):
@@ -11,6 +11,7 @@ __metaclass__ = type
 
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import SYSLOG_ENDPOINT
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinClientError
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import apply_changes
 
 try:
     from typing import Dict, Union, Optional
@@ -28,8 +29,9 @@ class SyslogConfig:
         self.load()
 
     def load(self):  # type: () -> None
-        data = self._client.get(self._endpoint).json
+        self._set_data(self._client.get(self._endpoint).json)
 
+    def _set_data(self, data):  # type: (Dict) -> None
         loaded_recipients = []
         for recipient, params in data.get('recipients', {}).items():
             address, port = recipient.split(':')
@@ -107,9 +109,9 @@ class SyslogConfig:
                 'audit': recipient['audit'],
             }
 
-        self._client.put(self._endpoint, body={'recipients': body_recipients})
-
-        self.load()
+        body = {'recipients': body_recipients}
+        response = self._client.put(self._endpoint, body=body)
+        apply_changes(self, response, changes=body)
 
     @staticmethod
     def validate_recipient(recipient):  # type: (Dict) -> None
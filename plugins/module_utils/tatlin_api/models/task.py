@@ -11,15 +11,41 @@ __metaclass__ = type
 
 import time
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.cache import (
+    COLLECTIONS, get_affected_collections,
+)
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinTaskError
 
+try:
+    from typing import Dict, Iterable, List, Tuple
+except ImportError:
+    Dict = Iterable = List = Tuple = None
+
+
+TASK_DONE_STATE = 'done'
+TASK_FAILED_STATES = ('error', 'aborting', 'aborted')
+TASK_TIMEOUT_STATE = 'timeout'
 
-class Task:
 
-    def __init__(self, client, **data):
+class Task:
+    __slots__ = ('_client', '_data', '_path')
+
+    def __init__(self, client, path=None, **data):
+        """
+        Args:
+            path: Endpoint of the write which started the task. It tells
+                which collections are changed when the task is finished
+        """
         self._client = client
+        self._path = path
         self._data = data
 
+    @property
+    def affected_collections(self):  # type: () -> Tuple[str, ...]
+        if self._path is None:
+            return COLLECTIONS
+        return get_affected_collections(self._path)
+
     @property
     def id(self):  # type: () -> int
         rv = self._data.get('id')
@@ -33,6 +59,11 @@ class Task:
     def err_msg(self):  # type: () -> str
         return self._data.get('err_msg')
 
+    @property
+    def is_finished(self):  # type: () -> bool
+        return self.state == TASK_DONE_STATE or \
+            self.state in TASK_FAILED_STATES
+
     @property
     def state(self):  # type: () -> str
         return self._data.get('state')
@@ -43,23 +74,22 @@ class Task:
         )).json
 
     def wait_until_complete(self, timeout=120):  # type: (int) -> None
-        start_time = time.time()
-        while self.state != 'done':
-            if time.time() - start_time > timeout:
-                raise TimeoutError(
-                    'Task has not done state for {0} seconds'.format(timeout),
-                )
-
-            time.sleep(0.1)
-            self.load()
-
-            if self.state in ('error', 'aborting', 'aborted'):
-                if self.state == 'error':
-                    msg = 'Tatlin task {0} was finished ' \
-                          'with error state'.format(self.id)
-                else:
-                    msg = self.err_msg
-                raise TatlinTaskError(msg)
+        state = TaskGroup(client=self._client, tasks=[self]).wait(
+            timeout=timeout,
+        )[self.id]
+
+        if state == TASK_TIMEOUT_STATE:
+            raise TimeoutError(
+                'Task has not done state for {0} seconds'.format(timeout),
+            )
+
+        if state in TASK_FAILED_STATES:
+            if state == 'error':
+                msg = 'Tatlin task {0} was finished ' \
+                      'with error state'.format(self.id)
+            else:
+                msg = self.err_msg
+            raise TatlinTaskError(msg)
 
     def __eq__(self, other):
         if isinstance(other, Task):
@@ -68,3 +98,85 @@ class Task:
 
     def __ne__(self, other):
         return not self.__eq__(other)
+
+
+class TaskGroup:
+    """Waits for several tasks at once
+
+    All pending tasks are refreshed with one request per poll. Poll
+    interval starts from initial_interval and grows by backoff_factor
+    up to max_interval while tasks are running
+    """
+
+    def __init__(
+        self,
+        client,  # type: 'TatlinClient'
+        tasks,  # type: Iterable[Task]
+        initial_interval=0.1,  # type: float
+        max_interval=2.0,  # type: float
+        backoff_factor=1.5,  # type: float
+    ):  # type: (...) -> None
+
+        self._client = client
+        self.tasks = list(tasks)
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+
+    @property
+    def pending(self):  # type: () -> List[Task]
+        return [task for task in self.tasks if not task.is_finished]
+
+    def refresh(self):  # type: () -> None
+        pending = self.pending
+        if not pending:
+            return
+
+        # Single task is cheaper to get by id than the whole list
+        if len(pending) == 1:
+            pending[0].load()
+            return
+
+        actual_tasks = dict(
+            (task.id, task) for task in self._client.get_tasks()
+        )
+
+        for task in pending:
+            actual_task = actual_tasks.get(task.id)
+            if actual_task is None:
+                task.load()
+            else:
+                task._data = actual_task._data
+
+    def wait(self, timeout=120):  # type: (int) -> Dict[int, str]
+        """Returns final state of every task by task id.
+
+        Tasks which were not finished in time have timeout state
+        """
+        deadline = time.time() + timeout
+        interval = self.initial_interval
+        pending = self.pending
+
+        while self.pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+
+            time.sleep(min(interval, remaining))
+            self.refresh()
+            interval = min(interval * self.backoff_factor, self.max_interval)
+
+        # Tasks finished during this wait have changed objects on
+        # Tatlin side, collections read while they were running are stale
+        collections = set()
+        for task in pending:
+            if task.is_finished:
+                collections.update(task.affected_collections)
+
+        if collections:
+            self._client.invalidate_cache(*sorted(collections))
+
+        return dict(
+            (task.id, task.state if task.is_finished else TASK_TIMEOUT_STATE)
+            for task in self.tasks
+        )
@@ -10,11 +10,12 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Union, List, TYPE_CHECKING
+    from typing import Dict, Union, List, TYPE_CHECKING
 except ImportError:
-    Union = List = TYPE_CHECKING = None
+    Dict = Union = List = TYPE_CHECKING = None
 
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import USERS_ENDPOINT
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import apply_changes
 
 if TYPE_CHECKING:
     from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.user_group import UserGroup
@@ -62,13 +63,25 @@ class User:
                 'At least one argument must be passed for user update'
             )
 
-        self._client.post(self._endpoint, body=upd_params)
+        response = self._client.post(self._endpoint, body=upd_params)
+
+        # Password is not returned, other fields are stored as sent
+        changes = {}
+        if enabled is not None:
+            changes['enabled'] = enabled
+        if groups is not None:
+            changes['memberOf'] = upd_params['memberOf']
+        apply_changes(self, response, changes=changes)
+
+    def load(self):  # type: () -> None
         self.reload()
 
     def reload(self):  # type: () -> None
-        data = self._client.get(self._endpoint).json
-        self.enabled = data['enabled']
-        self._member_of = data['memberOf']
+        self._set_data(self._client.get(self._endpoint).json)
+
+    def _set_data(self, data):  # type: (Dict) -> None
+        self.enabled = data.get('enabled', self.enabled)
+        self._member_of = data.get('memberOf', self._member_of)
 
     @property
     def groups(self):
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from base64 import b64decode, b64encode
+from ansible.module_utils.common.text.converters import to_bytes
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.cache import get_affected_collections
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.connection_pool import PooledResponse
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import Middleware
+
+try:
+    from typing import Any, Dict, Iterable, Optional
+except ImportError:
+    Any = Dict = Iterable = Optional = None
+
+
+DEFAULT_RESPONSE_CACHE_PATH = os.path.join('~', '.ansible', 'tatlin_uni_responses')
+DEFAULT_RESPONSE_CACHE_TTL = 10
+
+# Large read endpoints which rarely change. Other endpoints are not
+# cached, they may return secrets, like LDAP or SMTP configuration
+CACHED_ENDPOINTS = (
+    eps.HEALTH_MEDIAS_ENDPOINT,
+    eps.HEALTH_POOLS_ENDPOINT,
+    eps.HEALTH_PERSONALITIES_ENDPOINT,
+    eps.PORTS_STATUS_ENDPOINT,
+    eps.PERSONALITIES_HOSTS_ENDPOINT,
+    eps.PERSONALITIES_HOST_GROUPS_ENDPOINT,
+)
+
+NOT_MODIFIED = 304
+
+
+def _hash(*parts):  # type: (*str) -> str
+    return hashlib.sha256(
+        b'\0'.join(to_bytes(part or '') for part in parts)
+    ).hexdigest()
+
+
+def _get_header(headers, name):  # type: (Any, str) -> Optional[str]
+    name = name.lower()
+    for key, value in dict(headers or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+class ConditionalCacheMiddleware(Middleware):
+    """Keeps responses of large read endpoints on disk between tasks.
+
+    Cached response is revalidated with If-None-Match or
+    If-Modified-Since, and 304 response is served from the cache.
+    Responses without validators are served without request for ttl
+    seconds, then they are requested again, and the stored body is
+    kept if its hash is the same. Any request which may change data
+    drops all cached responses of the system.
+    Files are readable by their owner only.
+    """
+
+    def __init__(
+        self,
+        base_url,  # type: str
+        username=None,  # type: Optional[str]
+        path=None,  # type: Optional[str]
+        ttl=DEFAULT_RESPONSE_CACHE_TTL,  # type: float
+        endpoints=CACHED_ENDPOINTS,  # type: Iterable[str]
+    ):  # type: (...) -> None
+        self.path = os.path.join(
+            os.path.expanduser(path or DEFAULT_RESPONSE_CACHE_PATH),
+            _hash(base_url),
+        )
+        self.username = username
+        self.ttl = ttl
+        self.endpoints = frozenset(ep.strip('/') for ep in endpoints)
+
+    def clear(self):  # type: () -> None
+        if not os.path.isdir(self.path):
+            return
+
+        for name in os.listdir(self.path):
+            try:
+                os.remove(os.path.join(self.path, name))
+            except OSError:
+                pass
+
+    def handle(self, request, send):
+        if request.method != 'GET':
+            try:
+                return send(request)
+            finally:
+                # Login and logout don't change data
+                if get_affected_collections(request.path):
+                    self.clear()
+
+        if request.meta.get('stream') \
+                or request.path.strip('/') not in self.endpoints:
+            return send(request)
+
+        entry_path = os.path.join(
+            self.path, _hash(self.username, request.url) + '.json',
+        )
+        entry = self._load(entry_path)
+        has_validators = entry is not None \
+            and (entry.get('etag') or entry.get('last_modified'))
+
+        if entry is not None and not has_validators \
+                and entry['stored_at'] + self.ttl > time.time():
+            request.meta['cached'] = True
+            return _replay(entry)
+
+        if has_validators:
+            if entry.get('etag'):
+                request.headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request.headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = send(request)
+        except Exception as e:
+            # urllib raises error for 304, pooled transport does not
+            if has_validators and getattr(e, 'status', None) == NOT_MODIFIED:
+                request.meta['cached'] = True
+                return _replay(entry)
+            raise
+
+        if has_validators and response.getcode() == NOT_MODIFIED:
+            request.meta['cached'] = True
+            return _replay(entry)
+
+        body = to_bytes(response.read())
+        body_hash = hashlib.sha256(body).hexdigest()
+
+        if entry is not None and entry.get('hash') == body_hash \
+                and not _get_header(response.headers, 'ETag') \
+                and not _get_header(response.headers, 'Last-Modified'):
+            # Only time of the check is updated, body is the same
+            entry['stored_at'] = time.time()
+        else:
+            entry = {
+                'status': response.getcode(),
+                'reason': getattr(response, 'reason', ''),
+                'headers': dict(response.headers or {}),
+                'etag': _get_header(response.headers, 'ETag'),
+                'last_modified': _get_header(response.headers, 'Last-Modified'),
+                'hash': body_hash,
+                'stored_at': time.time(),
+                'body': b64encode(body).decode('ascii'),
+            }
+
+        self._save(entry_path, entry)
+        return PooledResponse(
+            status=response.getcode(),
+            reason=getattr(response, 'reason', ''),
+            headers=response.headers,
+            body=body,
+        )
+
+    @staticmethod
+    def _load(entry_path):  # type: (str) -> Optional[Dict[str, Any]]
+        try:
+            with open(entry_path) as f:
+                rv = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        return rv if isinstance(rv, dict) and 'body' in rv else None
+
+    def _save(self, entry_path, entry):  # type: (str, Dict[str, Any]) -> None
+        try:
+            if not os.path.isdir(self.path):
+                os.makedirs(self.path, 0o700)
+
+            # File is replaced atomically, so readers
+            # never see partially written data
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entry, f)
+                os.rename(tmp_path, entry_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except (IOError, OSError):
+            # Cache is an optimization, response is valid anyway
+            pass
+
+
+def _replay(entry):  # type: (Dict[str, Any]) -> PooledResponse
+    return PooledResponse(
+        status=entry['status'],
+        reason=entry['reason'],
+        headers=entry['headers'],
+        body=b64decode(entry['body']),
+    )
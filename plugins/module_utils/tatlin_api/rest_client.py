@@ -10,18 +10,32 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Dict, Union, Tuple
+    from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Union, Tuple
+    from ansible.module_utils.connection import Connection
 except ImportError:
     # Satisfy Python 2 which doesn't have typing.
-    Dict = Union = Tuple = None
+    Any = BinaryIO = Callable = Dict = Iterable = Iterator = List = Union = Tuple = None
+    Connection = None
 
+import codecs
 import json
+import re
+import socket
+import threading
+from base64 import b64decode, b64encode
+from io import BytesIO
 from uuid import uuid4
 from ansible.module_utils.urls import open_url
-from ansible.module_utils.six.moves.urllib.parse import urlencode
+from ansible.module_utils.connection import ConnectionError as SocketConnectionError
+from ansible.module_utils.common.text.converters import to_bytes
+from ansible.module_utils.six import text_type
+from ansible.module_utils.six.moves.urllib.parse import urlencode, urlsplit
 from ansible.module_utils.six.moves.http_client import HTTPResponse
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.connection_pool import (
+    ConnectionPool, PooledResponse,
+)
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
     RESTClientError,
     RESTClientNotFoundError,
@@ -30,6 +44,28 @@ from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.except
     RESTClientUnauthorized,
     RESTClientBadRequest,
 )
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import (
+    Middleware, RestRequest, build_chain,
+)
+
+
+# Faster JSON decoders are used if installed, they are
+# significantly quicker on large personalities payloads
+try:
+    import orjson as json_backend
+except ImportError:
+    try:
+        import ujson as json_backend
+    except ImportError:
+        json_backend = json
+
+
+_NOT_LOADED = object()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_CONTAINER_STARTS = '{["'
+_SCALAR_DELIMITERS = ',] \t\n\r'
+
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 def build_url(base, path, query_params=None):  # type: (str, str, Dict) -> str
@@ -52,7 +88,11 @@ class RestClient:
         password=None,  # type: str
         validate_certs=True,  # type: bool
         timeout=60,  # type: int
-        auth_method=AUTH_SESSION  # type: str,
+        auth_method=AUTH_SESSION,  # type: str
+        keep_alive=False,  # type: bool
+        connection=None,  # type: Connection
+        stream_json=False,  # type: bool
+        middlewares=None,  # type: Iterable[Middleware]
     ):  # type: (...) -> None
 
         self._username = username
@@ -69,10 +109,29 @@ class RestClient:
 
         self.validate_certs = validate_certs
         self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.stream_json = stream_json
+        self._connection = connection
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self.middlewares = list(middlewares or [])  # type: List[Middleware]
+
+    def add_middleware(self, middleware):  # type: (Middleware) -> None
+        """Adds middleware to the end of the chain, so it is
+        the closest one to transport"""
+        self.middlewares.append(middleware)
 
     def authorize(self, username=None, password=None, auth=None):
         raise NotImplementedError
 
+    def close(self):  # type: () -> None
+        """Closes idle keep-alive connections"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+
+        if pool is not None:
+            pool.close()
+
     def set_connection_host(self, host):  # type: (str) -> None
         self._host = host
 
@@ -87,7 +146,8 @@ class RestClient:
         body=None,  # type: Union[Dict, bytes]
         headers=None,  # type: Dict
         files=None,  # type: Dict[str, bytes]
-    ):  # type: (...) -> RestResponse
+        stream=False,  # type: bool
+    ):  # type: (...) -> Union[RestResponse, StreamingResponse]
 
         request_kwargs = {
             "follow_redirects": "all",
@@ -107,6 +167,11 @@ class RestClient:
         if files:
             content_type, request_body = prepare_multipart(files)
             request_kwargs['headers']['Content-Type'] = content_type
+            if isinstance(request_body, MultipartEncoder):
+                # Body is sent by chunks, so its length can't be
+                # calculated by transport
+                request_kwargs['headers']['Content-Length'] = \
+                    str(len(request_body))
         elif body:
             if isinstance(body, dict) or isinstance(body, list):
                 request_kwargs["headers"]["Content-Type"] = "application/json"
@@ -123,43 +188,113 @@ class RestClient:
         if headers:
             request_kwargs["headers"].update(headers)
 
-        url = build_url(self.base_url, path, query_params=query_params)
-        response = self._make_request(url, request_body, **request_kwargs)
+        request = RestRequest(
+            method=request_kwargs.pop('method'),
+            path=path,
+            url=build_url(self.base_url, path, query_params=query_params),
+            body=request_body,
+            headers=request_kwargs.pop('headers'),
+            options=request_kwargs,
+        )
+        request.meta['stream'] = stream
+
+        response = build_chain(self.middlewares, self._send_request)(request)
+        if stream:
+            return StreamingResponse(response)
         return RestResponse(response)
 
+    def _send_request(self, request):  # type: (RestRequest) -> HTTPResponse
+        # Streamed body could be read by previous attempt
+        if hasattr(request.body, 'seek'):
+            request.body.seek(0)
+
+        return self._make_request(
+            request.url,
+            request.body,
+            method=request.method,
+            headers=request.headers,
+            **request.options
+        )
+
     def _make_request(self, url, request_body, **request_kwargs):
         try:
-            response = open_url(url=url, data=request_body, **request_kwargs)
+            if self._connection is not None:
+                response = self._send_through_connection(
+                    url=url,
+                    body=request_body,
+                    method=request_kwargs['method'],
+                    headers=request_kwargs['headers'],
+                )
+            elif self.keep_alive:
+                response = self._get_pool().request(
+                    method=request_kwargs['method'],
+                    url=url,
+                    body=request_body,
+                    headers=request_kwargs['headers'],
+                )
+            else:
+                response = open_url(
+                    url=url, data=request_body, **request_kwargs)
         except HTTPError as e:
             if e.code == 404:
-                raise RESTClientNotFoundError('Not found: {0}'.format(e.url))
+                error = RESTClientNotFoundError('Not found: {0}'.format(e.url))
             elif e.code == 401:
-                raise RESTClientUnauthorized('Unauthorized error')
+                error = RESTClientUnauthorized('Unauthorized error')
             elif e.code == 400:
                 err_msg = e.read().decode()
-                raise RESTClientBadRequest(err_msg)
+                error = RESTClientBadRequest(err_msg)
             else:
                 try:
                     msg = json.load(e)
                 except ValueError:
                     msg = str(e)
-                raise RESTClientRequestError(
+                error = RESTClientRequestError(
                     'Request finished with error: {0}'.format(msg))
-        except (URLError, SSLValidationError, ConnectionError) as e:
-            raise RESTClientConnectionError(
+
+            # Status code is kept for middlewares
+            error.status = e.code
+            raise error
+        except (
+            URLError, SSLValidationError, ConnectionError, SocketConnectionError,
+        ) as e:
+            error = RESTClientConnectionError(
                 'Cannot connect to server: {0}'.format(str(e)))
+            # open_url raises URLError only until the request is written,
+            # and urls errors while connecting. Connection pool marks
+            # URLError of requests which could be sent
+            if isinstance(e, URLError):
+                error.request_sent = getattr(e, 'request_sent', False)
+            elif isinstance(e, (ConnectionError, SSLValidationError)):
+                error.request_sent = False
+            raise error
         except OSError as e:
-            if type(e).__name__ == 'timeout':
+            # socket.timeout is named TimeoutError since Python 3.10
+            if isinstance(e, socket.timeout):
                 raise RESTClientConnectionError(
                     'Timeout Error: {0}'.format(str(e)))
             raise
         else:
             return response
 
-    def get(self, path, query_params=None, headers=None):
-        # type: (str, Dict, Dict) -> RestResponse
+    def get(self, path, query_params=None, headers=None, stream=False):
+        # type: (str, Dict, Dict, bool) -> Union[RestResponse, StreamingResponse]
         return self.make_request(
-            path, method="GET", query_params=query_params, headers=headers)
+            path, method="GET", query_params=query_params, headers=headers,
+            stream=stream,
+        )
+
+    def get_json_items(self, path, query_params=None):
+        # type: (str, Dict) -> Iterable[Any]
+        """Returns elements of JSON array from path response.
+
+        If stream_json is enabled, elements are decoded one by one while
+        response is read, so the whole document is never kept in memory
+        """
+        if self.stream_json:
+            return self.get(
+                path, query_params=query_params, stream=True,
+            ).iter_json()
+        return self.get(path, query_params=query_params).json
 
     def post(self, path, body=None, headers=None, files=None):
         # type: (str, Union[Dict, bytes], Dict, Dict) -> RestResponse
@@ -181,6 +316,54 @@ class RestClient:
         return self.make_request(
             path, method="PUT", body=body, headers=headers, files=files)
 
+    def _send_through_connection(self, url, body, method, headers):
+        # type: (str, Union[str, bytes], str, Dict) -> PooledResponse
+        """Sends request through persistent connection of httpapi plugin,
+        which owns the session and connections to Tatlin"""
+
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        if isinstance(body, text_type):
+            body = body.encode('utf-8')
+        elif hasattr(body, 'read'):
+            # Connection plugin accepts whole body only
+            body = body.read()
+
+        rv = self._connection.send_request(
+            path=path,
+            method=method,
+            body=b64encode(body).decode('ascii') if body is not None else None,
+            headers=headers,
+        )
+
+        response = PooledResponse(
+            status=rv['status'],
+            reason=rv['reason'],
+            headers=rv['headers'],
+            body=b64decode(rv['body']),
+        )
+
+        if response.status >= 400:
+            raise HTTPError(
+                url, response.status, response.reason, response.headers,
+                BytesIO(response.read()),
+            )
+
+        return response
+
+    def _get_pool(self):  # type: () -> ConnectionPool
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        validate_certs=self.validate_certs,
+                        timeout=self.timeout,
+                    )
+        return self._pool
+
     def _get_headers(self):
         headers = {}
 
@@ -201,17 +384,33 @@ class RestResponse:
     def __init__(self, response):  # type: (HTTPResponse) -> None
         self._response = response
         self._body = self._response.read()
+        self._json = _NOT_LOADED
+        self._headers = None
+
+    @property
+    def content(self):  # type: () -> bytes
+        """Raw response body"""
+        return self._body
 
     @property
     def json(self):  # type: () -> Dict
-        try:
-            return json.loads(self._body or '{}')
-        except ValueError:
-            raise ValueError("Unable to parse json")
+        """Response body decoded once on first access.
+
+        The same object is returned every time,
+        so copy it before changing
+        """
+        if self._json is _NOT_LOADED:
+            try:
+                self._json = json_backend.loads(self._body or '{}')
+            except ValueError:
+                raise ValueError("Unable to parse json")
+        return self._json
 
     @property
     def headers(self):  # type: () -> Dict
-        return dict(self._response.headers)
+        if self._headers is None:
+            self._headers = dict(self._response.headers)
+        return self._headers
 
     @property
     def status_code(self):  # type: () -> int
@@ -222,29 +421,232 @@ class RestResponse:
         return self.status_code in (200, 201, 202, 204)
 
 
+class StreamingResponse:
+    """Response which body is decoded while it is read"""
+
+    def __init__(self, response, chunk_size=STREAM_CHUNK_SIZE):
+        # type: (HTTPResponse, int) -> None
+        self._response = response
+        self._chunk_size = chunk_size
+
+    @property
+    def headers(self):  # type: () -> Dict
+        return dict(self._response.headers)
+
+    @property
+    def status_code(self):  # type: () -> int
+        return self._response.getcode()
+
+    def close(self):  # type: () -> None
+        close = getattr(self._response, 'close', None)
+        if close is not None:
+            close()
+
+    def iter_json(self):  # type: () -> Iterator[Any]
+        """Yields elements of JSON array body one by one"""
+        try:
+            for item in iter_json_array(self._response.read, self._chunk_size):
+                yield item
+        finally:
+            self.close()
+
+
+def iter_json_array(read, chunk_size=STREAM_CHUNK_SIZE):
+    # type: (Callable[[int], bytes], int) -> Iterator[Any]
+    """Incrementally decodes JSON array from read function.
+
+    Only one chunk and one decoded element are kept in memory at once.
+    Empty body is decoded as empty array
+    """
+    start, first, value, separator = range(4)
+
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    pos = 0
+    eof = False
+    need_more = False
+    expected = start
+
+    while True:
+        if need_more:
+            if eof:
+                raise ValueError('Unable to parse json: unexpected end of array')
+
+            chunk = read(chunk_size)
+            if chunk:
+                text = text_decoder.decode(chunk)
+            else:
+                eof = True
+                text = text_decoder.decode(b'', True)
+
+            buf = buf[pos:] + text
+            pos = 0
+            need_more = False
+
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos == len(buf):
+            if eof and expected == start:
+                return
+            need_more = True
+            continue
+
+        char = buf[pos]
+        if expected == start:
+            if char != '[':
+                raise ValueError('Unable to parse json: array is expected')
+            pos += 1
+            expected = first
+
+        elif expected == separator:
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError(
+                    'Unable to parse json: unexpected {0!r}'.format(char)
+                )
+            pos += 1
+            expected = value
+
+        elif expected == first and char == ']':
+            return
+
+        else:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                need_more = True
+                continue
+
+            # Element which ends with buffer could be cut, and a number
+            # could be cut even before its dot or exponent, so scalars
+            # are decoded again with more data until a delimiter follows
+            if not eof and (
+                end == len(buf) or
+                char not in _CONTAINER_STARTS and
+                buf[end] not in _SCALAR_DELIMITERS
+            ):
+                need_more = True
+                continue
+
+            yield item
+            pos = end
+            expected = separator
+
+
+class MultipartEncoder:
+    """File-like multipart/form-data body.
+
+    Parts may be text, bytes or binary file objects. File parts are read
+    by chunks while the body is sent, so memory usage doesn't depend on
+    their size. Content is sent byte-exact. Length is known before
+    sending, file objects must be seekable and must not change until
+    the request is finished.
+    """
+
+    content_part_type = 'application/octet-stream'
+
+    def __init__(self, files, boundary=None):
+        # type: (Dict[str, Union[str, bytes, BinaryIO]], str) -> None
+        self.boundary = boundary or str(uuid4())
+        self.content_type = 'multipart/form-data; boundary={0}'.format(
+            self.boundary,
+        )
+
+        self._parts = []  # type: List[Union[bytes, Tuple[BinaryIO, int, int]]]
+        for name, content in files.items():
+            self._parts.append((
+                '--{boundary}\r\n'
+                'Content-Type: {content_type}\r\n'
+                'Content-Disposition: form-data; name="{name}"; '
+                'filename="{name}"\r\n\r\n'.format(
+                    boundary=self.boundary,
+                    content_type=self.content_part_type,
+                    name=name,
+                )
+            ).encode('utf-8'))
+
+            if hasattr(content, 'read'):
+                start = content.tell()
+                content.seek(0, 2)
+                self._parts.append((content, start, content.tell() - start))
+                content.seek(start)
+            else:
+                self._parts.append(to_bytes(content))
+
+            self._parts.append(b'\r\n')
+
+        self._parts.append(
+            '--{0}--\r\n'.format(self.boundary).encode('utf-8')
+        )
+
+        self._length = sum(_part_length(part) for part in self._parts)
+        self._index = 0
+        self._offset = 0
+
+    def __len__(self):  # type: () -> int
+        return self._length
+
+    @property
+    def is_streamed(self):  # type: () -> bool
+        """Whether the body has file parts"""
+        return any(isinstance(part, tuple) for part in self._parts)
+
+    def read(self, size=-1):  # type: (int) -> bytes
+        remaining = size if size is not None and size >= 0 else None
+        chunks = []
+
+        while self._index < len(self._parts) \
+                and (remaining is None or remaining > 0):
+            part = self._parts[self._index]
+            part_length = _part_length(part)
+            want = part_length - self._offset
+            if remaining is not None:
+                want = min(want, remaining)
+
+            if isinstance(part, tuple):
+                f, start, length = part
+                f.seek(start + self._offset)
+                data = f.read(want)
+                if len(data) < want:
+                    raise RESTClientError(
+                        'File was truncated while it was uploaded'
+                    )
+            else:
+                data = part[self._offset:self._offset + want]
+
+            chunks.append(data)
+            self._offset += len(data)
+            if remaining is not None:
+                remaining -= len(data)
+
+            if self._offset >= part_length:
+                self._index += 1
+                self._offset = 0
+
+        return b''.join(chunks)
+
+    def seek(self, offset, whence=0):  # type: (int, int) -> None
+        """Only rewinding to the start is supported,
+        it is used to send the body again"""
+        if offset != 0 or whence != 0:
+            raise ValueError('Multipart body can only be rewound')
+        self._index = 0
+        self._offset = 0
+
+
+def _part_length(part):  # type: (Union[bytes, Tuple[BinaryIO, int, int]]) -> int
+    return part[2] if isinstance(part, tuple) else len(part)
+
+
 def prepare_multipart(files):
-    # type: (Dict[str, Union[str, bytes]]) -> Tuple[str, bytes]
-
-    boundary = str(uuid4())
-    content_type = 'application/octet-stream'
-    parts = []
-
-    for filename, content in files.items():
-        content_disposition = \
-            'Content-Disposition: form-data; name="{filename}"; ' \
-            'filename="{filename}"'.format(filename=filename)
-
-        parts.extend([
-            '--{0}'.format(boundary),
-            'Content-Type: {0}'.format(content_type),
-            content_disposition,
-            '',
-            '\r\n'.join(content.splitlines()),
-        ])
-
-    parts.extend(['--{0}--'.format(boundary), ''])
-
-    return (
-        'multipart/form-data; boundary=%s' % boundary,
-        bytes('\r\n'.join(parts).encode('utf-8'))
-    )
+    # type: (Dict[str, Union[str, bytes, BinaryIO]]) -> Tuple[str, Union[bytes, MultipartEncoder]]
+    """Returns content type and body of multipart request.
+
+    Body is bytes if all parts are in memory, and is MultipartEncoder
+    to be read by chunks if there are file parts
+    """
+    encoder = MultipartEncoder(files)
+    if encoder.is_streamed:
+        return encoder.content_type, encoder
+    return encoder.content_type, encoder.read()
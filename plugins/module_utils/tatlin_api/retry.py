@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+import time
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
+    RESTClientConnectionError,
+)
+
+try:
+    from typing import Any, Callable, Iterable, Optional, Tuple, Type
+except ImportError:
+    Any = Callable = Iterable = Optional = Tuple = Type = None
+
+
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+RETRY_STATUSES = frozenset((502, 503, 504))
+
+
+class RetryPolicy:
+    """Decides which failed calls are repeated and how long to wait.
+
+    Delay grows exponentially from backoff_factor up to max_backoff.
+    With jitter the delay is a random value up to the exponential one,
+    so clients failed at the same moment don't retry at the same moment.
+    Errors are retried if they are instances of retry_exceptions or
+    have status from retry_statuses. Only methods from methods are
+    retried by default, because a non-idempotent request could be
+    processed by server before the connection was lost.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,  # type: int
+        backoff_factor=0.5,  # type: float
+        max_backoff=10,  # type: float
+        jitter=True,  # type: bool
+        retry_statuses=RETRY_STATUSES,  # type: Iterable[int]
+        retry_exceptions=(RESTClientConnectionError,),  # type: Tuple[Type[Exception], ...]
+        methods=IDEMPOTENT_METHODS,  # type: Iterable[str]
+    ):  # type: (...) -> None
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def call(self, func, method=None):
+        # type: (Callable[[], Any], Optional[str]) -> Any
+        """Calls func until it succeeds, raises not retryable error
+        or attempts are over. Method isn't checked if not passed"""
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                if attempt >= self.max_attempts \
+                        or not self.is_retryable(e, method):
+                    raise
+
+            time.sleep(self.get_backoff(attempt))
+            attempt += 1
+
+    def get_backoff(self, attempt):  # type: (int) -> float
+        """Returns delay after failed attempt, attempts start from 1"""
+        delay = min(
+            self.max_backoff, self.backoff_factor * 2 ** (attempt - 1),
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def is_retryable(self, error, method=None):
+        # type: (Exception, Optional[str]) -> bool
+        if method is not None and method.upper() not in self.methods:
+            return False
+
+        if isinstance(error, self.retry_exceptions):
+            return True
+
+        return getattr(error, 'status', None) in self.retry_statuses
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from ansible.module_utils.common.text.converters import to_bytes
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    from typing import Dict, Iterator, Optional
+except ImportError:
+    Dict = Iterator = Optional = None
+
+
+DEFAULT_SESSION_CACHE_PATH = os.path.join('~', '.ansible', 'tatlin_uni_sessions.json')
+DEFAULT_SESSION_TTL = 600
+
+# Password check value is stretched, so the password can't be
+# brute-forced quickly by someone who has read the cache file
+SECRET_ITERATIONS = 100000
+SECRET_SALT_SIZE = 16
+
+
+def _hash(*parts):  # type: (*str) -> str
+    return hashlib.sha256(
+        b'\0'.join(to_bytes(part or '') for part in parts)
+    ).hexdigest()
+
+
+def _derive_secret(password, salt):  # type: (str, str) -> str
+    return binascii.hexlify(hashlib.pbkdf2_hmac(
+        'sha256', to_bytes(password or ''), binascii.unhexlify(salt),
+        SECRET_ITERATIONS,
+    )).decode('ascii')
+
+
+class SessionCache:
+    """Keeps session tokens on disk between module runs
+
+    Tokens are stored by base url and username. A token is returned only
+    for the same password it was received with, and only until it
+    expires. The password is checked against a salted PBKDF2 value,
+    the password itself is not stored. The file is readable by its owner only and is locked while
+    it is read or changed, so parallel tasks don't overwrite each other.
+    """
+
+    def __init__(self, path=None, ttl=DEFAULT_SESSION_TTL):
+        # type: (Optional[str], int) -> None
+        self.path = os.path.expanduser(path or DEFAULT_SESSION_CACHE_PATH)
+        self.ttl = ttl
+
+    def delete(self, base_url, username):  # type: (str, str) -> None
+        with self._locked(exclusive=True):
+            sessions = self._read()
+            if sessions.pop(_hash(base_url, username), None) is not None:
+                self._write(sessions)
+
+    def get(self, base_url, username, password):
+        # type: (str, str, str) -> Optional[str]
+        with self._locked(exclusive=False):
+            session = self._read().get(_hash(base_url, username))
+
+        if session is None or session.get('expires_at', 0) <= time.time():
+            return None
+
+        salt = session.get('salt')
+        secret = session.get('secret')
+        if not salt or not secret:
+            return None
+
+        try:
+            expected = _derive_secret(password, salt)
+        except (TypeError, ValueError):
+            return None
+
+        if not hmac.compare_digest(secret, expected):
+            return None
+
+        return session.get('token')
+
+    def set(self, base_url, username, password, token):
+        # type: (str, str, str, str) -> None
+        # Secret is derived before locking, it takes a while by design
+        salt = binascii.hexlify(os.urandom(SECRET_SALT_SIZE)).decode('ascii')
+        secret = _derive_secret(password, salt)
+        now = time.time()
+
+        with self._locked(exclusive=True):
+            sessions = dict(
+                (key, session) for key, session in self._read().items()
+                if session.get('expires_at', 0) > now
+            )
+
+            sessions[_hash(base_url, username)] = {
+                'token': token,
+                'salt': salt,
+                'secret': secret,
+                'expires_at': now + self.ttl,
+            }
+
+            self._write(sessions)
+
+    @contextmanager
+    def _locked(self, exclusive):  # type: (bool) -> Iterator[None]
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+
+        if fcntl is None:
+            yield
+            return
+
+        lock_fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    def _read(self):  # type: () -> Dict[str, Dict]
+        try:
+            with open(self.path) as f:
+                rv = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+        return rv if isinstance(rv, dict) else {}
+
+    def _write(self, sessions):  # type: (Dict[str, Dict]) -> None
+        # File is replaced atomically, so readers
+        # never see partially written data
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.path) or None,
+            prefix='.tatlin_uni_sessions',
+        )
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(sessions, f)
+            os.rename(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
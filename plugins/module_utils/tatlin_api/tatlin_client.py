@@ -10,9 +10,15 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import sys
+import threading
 from base64 import b64encode
 from uuid import uuid4
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.cache import (
+    RESOURCES_MAPPING, TTLCache, get_affected_collections,
+)
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.ldap import LdapConfig
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.user import User
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.user_group import UserGroup
@@ -24,25 +30,34 @@ from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.pool import Pool
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.port import Port
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.resource import (
-    ResourceBlock, ResourceFile,
+    ResourceBlock, ResourceFile, ResourceMapping, group_resources_by_pool,
 )
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.smtp import SmtpConfig
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.snmp import SnmpConfig
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.subnet import Subnet
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.syslog import SyslogConfig
-from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.task import Task
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.task import Task, TaskGroup
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.identity_map import IdentityMap
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory import TatlinInventory
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import SingleFlightMiddleware
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.session_cache import SessionCache
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.utils import get_iscsi_auth_for_request
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.rest_client import (
-    RestClient, AUTH_BASIC, AUTH_SESSION,
+    RestClient, RestResponse, StreamingResponse, AUTH_BASIC, AUTH_SESSION,
 )
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
     TatlinClientError, TatlinNodeNotFoundError, TatlinAuthorizationError, RESTClientNotFoundError,
+    RESTClientUnauthorized, raise_errors,
 )
 
 try:
-    from typing import Optional, List, Union, Dict
+    from typing import Optional, List, Union, Dict, Callable, Any, Iterable, BinaryIO
+    from ansible.module_utils.connection import Connection
+    from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import Middleware
 except ImportError:
-    Optional = List = Union = Dict = None
+    Optional = List = Union = Dict = Callable = Any = Iterable = Connection = None
+    BinaryIO = None
+    Middleware = None
 
 
 class TatlinClient(RestClient):
@@ -55,6 +70,14 @@ class TatlinClient(RestClient):
         validate_certs=True,  # type: Optional[bool]
         timeout=60,  # type: Optional[int]
         auth_method=AUTH_SESSION,  # type: Optional[str]
+        keep_alive=False,  # type: Optional[bool]
+        cache_ttls=None,  # type: Optional[Dict[str, float]]
+        session_cache=None,  # type: Optional[SessionCache]
+        connection=None,  # type: Optional[Connection]
+        stream_json=False,  # type: bool
+        middlewares=None,  # type: Optional[Iterable[Middleware]]
+        coalesce_window=0,  # type: float
+        write_through=False,  # type: bool
     ):  # type: (...) -> None
 
         super(TatlinClient, self).__init__(
@@ -64,18 +87,39 @@ class TatlinClient(RestClient):
             validate_certs=validate_certs,
             timeout=timeout,
             auth_method=auth_method,
+            keep_alive=keep_alive,
+            connection=connection,
+            stream_json=stream_json,
+            middlewares=middlewares,
         )
 
         self._login_path = eps.LOGIN_ENDPOINT
         self._ldap_config = None
         self._system_name = None
         self._system_version = None
+        self._inventory = TatlinInventory()
+        self._identity_map = IdentityMap()
+        self._cache = TTLCache(ttls=cache_ttls)
+        self._session_cache = session_cache
+        self._auth_lock = threading.Lock()
+
+        # Models apply their changes locally instead of
+        # loading themselves again, see utils.apply_changes
+        self.write_through = write_through
+
+        # Identical GETs share one response. Task states are
+        # polled, so they are always requested again
+        self.single_flight = SingleFlightMiddleware(
+            window=coalesce_window, exclude=(eps.DASHBOARD_TASKS_ENDPOINT,),
+        )
+        self.middlewares.insert(0, self.single_flight)
 
     def __enter__(self):
         self.authorize(self._username, self._password, self._auth_method)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.logout()
+        self.close()
 
     def authorize(
         self,
@@ -100,6 +144,14 @@ class TatlinClient(RestClient):
                     'No login path was passed for session authorization'
                 )
 
+            if self._session_cache is not None:
+                token = self._session_cache.get(
+                    self.base_url, self._username, self._password,
+                )
+                if token is not None:
+                    self._token = token
+                    return
+
             try:
                 response = self.post(
                     self._login_path,
@@ -111,6 +163,12 @@ class TatlinClient(RestClient):
                 ))
 
             self._token = response['token']
+
+            if self._session_cache is not None:
+                self._session_cache.set(
+                    self.base_url, self._username, self._password,
+                    self._token,
+                )
         elif not self._auth_method:
             pass
         else:
@@ -161,7 +219,10 @@ class TatlinClient(RestClient):
             }
         ).json
 
-        new_host = Host(client=self, **host_data)
+        new_host = self._identity_map.resolve(
+            Host, host_data.get('id'), host_data,
+            lambda: Host(client=self, **host_data),
+        )
         return new_host
 
     def create_host_group(
@@ -184,7 +245,10 @@ class TatlinClient(RestClient):
             }
         ).json
 
-        new_host_group = HostGroup(client=self, **host_group_data)
+        new_host_group = self._identity_map.resolve(
+            HostGroup, host_group_data.get('id'), host_group_data,
+            lambda: HostGroup(client=self, **host_group_data),
+        )
         return new_host_group
 
     def create_subnet(self, name, ip_start, ip_end):
@@ -198,7 +262,9 @@ class TatlinClient(RestClient):
             }
         ).json
 
-        return Task(client=self, **task_data)
+        return Task(
+            client=self, path=eps.DASHBOARD_SUBNETS_ENDPOINT, **task_data
+        )
 
     def create_user(
         self,
@@ -260,46 +326,89 @@ class TatlinClient(RestClient):
 
         return group
 
+    def gather_all(self, *calls):  # type: (*Callable[[], Any]) -> List[Any]
+        """Makes every call even if some of them fail and returns their
+        results in order.
+
+        Single error is raised as is, several errors are raised
+        together as TatlinMultipleErrors. Calls are made one by one,
+        ConcurrentTatlinClient makes them concurrently
+        """
+        results = []
+        errors = []
+        for call in calls:
+            try:
+                results.append(call())
+            except Exception:
+                results.append(None)
+                errors.append(sys.exc_info())
+
+        raise_errors(errors)
+        return results
+
     def get_pool(self, name):  # type: (str) -> Optional[Pool]
-        for pool in self.get_pools():
-            if pool.name == name:
-                return pool
-        return None
+        return self._find(inv.POOLS, name, self.get_pools)
 
     def get_pools(self):  # type: () -> List[Pool]
         rv = []
         for drive_group in self.get_drive_groups():
-            rv.extend(drive_group.get_pools())
+            rv.extend(drive_group.pools)
+        self._inventory.update(inv.POOLS, rv)
         return rv
 
+    def get_cached(self, collection):  # type: (str) -> Any
+        """Returns collection from the cache, it is loaded on cache miss"""
+        loaders = {
+            inv.POOLS: self.get_pools,
+            inv.DRIVE_GROUPS: self.get_drive_groups,
+            inv.HOSTS: self.get_hosts,
+            inv.HOST_GROUPS: self.get_host_groups,
+            inv.SUBNETS: self.get_subnets,
+            inv.PORTS: self.get_ports,
+            inv.USERS: self.get_users,
+            inv.USER_GROUPS: self.get_user_groups,
+            inv.RESOURCES: self.get_resources,
+            RESOURCES_MAPPING: lambda: self.get(
+                eps.PERSONALITIES_RESOURCE_MAPPING_ENDPOINT
+            ).json,
+        }
+
+        return self._cache.get_or_load(collection, loaders[collection])
+
     def get_dns_config(self):  # type: () -> DnsConfig
         return DnsConfig(client=self)
 
     def get_drive_groups(self):  # type: () -> List[DriveGroup]
         rv = []
         drive_groups_data = self.get(eps.HEALTH_MEDIAS_ENDPOINT).json
-        for group_data in drive_groups_data.values():
-            rv.append(DriveGroup(client=self, **group_data))
+
+        if drive_groups_data:
+            # All drive groups share single pools response
+            pools_data = self.get(eps.HEALTH_POOLS_ENDPOINT).json
+            for group_data in drive_groups_data.values():
+                rv.append(DriveGroup(
+                    client=self, pools_data=pools_data, **group_data
+                ))
+
+        self._inventory.update(inv.DRIVE_GROUPS, rv)
         return rv
 
     def get_drive_group(self, name):  # type: (str) -> Optional[DriveGroup]
-        for drive_group in self.get_drive_groups():
-            if drive_group.name == name:
-                return drive_group
-        return None
+        return self._find(inv.DRIVE_GROUPS, name, self.get_drive_groups)
 
     def get_hosts(self):  # type: () -> List[Host]
         rv = []
-        hosts_data = self.get(eps.PERSONALITIES_HOSTS_ENDPOINT).json
+        hosts_data = self.get_json_items(eps.PERSONALITIES_HOSTS_ENDPOINT)
         for host_data in hosts_data:
-            rv.append(Host(client=self, **host_data))
+            rv.append(self._identity_map.resolve(
+                Host, host_data.get('id'), host_data,
+                lambda: Host(client=self, **host_data),
+            ))
+        self._inventory.update(inv.HOSTS, rv)
         return rv
 
     def get_host(self, name):  # type: (str) -> Optional[Host]
-        for host in self.get_hosts():
-            if host.name == name:
-                return host
-        return None
+        return self._find(inv.HOSTS, name, self.get_hosts)
 
     def get_host_groups(self):  # type: () -> List[HostGroup]
         rv = []
@@ -309,15 +418,16 @@ class TatlinClient(RestClient):
         ).json
 
         for host_group_data in host_groups_data:
-            rv.append(HostGroup(client=self, **host_group_data))
+            rv.append(self._identity_map.resolve(
+                HostGroup, host_group_data.get('id'), host_group_data,
+                lambda: HostGroup(client=self, **host_group_data),
+            ))
 
+        self._inventory.update(inv.HOST_GROUPS, rv)
         return rv
 
     def get_host_group(self, name):  # type: (str) -> Optional[HostGroup]
-        for host_group in self.get_host_groups():
-            if host_group.name == name:
-                return host_group
-        return None
+        return self._find(inv.HOST_GROUPS, name, self.get_host_groups)
 
     def get_ldap_config(self):  # type: () -> LdapConfig
         if self._ldap_config is None:
@@ -329,8 +439,7 @@ class TatlinClient(RestClient):
         return NtpConfig(client=self)
 
     def get_port(self, name):  # type: (str) -> Port
-        ports = self.get_ports()
-        port = next((port for port in ports if port.name == name), None)
+        port = self._find(inv.PORTS, name, self.get_ports)
 
         if port is None:
             raise TatlinClientError(
@@ -343,22 +452,49 @@ class TatlinClient(RestClient):
         rv = []
         ports_data = self.get(eps.PORTS_STATUS_ENDPOINT).json
         for port_data in ports_data:
-            port = Port(client=self, port_data=port_data)
+            port = self._identity_map.resolve(
+                Port, port_data['id'], port_data,
+                lambda: Port(client=self, port_data=port_data),
+            )
             rv.append(port)
+        self._inventory.update(inv.PORTS, rv)
         return rv
 
     def get_resource(self, name):
         # type: (str) -> Optional[Union[ResourceBlock, ResourceFile]]
-        for resource in self.get_resources():
-            if resource.name == name:
-                return resource
-        return None
+        return self._find(inv.RESOURCES, name, self.get_resources)
+
+    def get_resource_mapping(self):  # type: () -> ResourceMapping
+        return ResourceMapping(
+            self.get_json_items(eps.PERSONALITIES_RESOURCE_MAPPING_ENDPOINT)
+        )
+
+    def get_cached_resource_mapping(self):  # type: () -> ResourceMapping
+        """Returns resource mapping index from the cache, it is shared
+        by resources, hosts and host groups"""
+        return self._cache.get_or_load(
+            RESOURCES_MAPPING,
+            lambda: ResourceMapping(self.get_cached(RESOURCES_MAPPING)),
+            key='index',
+        )
 
     def get_resources(self):
         # type: () -> List[Union[ResourceBlock, ResourceFile]]
         rv = []
-        for pool in self.get_pools():
-            rv.extend(pool.get_resources())
+        pools = self.get_pools()
+
+        if pools:
+            # Personalities are fetched once and split between pools
+            resources_by_pool = group_resources_by_pool(
+                self.get_json_items(eps.HEALTH_PERSONALITIES_ENDPOINT)
+            )
+
+            for pool in pools:
+                rv.extend(pool.get_resources(
+                    resources_data=resources_by_pool.get(pool.id, []),
+                ))
+
+        self._inventory.update(inv.RESOURCES, rv)
         return rv
 
     def get_smtp_config(self):  # type: () -> SmtpConfig
@@ -368,18 +504,17 @@ class TatlinClient(RestClient):
         return SnmpConfig(client=self)
 
     def get_subnet(self, name):  # type: (str) -> Optional[Subnet]
-        for subnet in self.get_subnets():
-            if subnet.name == name:
-                return subnet
-        return None
+        return self._find(inv.SUBNETS, name, self.get_subnets)
 
     def get_subnets(self):  # type: () -> List[Subnet]
-        Subnet.clear_cache()
-
         rv = []
         subnets_data = self.get(eps.PERSONALITIES_SUBNETS_ENDPOINT).json
         for subnet_data in subnets_data:
-            rv.append(Subnet(client=self, **subnet_data))
+            rv.append(self._identity_map.resolve(
+                Subnet, subnet_data.get('id'), subnet_data,
+                lambda: Subnet(client=self, **subnet_data),
+            ))
+        self._inventory.update(inv.SUBNETS, rv)
         return rv
 
     def get_syslog_config(self):  # type: () -> SyslogConfig
@@ -465,6 +600,7 @@ class TatlinClient(RestClient):
                 member_of=item['memberOf'],
             )
             rv.append(user)
+        self._inventory.update(inv.USERS, rv)
         return rv
 
     def get_user_group(self, name):  # type: (str) -> Optional[UserGroup]
@@ -499,13 +635,27 @@ class TatlinClient(RestClient):
             )
             rv.append(group)
 
+        self._inventory.update(inv.USER_GROUPS, rv)
         return rv
 
+    def invalidate_cache(self, *collections):  # type: (*str) -> None
+        """Drops passed collections (all by default) from both
+        the cache and the inventory snapshot"""
+        self._cache.invalidate(*collections)
+        self._inventory.invalidate(*collections)
+
+    def invalidate_inventory(self, *collections):  # type: (*str) -> None
+        """Makes getters fetch passed collections (all by default) again"""
+        self._inventory.invalidate(*collections)
+
     def logout(self):  # type: () -> None
         if self._token:
             self.post(eps.LOGOUT_ENDPOINT)
             self._token = None
 
+            if self._session_cache is not None:
+                self._session_cache.delete(self.base_url, self._username)
+
     def reboot_node(self, name):  # type: (str) -> None
         try:
             self.put(eps.REBOOT_ENDPOINT.format(node=name))
@@ -536,9 +686,80 @@ class TatlinClient(RestClient):
         )
 
     def upload_ssl_certificate(self, crt, key):
-        # type: (Union[str, bytes], Union[str, bytes]) -> None
+        # type: (Union[str, bytes, BinaryIO], Union[str, bytes, BinaryIO]) -> None
+        """Uploads certificate and key passed as content
+        or as binary file objects"""
         self.put(eps.CERTIFICATE_ENDPOINT, files={'crt': crt, 'key': key})
 
+    def wait_tasks(self, tasks, timeout=120):
+        # type: (Iterable[Task], int) -> Dict[int, str]
+        """Waits for all tasks and returns final state of every task
+        by task id. Tasks which were not finished in time have timeout
+        state, failed tasks don't raise errors
+        """
+        return TaskGroup(client=self, tasks=tasks).wait(timeout=timeout)
+
+    def make_request(
+        self,
+        path,  # type: str
+        method,  # type: str
+        query_params=None,  # type: Dict
+        body=None,  # type: Union[Dict, bytes]
+        headers=None,  # type: Dict
+        files=None,  # type: Dict[str, bytes]
+        stream=False,  # type: bool
+    ):  # type: (...) -> Union[RestResponse, StreamingResponse]
+
+        token = self._token
+        try:
+            response = super(TatlinClient, self).make_request(
+                path,
+                method,
+                query_params=query_params,
+                body=body,
+                headers=headers,
+                files=files,
+                stream=stream,
+            )
+        except RESTClientUnauthorized:
+            # Token from the session cache could expire on Tatlin side
+            # before it expired in the cache
+            if self._session_cache is None or token is None \
+                    or path == self._login_path:
+                raise
+
+            self._relogin(token)
+            response = super(TatlinClient, self).make_request(
+                path,
+                method,
+                query_params=query_params,
+                body=body,
+                headers=headers,
+                files=files,
+                stream=stream,
+            )
+
+        # Only collections which could be changed by the request
+        # are dropped, the rest of cached data is still valid
+        if method != 'GET':
+            collections = get_affected_collections(path)
+            if collections:
+                self.invalidate_cache(*collections)
+
+        return response
+
+    @property
+    def cache(self):  # type: () -> TTLCache
+        return self._cache
+
+    @property
+    def identity_map(self):  # type: () -> IdentityMap
+        return self._identity_map
+
+    @property
+    def inventory(self):  # type: () -> TatlinInventory
+        return self._inventory
+
     @property
     def system_name(self):  # type: () -> str
         if self._system_name is None:
@@ -551,6 +772,24 @@ class TatlinClient(RestClient):
             self._system_version = self._get_system_version()
         return self._system_version
 
+    def _find(self, collection, name, loader):
+        # type: (str, str, Callable[[], List[Any]]) -> Optional[Any]
+        if not self._inventory.is_loaded(collection):
+            # Loader result is used explicitly instead of relying on that
+            # loader updates inventory itself, so any list getter may be used
+            self._inventory.update(collection, loader())
+        return self._inventory.get_by_name(collection, name)
+
+    def _relogin(self, expired_token):  # type: (str) -> None
+        with self._auth_lock:
+            # Another thread could have already logged in again
+            if self._token != expired_token:
+                return
+
+            self._session_cache.delete(self.base_url, self._username)
+            self._token = None
+            self.authorize()
+
     def _get_system_name(self):
         data = self.get(eps.SYSTEM_NAME_ENDPOINT).json
         try:
@@ -15,9 +15,9 @@ from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.except
 )
 
 try:
-    from typing import Dict, List
+    from typing import Any, Dict, List, Optional
 except ImportError:
-    Dict = List = None
+    Any = Dict = List = Optional = None
 
 
 ISCSI_AUTH_TYPES = ('none', 'oneway', 'mutual')
@@ -140,3 +140,36 @@ def generate_resource_name_template(suffixes):  # type: (List[str]) -> str
                 template += current_suffix + ','
 
     return template
+
+
+def apply_changes(obj, response=None, changes=None):
+    # type: (Any, Any, Optional[Dict]) -> None
+    """Updates object data after a changing request.
+
+    In write-through mode of the client the object takes its data
+    from response if Tatlin sent the object back, or merges changes
+    if they fully describe the result. Objects without stored raw data
+    (e.g. configs) take changes as they are. Otherwise, and when
+    write-through is disabled, the object is loaded again.
+    """
+    if obj._client.write_through:
+        echoed = None
+        if response is not None:
+            try:
+                echoed = response.json
+            except ValueError:
+                pass
+
+        if isinstance(echoed, dict) and hasattr(obj, 'id') \
+                and echoed.get('id') == obj.id:
+            obj._set_data(echoed)
+            return
+
+        if changes is not None:
+            data = getattr(obj, '_data', None)
+            obj._set_data(
+                dict(data, **changes) if data is not None else changes
+            )
+            return
+
+    obj.load()
@@ -10,13 +10,30 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 try:
-    from typing import Dict, List, Sequence
+    from typing import Any, Callable, Dict, List, Sequence
 except ImportError:
-    Dict = List = Sequence = None
+    Any = Callable = Dict = List = Sequence = None
+
+from functools import partial
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.connection import Connection
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.tatlin_client import TatlinClient
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.concurrent_client import ConcurrentTatlinClient
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.session_cache import (
+    DEFAULT_SESSION_TTL, SessionCache,
+)
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinAuthorizationError
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.failover import (
+    FailoverMiddleware, get_host,
+)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.metrics import MetricsMiddleware
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import RetryMiddleware
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.response_cache import ConditionalCacheMiddleware
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.retry import RetryPolicy
+
+
+DEFAULT_COALESCE_WINDOW = 0
 
 
 class TatlinModule(AnsibleModule):
@@ -28,14 +45,20 @@ class TatlinModule(AnsibleModule):
         required_if=None,
         required_one_of=None,
         mutually_exclusive=None,
+        supports_parallelism=False,
     ):
-        # type: (Dict, bool, Sequence, Sequence, Sequence) -> None
+        # type: (Dict, bool, Sequence, Sequence, Sequence, bool) -> None
         _argument_spec = {
             "connection": {
-                "required": True,
+                "required": False,
                 "type": "dict",
                 "options": {
                     "base_url": {"required": True, "type": "str"},
+                    "management_addresses": {
+                        "required": False,
+                        "type": "list",
+                        "elements": "str",
+                    },
                     "username": {"required": False, "type": "str"},
                     "password": {
                         "required": False,
@@ -52,9 +75,72 @@ class TatlinModule(AnsibleModule):
                         "type": "int",
                         "default": 60,
                     },
+                    "keep_alive": {
+                        "required": False,
+                        "type": "bool",
+                        "default": False,
+                    },
+                    "retries": {
+                        "required": False,
+                        "type": "int",
+                        "default": 0,
+                    },
+                    "coalesce_window": {
+                        "required": False,
+                        "type": "float",
+                        "default": DEFAULT_COALESCE_WINDOW,
+                    },
+                    "stream_json": {
+                        "required": False,
+                        "type": "bool",
+                        "default": False,
+                    },
+                    "write_through": {
+                        "required": False,
+                        "type": "bool",
+                        "default": False,
+                    },
+                    "session_cache": {
+                        "required": False,
+                        "type": "bool",
+                        "default": False,
+                    },
+                    "session_cache_path": {
+                        "required": False,
+                        "type": "path",
+                    },
+                    "session_cache_ttl": {
+                        "required": False,
+                        "type": "int",
+                        "default": DEFAULT_SESSION_TTL,
+                    },
+                    "response_cache": {
+                        "required": False,
+                        "type": "bool",
+                        "default": False,
+                    },
+                    "response_cache_path": {
+                        "required": False,
+                        "type": "path",
+                    },
                 }
             },
+            "debug_metrics": {
+                "required": False,
+                "type": "bool",
+                "default": False,
+            },
+            "debug_metrics_path": {
+                "required": False,
+                "type": "path",
+            },
         }
+        if supports_parallelism:
+            _argument_spec['parallelism'] = {
+                "required": False,
+                "type": "int",
+                "default": 1,
+            }
         if argument_spec and isinstance(argument_spec, dict):
             _argument_spec.update(argument_spec)
 
@@ -67,15 +153,78 @@ class TatlinModule(AnsibleModule):
         )
 
         connection = self.params['connection']
+        if self._socket_path is not None:
+            # Session and connections to Tatlin are owned
+            # by httpapi connection plugin for the whole play
+            client_kwargs = dict(
+                base_url=(connection or {}).get('base_url') or 'localhost',
+                auth_method=None,
+                connection=Connection(self._socket_path),
+            )
+        elif connection is None:
+            self.fail_json(
+                msg='connection parameter is required '
+                    'if httpapi connection is not used',
+            )
+        else:
+            client_kwargs = dict(
+                base_url=connection['base_url'],
+                username=connection['username'],
+                password=connection['password'],
+                validate_certs=connection['validate_certs'],
+                timeout=connection['timeout'],
+                keep_alive=connection['keep_alive'],
+                stream_json=connection['stream_json'],
+                session_cache=SessionCache(
+                    path=connection['session_cache_path'],
+                    ttl=connection['session_cache_ttl'],
+                ) if connection['session_cache'] else None,
+            )
+
+        middlewares = []
+        if self._socket_path is None and connection['response_cache']:
+            # Cache goes first, so responses from it skip other middlewares
+            middlewares.append(ConditionalCacheMiddleware(
+                base_url=connection['base_url'],
+                username=connection['username'],
+                path=connection['response_cache_path'],
+            ))
+
+        retries = (connection or {}).get('retries')
+        if retries:
+            middlewares.append(RetryMiddleware(
+                RetryPolicy(max_attempts=retries + 1),
+            ))
+
+        if self._socket_path is None and connection['management_addresses']:
+            middlewares.append(FailoverMiddleware(
+                [get_host(connection['base_url'])]
+                + connection['management_addresses'],
+            ))
 
-        self.tatlin = TatlinClient(
-            base_url=connection['base_url'],
-            username=connection['username'],
-            password=connection['password'],
-            validate_certs=connection['validate_certs'],
-            timeout=connection['timeout'],
+        # Metrics go after retries and failover,
+        # so every attempt is recorded
+        self.metrics = None
+        if self.params['debug_metrics'] or self.params['debug_metrics_path']:
+            self.metrics = MetricsMiddleware()
+            middlewares.append(self.metrics)
+
+        client_kwargs['middlewares'] = middlewares
+        client_kwargs['coalesce_window'] = (connection or {}).get(
+            'coalesce_window', DEFAULT_COALESCE_WINDOW,
+        )
+        client_kwargs['write_through'] = bool(
+            (connection or {}).get('write_through'),
         )
 
+        self.parallelism = self.params.get('parallelism') or 1
+        if self.parallelism > 1:
+            self.tatlin = ConcurrentTatlinClient(
+                max_concurrency=self.parallelism, **client_kwargs
+            )
+        else:
+            self.tatlin = TatlinClient(**client_kwargs)
+
         self.changed = False
 
         try:
@@ -95,18 +244,67 @@ class TatlinModule(AnsibleModule):
     def run(self):  # type: () -> None
         raise NotImplementedError('Method not implemented!')
 
+    def gather(self, *calls):  # type: (*Callable[[], Any]) -> List[Any]
+        """Runs independent calls and returns their results in order.
+
+        Calls are made concurrently if parallelism is greater than 1
+        """
+        if isinstance(self.tatlin, ConcurrentTatlinClient):
+            return self.tatlin.gather(*calls)
+        return [call() for call in calls]
+
+    def prefetch(self, *collections):  # type: (*str) -> None
+        """Loads collections to the client cache concurrently.
+
+        Does nothing if parallelism is disabled,
+        collections are loaded lazily then
+        """
+        if self.parallelism > 1:
+            self.gather(*[
+                partial(self.tatlin.get_cached, collection)
+                for collection in collections
+            ])
+
     def exit_json(self, **kwargs):
         self._logout()
+        self._report_metrics(kwargs)
         super(TatlinModule, self).exit_json(**kwargs)
 
     def fail_json(self, **kwargs):
         self._logout()
+        self._report_metrics(kwargs)
         super(TatlinModule, self).fail_json(**kwargs)
 
+    def _report_metrics(self, result):  # type: (Dict) -> None
+        metrics = getattr(self, 'metrics', None)
+        if metrics is None:
+            return
+
+        if self.params['debug_metrics']:
+            result['debug_metrics'] = metrics.summary()
+
+        path = self.params['debug_metrics_path']
+        if path:
+            try:
+                metrics.dump(path)
+            except (IOError, OSError) as e:
+                self.warn('Unable to write metrics to {0}: {1}'.format(
+                    path, e,
+                ))
+
     def _logout(self):
+        tatlin = getattr(self, 'tatlin', None)
+        if tatlin is None:
+            return
+
+        connection = self.params['connection'] or {}
         try:
-            self.tatlin.logout()
+            # Cached session is reused by the next tasks
+            if not connection.get('session_cache'):
+                tatlin.logout()
         except Exception as e:
             self.warn(
                 'Logout failed. {0}: {1}'.format(type(e).__name__, e)
             )
+
+        tatlin.close()
@@ -22,6 +22,7 @@ description:
 author: "Sergey Kovalev (@kvlvs)"
 extends_documentation_fragment:
   - yadro.tatlin_uni.connection_options
+  - yadro.tatlin_uni.parallelism
 """
 
 RETURN = r"""
@@ -64,6 +65,8 @@ EXAMPLES = r"""
 """
 
 
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.cache import RESOURCES_MAPPING
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_module import TatlinModule
 
 
@@ -72,13 +75,24 @@ class TatlinHostGroupsInfoModule(TatlinModule):
     def __init__(self):
         super(TatlinHostGroupsInfoModule, self).__init__(
             supports_check_mode=True,
+            supports_parallelism=True,
         )
 
     def run(self):
+        # Every host group reads the same resources and mapping index,
+        # so they are loaded once before host groups are processed
+        self.prefetch(inv.RESOURCES, RESOURCES_MAPPING)
+        self.tatlin.get_cached_resource_mapping()
+
+        host_groups = self.tatlin.get_host_groups()
+        host_groups_resources = self.gather(
+            *[host_group.get_resources for host_group in host_groups]
+        )
+
         host_groups_info = [{
             'name': host_group.name,
             'tags': host_group.tags,
-            'resources': [r.name for r in host_group.get_resources()],
+            'resources': [r.name for r in resources],
             'hosts': [{
                 'name': host.name,
                 'port_type': host.port_type,
@@ -86,7 +100,7 @@ class TatlinHostGroupsInfoModule(TatlinModule):
                 'ports': host.ports,
                 'tags': host.tags,
             } for host in host_group.hosts],
-        } for host_group in self.tatlin.get_host_groups()]
+        } for host_group, resources in zip(host_groups, host_groups_resources)]
 
         self.exit_json(
             msg="Operation successful.",
@@ -22,6 +22,7 @@ description:
 author: "Sergey Kovalev (@kvlvs)"
 extends_documentation_fragment:
   - yadro.tatlin_uni.connection_options
+  - yadro.tatlin_uni.parallelism
 """
 
 RETURN = r"""
@@ -68,6 +69,8 @@ EXAMPLES = r"""
 """
 
 
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.cache import RESOURCES_MAPPING
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_module import TatlinModule
 
 
@@ -76,17 +79,28 @@ class TatlinHostsInfoModule(TatlinModule):
     def __init__(self):
         super(TatlinHostsInfoModule, self).__init__(
             supports_check_mode=True,
+            supports_parallelism=True,
         )
 
     def run(self):
+        # Every host reads the same resources and mapping index,
+        # so they are loaded once before hosts are processed
+        self.prefetch(inv.RESOURCES, RESOURCES_MAPPING)
+        self.tatlin.get_cached_resource_mapping()
+
+        hosts = self.tatlin.get_hosts()
+        hosts_resources = self.gather(
+            *[host.get_resources for host in hosts]
+        )
+
         hosts_info = [{
             'name': host.name,
             'port_type': host.port_type,
             'auth': host.auth,
             'ports': host.ports,
             'tags': host.tags,
-            'resources': [r.name for r in host.get_resources()],
-        } for host in self.tatlin.get_hosts()]
+            'resources': [r.name for r in resources],
+        } for host, resources in zip(hosts, hosts_resources)]
 
         self.exit_json(
             msg="Operation successful.",
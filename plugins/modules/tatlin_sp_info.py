@@ -23,6 +23,7 @@ description:
 author: "Sergey Kovalev (@kvlvs)"
 extends_documentation_fragment:
   - yadro.tatlin_uni.connection_options
+  - yadro.tatlin_uni.parallelism
 """
 
 RETURN = r"""
@@ -134,21 +135,36 @@ class TatlinInfoModule(TatlinModule):
     def __init__(self):
         super(TatlinInfoModule, self).__init__(
             supports_check_mode=True,
+            supports_parallelism=True,
         )
 
     def run(self):
-        system_state = self.tatlin.get_system_state()
+        (
+            system_state, system_name, system_version, ports_info,
+            ldap_info, ntp_info, snmp_info, smtp_info, dns_info, syslog_info,
+        ) = self.gather(
+            self.tatlin.get_system_state,
+            lambda: self.tatlin.system_name,
+            lambda: self.tatlin.system_version,
+            self.get_ports_info,
+            self.get_ldap_info,
+            self.get_ntp_info,
+            self.get_snmp_info,
+            self.get_smtp_info,
+            self.get_dns_info,
+            self.get_syslog_info,
+        )
 
         tatlin_info = {
-            'system_name': self.tatlin.system_name,
-            'system_version': self.tatlin.system_version,
-            'ports': self.get_ports_info(),
-            'ldap': self.get_ldap_info(),
-            'ntp': self.get_ntp_info(),
-            'snmp': self.get_snmp_info(),
-            'smtp': self.get_smtp_info(),
-            'dns': self.get_dns_info(),
-            'syslog': self.get_syslog_info(),
+            'system_name': system_name,
+            'system_version': system_version,
+            'ports': ports_info,
+            'ldap': ldap_info,
+            'ntp': ntp_info,
+            'snmp': snmp_info,
+            'smtp': smtp_info,
+            'dns': dns_info,
+            'syslog': syslog_info,
             'state_security': system_state['security'],
             'state_storage': system_state['storage'],
             'state_hardware': system_state['hardware'],
@@ -22,6 +22,7 @@ description:
 author: "Sergey Kovalev (@kvlvs)"
 extends_documentation_fragment:
   - yadro.tatlin_uni.connection_options
+  - yadro.tatlin_uni.parallelism
 notes:
   - All capacity values are returned in bytes size
 """
@@ -95,6 +96,10 @@ EXAMPLES = r"""
 """
 
 
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.cache import RESOURCES_MAPPING
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.resource import group_resources_by_pool
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_module import TatlinModule
 
 
@@ -103,14 +108,36 @@ class TatlinPoolsInfoModule(TatlinModule):
     def __init__(self):
         super(TatlinPoolsInfoModule, self).__init__(
             supports_check_mode=True,
+            supports_parallelism=True,
         )
 
     def run(self):
+        # Collections used by resources properties
+        self.prefetch(
+            inv.PORTS, inv.HOSTS, inv.HOST_GROUPS,
+            inv.USERS, inv.USER_GROUPS, RESOURCES_MAPPING,
+        )
+
+        # Personalities are fetched once and split between pools
+        pools, resources_data = self.gather(
+            self.tatlin.get_pools,
+            lambda: list(self.tatlin.get_json_items(
+                eps.HEALTH_PERSONALITIES_ENDPOINT
+            )),
+        )
+        resources_by_pool = group_resources_by_pool(resources_data)
+        pools_resources = [
+            pool.get_resources(
+                resources_data=resources_by_pool.get(pool.id, []),
+            )
+            for pool in pools
+        ]
+
         pools_info = [{
             'name': pool.name,
             'provision': pool.provision,
             'status': pool.status,
-            'resources_count': len(pool.get_resources()),
+            'resources_count': len(resources),
             'capacity_total': pool.capacity_total,
             'capacity_available': pool.capacity_available,
             'capacity_used': pool.capacity_used,
@@ -135,8 +162,8 @@ class TatlinPoolsInfoModule(TatlinModule):
                 'host_groups': [group.name for group in resource.host_groups],
                 'users': [user.name for user in resource.users],
                 'user_groups': [group.name for group in resource.user_groups]
-            } for resource in pool.get_resources()],
-        } for pool in self.tatlin.get_pools()]
+            } for resource in resources],
+        } for pool, resources in zip(pools, pools_resources)]
 
         self.exit_json(
             msg="Operation successful.",
@@ -22,6 +22,7 @@ description:
 author: "Sergey Kovalev (@kvlvs)"
 extends_documentation_fragment:
   - yadro.tatlin_uni.connection_options
+  - yadro.tatlin_uni.parallelism
 notes:
   - All capacity values are returned in bytes size
 """
@@ -96,6 +97,8 @@ EXAMPLES = r"""
 """
 
 
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.cache import RESOURCES_MAPPING
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_module import TatlinModule
 
 
@@ -104,9 +107,16 @@ class TatlinResourcesInfoModule(TatlinModule):
     def __init__(self):
         super(TatlinResourcesInfoModule, self).__init__(
             supports_check_mode=True,
+            supports_parallelism=True,
         )
 
     def run(self):
+        # Resources and collections used by their properties
+        self.prefetch(
+            inv.RESOURCES, inv.PORTS, inv.HOSTS, inv.HOST_GROUPS,
+            inv.SUBNETS, inv.USERS, inv.USER_GROUPS, RESOURCES_MAPPING,
+        )
+
         resources_info = [{
             'name': resource.name,
             'type': resource.type,
@@ -129,7 +139,7 @@ class TatlinResourcesInfoModule(TatlinModule):
                 'name': group.name,
                 'permissions': resource.get_user_group_permissions(group),
             } for group in resource.user_groups],
-        } for resource in self.tatlin.get_resources()]
+        } for resource in self.tatlin.get_cached(inv.RESOURCES)]
 
         self.exit_json(
             msg="Operation successful.",
@@ -109,19 +109,25 @@ class TatlinSslModule(TatlinModule):
         )
 
     def run(self):
-        crt = self.get_cert_content()
-        key = self.get_key_content()
-
-        if not self.check_mode:
-            self.tatlin.upload_ssl_certificate(crt, key)
+        crt = key = None
+
+        try:
+            crt = self.get_cert_content()
+            key = self.get_key_content()
+            if not self.check_mode:
+                self.tatlin.upload_ssl_certificate(crt, key)
+        finally:
+            for content in (crt, key):
+                if hasattr(content, 'close'):
+                    content.close()
 
         self.exit_json(msg='Operation successful', changed=True)
 
+    # Files are opened in binary mode and sent by chunks,
+    # so their content is uploaded as is
     def get_cert_content(self):
         if self.params['crt_path']:
-            with open(self.params['crt_path'], encoding='utf-8') as f:
-                crt_content = f.read()
-            return crt_content
+            return open(self.params['crt_path'], 'rb')
         elif self.params['crt_content']:
             return self.params['crt_content']
         else:
@@ -133,9 +139,7 @@ class TatlinSslModule(TatlinModule):
 
     def get_key_content(self):
         if self.params['key_path']:
-            with open(self.params['key_path'], encoding='utf-8') as f:
-                crt_content = f.read()
-            return crt_content
+            return open(self.params['key_path'], 'rb')
         elif self.params['key_content']:
             return self.params['key_content']
 
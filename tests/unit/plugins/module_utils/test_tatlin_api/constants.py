@@ -6,6 +6,11 @@ TATLIN_API_CLIENT_CLASS = TATLIN_API_CLIENT_MODULE + '.TatlinClient'
 REST_CLIENT_MODULE = TATLIN_API_PACKAGE + '.rest_client'
 REST_CLIENT_CLASS = REST_CLIENT_MODULE + '.RestClient'
 OPEN_URL_FUNC = REST_CLIENT_MODULE + '.open_url'
+CONNECTION_POOL_CLASS = TATLIN_API_PACKAGE + '.connection_pool.ConnectionPool'
+CACHE_MODULE = TATLIN_API_PACKAGE + '.cache'
+SESSION_CACHE_MODULE = TATLIN_API_PACKAGE + '.session_cache'
+RETRY_MODULE = TATLIN_API_PACKAGE + '.retry'
+RESPONSE_CACHE_MODULE = TATLIN_API_PACKAGE + '.response_cache'
 
 
 MODELS_PACKAGE = TATLIN_API_PACKAGE + '.models'
@@ -37,3 +42,4 @@ SMTP_CONFIG_CLASS = MODELS_PACKAGE + '.smtp.SmtpConfig'
 SYSLOG_CONFIG_CLASS = MODELS_PACKAGE + '.syslog.SyslogConfig'
 
 SUBNET_CLASS = MODELS_PACKAGE + '.subnet.Subnet'
+TASK_MODULE = MODELS_PACKAGE + '.task'
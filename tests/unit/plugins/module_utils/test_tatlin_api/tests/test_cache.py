@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.cache import (
+    TTLCache, COLLECTIONS, RESOURCES_MAPPING, get_affected_collections,
+)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory import (
+    HOSTS, HOST_GROUPS, PORTS, RESOURCES,
+)
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    CACHE_MODULE, OPEN_URL_FUNC,
+)
+
+
+class TestCache:
+
+    def test_ttl(self, make_mock):
+        time_mock = make_mock(CACHE_MODULE + '.time.time', return_value=100)
+        cache = TTLCache(ttls={HOSTS: 10})
+
+        # Put hosts and ports to cache
+        cache.set(HOSTS, ['host'])
+        cache.set(PORTS, ['port'])
+
+        # Result: Hosts expire after their own ttl
+        time_mock.return_value = 109
+        assert cache.get(HOSTS) == ['host']
+        time_mock.return_value = 111
+        assert cache.get(HOSTS) is None
+
+        # Result: Ports are still valid
+        assert cache.get(PORTS) == ['port']
+
+    def test_maxsize(self):
+        cache = TTLCache(maxsize=2)
+
+        # Put three entries to one collection
+        cache.set(HOSTS, 1, key='a')
+        cache.set(HOSTS, 2, key='b')
+        cache.get(HOSTS, key='a')
+        cache.set(HOSTS, 3, key='c')
+
+        # Result: Least recently used entry was evicted
+        assert cache.get(HOSTS, key='a') == 1
+        assert cache.get(HOSTS, key='b') is None
+        assert cache.get(HOSTS, key='c') == 3
+
+    def test_affected_collections(self):
+        # Result: The longest matching prefix is used
+        assert get_affected_collections(
+            eps.PERSONALITIES_HOSTS_ENDPOINT + '/host1'
+        ) == (HOSTS, HOST_GROUPS, RESOURCES_MAPPING)
+        assert get_affected_collections(
+            eps.PERSONALITIES_AUTH_ENDPOINT
+        ) == (RESOURCES,)
+        assert get_affected_collections(eps.LOGOUT_ENDPOINT) == ()
+
+        # Result: Unknown endpoint affects everything
+        assert get_affected_collections('unknown/endpoint') == COLLECTIONS
+
+    def test_write_invalidates_affected_collections(
+        self, tatlin, make_mock,
+    ):
+        # Fill cache and inventory
+        tatlin.cache.set(HOSTS, ['host'])
+        tatlin.cache.set(PORTS, ['port'])
+        tatlin.inventory.update(PORTS, [])
+
+        # Change host on Tatlin
+        make_mock(OPEN_URL_FUNC)
+        tatlin.put(eps.PERSONALITIES_HOSTS_ENDPOINT, body={})
+
+        # Result: Only hosts were dropped
+        assert tatlin.cache.get(HOSTS) is None
+        assert tatlin.cache.get(PORTS) == ['port']
+        assert tatlin.inventory.is_loaded(PORTS)
+
+    def test_cache_is_per_client(self, tatlin):
+        other = type(tatlin)(base_url='otherhost')
+
+        # Put hosts to cache of one client
+        tatlin.cache.set(HOSTS, ['host'])
+
+        # Result: Another client doesn't see them
+        assert other.cache.get(HOSTS) is None
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import threading
+import time
+import pytest
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.concurrent_client import ConcurrentTatlinClient
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinMultipleErrors
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import OPEN_URL_FUNC
+
+
+def make_response(data):
+    response = MagicMock()
+    response.read.return_value = json.dumps(data)
+    return response
+
+
+class TestConcurrentClient:
+
+    def test_gather_concurrently(self, make_mock):
+        tatlin = ConcurrentTatlinClient(base_url='localhost', max_concurrency=3)
+        barrier = threading.Barrier(3, timeout=5)
+
+        def open_url(url, **kwargs):
+            # Every request waits for the others,
+            # so serial requests would break the barrier
+            barrier.wait()
+            return make_response({'url': url})
+
+        make_mock(OPEN_URL_FUNC, side_effect=open_url)
+
+        # Get three endpoints at once
+        results = tatlin.gather(
+            lambda: tatlin.get('first').json,
+            lambda: tatlin.get('second').json,
+            lambda: tatlin.get('third').json,
+        )
+
+        # Result: Results are returned in calls order
+        assert [r['url'] for r in results] == [
+            'https://localhost/first',
+            'https://localhost/second',
+            'https://localhost/third',
+        ]
+
+    def test_gather_is_bounded(self, make_mock):
+        tatlin = ConcurrentTatlinClient(base_url='localhost', max_concurrency=2)
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def open_url(url, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return make_response({})
+
+        make_mock(OPEN_URL_FUNC, side_effect=open_url)
+
+        # Make nested gathers with many requests
+        tatlin.gather(*[
+            lambda: tatlin.gather(
+                lambda: tatlin.get('a'), lambda: tatlin.get('b'),
+            )
+            for i in range(4)
+        ])
+
+        # Result: Requests in flight never exceeded the limit
+        assert max_in_flight[0] <= 2
+
+    def test_gather_error(self, make_mock):
+        tatlin = ConcurrentTatlinClient(base_url='localhost')
+
+        def fail(msg):
+            raise ValueError(msg)
+
+        # Result: Error of the first failed call is raised
+        with pytest.raises(ValueError, match='first'):
+            tatlin.gather(
+                lambda: 1,
+                lambda: fail('first'),
+                lambda: fail('second'),
+            )
+
+    @pytest.mark.parametrize('max_concurrency', [1, 4])
+    def test_gather_all_errors(self, max_concurrency):
+        tatlin = ConcurrentTatlinClient(
+            base_url='localhost', max_concurrency=max_concurrency,
+        )
+        made_calls = []
+
+        def fail(msg):
+            made_calls.append(msg)
+            raise ValueError(msg)
+
+        # Make calls which fail
+        with pytest.raises(TatlinMultipleErrors) as e:
+            tatlin.gather_all(
+                lambda: fail('first'),
+                lambda: made_calls.append('ok'),
+                lambda: fail('second'),
+            )
+
+        # Result: Every call was made
+        assert sorted(made_calls) == ['first', 'ok', 'second']
+
+        # Result: Errors were raised together in calls order
+        assert [str(error) for error in e.value.errors] == [
+            'first', 'second',
+        ]
+
+    def test_gather_all_single_error(self):
+        tatlin = ConcurrentTatlinClient(base_url='localhost')
+
+        def fail(msg):
+            raise ValueError(msg)
+
+        # Result: Single error is raised as is
+        with pytest.raises(ValueError, match='only'):
+            tatlin.gather_all(lambda: 1, lambda: fail('only'))
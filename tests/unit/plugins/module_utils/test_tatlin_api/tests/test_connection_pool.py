@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import socket
+import threading
+import pytest
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.connection_pool import ConnectionPool
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.tatlin_client import TatlinClient
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
+    RESTClientNotFoundError, RESTClientConnectionError,
+)
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    OPEN_URL_FUNC, CONNECTION_POOL_CLASS,
+)
+
+
+def make_connection(status=200, body=None, will_close=False, error=None):
+    response = MagicMock()
+    response.status = status
+    response.reason = 'reason'
+    response.msg = {}
+    response.will_close = will_close
+    response.read.return_value = json.dumps(body or {}).encode()
+
+    conn = MagicMock()
+    conn.getresponse.return_value = response
+    if error is not None:
+        conn.request.side_effect = error
+    return conn
+
+
+@pytest.fixture
+def tatlin_keep_alive():
+    return TatlinClient(
+        base_url='localhost',
+        username='admin',
+        password='admin',
+        keep_alive=True,
+    )
+
+
+class TestConnectionPool:
+
+    def test_connection_reused(self, tatlin_keep_alive, make_mock):
+        conn = make_connection(body={'id': 1})
+        new_connection_mock = make_mock(
+            CONNECTION_POOL_CLASS + '._new_connection', return_value=conn,
+        )
+        open_url_mock = make_mock(OPEN_URL_FUNC)
+
+        # Send two requests
+        tatlin_keep_alive.get('first')
+        data = tatlin_keep_alive.get('second').json
+
+        # Result: Single connection was opened and used for both requests
+        assert new_connection_mock.call_count == 1
+        assert conn.request.call_count == 2
+        assert data == {'id': 1}
+
+        # Result: open_url was not used
+        assert open_url_mock.call_count == 0
+
+    def test_connection_closed_by_server(self, tatlin_keep_alive, make_mock):
+        first_conn = make_connection(will_close=True)
+        second_conn = make_connection()
+        new_connection_mock = make_mock(
+            CONNECTION_POOL_CLASS + '._new_connection',
+            side_effect=[first_conn, second_conn],
+        )
+
+        # Send two requests
+        tatlin_keep_alive.get('first')
+        tatlin_keep_alive.get('second')
+
+        # Result: Connection was not returned to the pool
+        assert new_connection_mock.call_count == 2
+        first_conn.close.assert_called_once_with()
+
+    def test_stale_connection_retry(self, tatlin_keep_alive, make_mock):
+        stale_conn = make_connection()
+        new_conn = make_connection(body={'id': 2})
+        make_mock(
+            CONNECTION_POOL_CLASS + '._new_connection',
+            side_effect=[stale_conn, new_conn],
+        )
+
+        # Make pooled connection and break it
+        tatlin_keep_alive.get('first')
+        stale_conn.request.side_effect = socket.error('Connection reset')
+
+        # Result: Request was repeated with new connection
+        assert tatlin_keep_alive.get('second').json == {'id': 2}
+        stale_conn.close.assert_called_once_with()
+
+    def test_sent_post_not_repeated(self, tatlin_keep_alive, make_mock):
+        stale_conn = make_connection()
+        new_conn = make_connection()
+        make_mock(
+            CONNECTION_POOL_CLASS + '._new_connection',
+            side_effect=[stale_conn, new_conn],
+        )
+
+        # Make pooled connection which fails after request was written
+        tatlin_keep_alive.get('first')
+        stale_conn.getresponse.side_effect = socket.error('Connection reset')
+
+        # Result: Written POST request was not repeated
+        with pytest.raises(RESTClientConnectionError):
+            tatlin_keep_alive.post('second', body={'key': 'value'})
+        assert new_conn.request.call_count == 0
+
+    def test_sent_get_repeated(self, tatlin_keep_alive, make_mock):
+        stale_conn = make_connection()
+        new_conn = make_connection(body={'id': 2})
+        make_mock(
+            CONNECTION_POOL_CLASS + '._new_connection',
+            side_effect=[stale_conn, new_conn],
+        )
+
+        # Make pooled connection which fails after request was written
+        tatlin_keep_alive.get('first')
+        stale_conn.getresponse.side_effect = socket.error('Connection reset')
+
+        # Result: Idempotent request was repeated with new connection
+        assert tatlin_keep_alive.get('second').json == {'id': 2}
+
+    def test_ssl_context_created_once(self, make_mock):
+        pool = ConnectionPool(validate_certs=False)
+        barrier = threading.Barrier(4, timeout=5)
+        contexts = []
+
+        def get_context():
+            barrier.wait()
+            contexts.append(pool._get_ssl_context())
+
+        # Get context from several threads at once
+        threads = [threading.Thread(target=get_context) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Result: All threads got the same context
+        assert len(contexts) == 4
+        assert all(context is contexts[0] for context in contexts)
+
+    def test_idle_connection_evicted(self, tatlin_keep_alive, make_mock):
+        old_conn = make_connection()
+        new_conn = make_connection()
+        make_mock(
+            CONNECTION_POOL_CLASS + '._new_connection',
+            side_effect=[old_conn, new_conn],
+        )
+
+        # Make pooled connection and expire it
+        tatlin_keep_alive.get('first')
+        tatlin_keep_alive._get_pool().idle_timeout = -1
+
+        # Send request
+        tatlin_keep_alive.get('second')
+
+        # Result: Expired connection was closed and new one was used
+        old_conn.close.assert_called_once_with()
+        assert old_conn.request.call_count == 1
+        assert new_conn.request.call_count == 1
+
+    def test_http_error(self, tatlin_keep_alive, make_mock):
+        make_mock(
+            CONNECTION_POOL_CLASS + '._new_connection',
+            return_value=make_connection(status=404),
+        )
+
+        # Result: Not found error was raised
+        with pytest.raises(RESTClientNotFoundError):
+            tatlin_keep_alive.get('missing')
+
+    def test_connection_error(self, tatlin_keep_alive, make_mock):
+        make_mock(
+            CONNECTION_POOL_CLASS + '._new_connection',
+            return_value=make_connection(error=socket.error('refused')),
+        )
+
+        # Result: Connection error was raised
+        with pytest.raises(RESTClientConnectionError):
+            tatlin_keep_alive.get('unreachable')
+
+    def test_close(self, tatlin_keep_alive, make_mock):
+        conn = make_connection()
+        make_mock(
+            CONNECTION_POOL_CLASS + '._new_connection', return_value=conn,
+        )
+
+        # Make pooled connection and close client
+        tatlin_keep_alive.get('first')
+        tatlin_keep_alive.close()
+
+        # Result: Idle connection was closed
+        conn.close.assert_called_once_with()
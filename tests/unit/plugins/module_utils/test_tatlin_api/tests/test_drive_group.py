@@ -325,3 +325,71 @@ class TestDrives:
 
         # Result: Drive group pools are not empty
         assert len(pools) > 0
+
+    def test_pools_fetched_once(
+        self, tatlin, make_mock, drives_groups_data, pools_data
+    ):
+        # Add second drive group which shares pools response
+        second_group = json.loads(json.dumps(
+            drives_groups_data['HDD_209715200']))
+        second_group.update(id='SSD_209715200', model='SSD_209715200')
+        drives_groups_data['SSD_209715200'] = second_group
+
+        # Mock open_url with drive groups and pools data
+        open_url_mock = make_mock(
+            OPEN_URL_FUNC,
+            return_value=[drives_groups_data, pools_data],
+            chain_calls=True,
+        )
+
+        # Get pools
+        pools = tatlin.get_pools()
+
+        # Result: Drive groups and pools were fetched once each
+        assert open_url_mock.call_count == 2
+
+        # Result: Pool is the same object which drives refer to
+        assert len(pools) == 1
+        assert pools[0].drives[0].pool is pools[0]
+
+    def test_drives_assigned_to_pools(
+        self, tatlin, make_mock, drives_groups_data, pools_data
+    ):
+        # Add drive which is not used by any pool
+        drives = drives_groups_data['HDD_209715200']['disks']
+        free_drive = dict(drives[0], id='free_drive_id')
+        drives.append(free_drive)
+
+        # Add second pool which lists the same drive after the first one
+        second_pool = dict(pools_data[0], id='second_pool_id')
+        pools_data.append(second_pool)
+
+        # Mock open_url with drive groups and pools data
+        make_mock(
+            OPEN_URL_FUNC,
+            return_value=[drives_groups_data, pools_data],
+            chain_calls=True,
+        )
+
+        # Get drive group
+        drive_group = tatlin.get_drive_groups()[0]
+        used_drive, free_drive = drive_group.drives
+
+        # Result: Drive was assigned to the first pool which lists it
+        assert used_drive.pool is drive_group.pools[0]
+
+        # Result: Drive which is not listed by pools has no pool
+        assert free_drive.pool is None
+
+        # Mock open_url with pool data which lists free drive only
+        pool = drive_group.pools[0]
+        make_mock(
+            OPEN_URL_FUNC,
+            return_value=dict(pools_data[0], disks_list=['free_drive_id']),
+        )
+
+        # Reload pool
+        pool.load()
+
+        # Result: Pool drives were taken from reloaded data
+        assert pool.drives == [free_drive]
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import socket
+import pytest
+from ansible.module_utils.six.moves.urllib.error import URLError
+from ansible.module_utils.six.moves.urllib.parse import urlsplit
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
+    RESTClientConnectionError,
+)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.failover import FailoverMiddleware
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.port import ChangedHost
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    OPEN_URL_FUNC,
+)
+
+
+def make_response():
+    response = MagicMock()
+    response.read.return_value = b'{}'
+    return response
+
+
+def make_open_url(down_hosts):
+    def open_url(url, **kwargs):
+        if urlsplit(url).netloc in down_hosts:
+            raise URLError('down')
+        return make_response()
+    return open_url
+
+
+def get_hosts(open_url_mock):
+    return [urlsplit(c[1]['url']).netloc for c in open_url_mock.call_args_list]
+
+
+class TestFailover:
+
+    def test_reads_are_balanced(self, tatlin, mocker):
+        open_url_mock = mocker.patch(OPEN_URL_FUNC, side_effect=make_open_url([]))
+        tatlin.add_middleware(FailoverMiddleware(['localhost', 'https://sp1']))
+
+        # Make several GET requests
+        for i in range(4):
+            tatlin.get('some/path')
+
+        # Result: Requests were sent to both controllers in turn
+        assert get_hosts(open_url_mock) == ['localhost', 'sp1', 'localhost', 'sp1']
+
+    def test_write_fails_over(self, tatlin, mocker):
+        down = ['localhost']
+        open_url_mock = mocker.patch(OPEN_URL_FUNC, side_effect=make_open_url(down))
+        failover = FailoverMiddleware(['localhost', 'sp1'])
+        tatlin.add_middleware(failover)
+
+        # Make POST while active controller is down
+        tatlin.post('some/path', body={'a': 1})
+
+        # Result: Request was sent to the other controller, it became active
+        assert get_hosts(open_url_mock) == ['localhost', 'sp1']
+        assert failover.active_host == 'sp1'
+
+        # Make GET and POST again after the first controller is up
+        del down[:]
+        open_url_mock.reset_mock()
+        tatlin.get('some/path')
+        tatlin.post('some/path', body={'a': 1})
+
+        # Result: Failed controller is skipped during cooldown
+        assert get_hosts(open_url_mock) == ['sp1', 'sp1']
+
+    def test_timed_out_write_not_failed_over(self, tatlin, mocker):
+        def open_url(url, **kwargs):
+            # Request was sent, but response was not received in time
+            raise socket.timeout('timed out')
+
+        open_url_mock = mocker.patch(OPEN_URL_FUNC, side_effect=open_url)
+        failover = FailoverMiddleware(['localhost', 'sp1'])
+        tatlin.add_middleware(failover)
+
+        # Make POST which times out
+        with pytest.raises(RESTClientConnectionError):
+            tatlin.post('some/path', body={'a': 1})
+
+        # Result: Request was not sent to the other controller
+        assert get_hosts(open_url_mock) == ['localhost']
+
+        # Make GET which times out
+        open_url_mock.reset_mock()
+        with pytest.raises(RESTClientConnectionError):
+            tatlin.get('some/path')
+
+        # Result: Idempotent request was sent to both controllers
+        assert sorted(get_hosts(open_url_mock)) == ['localhost', 'sp1']
+
+    def test_all_down(self, tatlin, mocker):
+        mocker.patch(OPEN_URL_FUNC, side_effect=make_open_url(['localhost', 'sp1']))
+        tatlin.add_middleware(FailoverMiddleware(['localhost', 'sp1']))
+
+        # Result: Connection error is raised if no controller responds
+        with pytest.raises(RESTClientConnectionError):
+            tatlin.get('some/path')
+
+    def test_changed_host_bypass(self, tatlin, mocker):
+        open_url_mock = mocker.patch(
+            OPEN_URL_FUNC, side_effect=make_open_url(['10.0.0.9']),
+        )
+        tatlin.add_middleware(FailoverMiddleware(['localhost', 'sp1']))
+
+        # Make request while host is changed
+        with ChangedHost(tatlin)('10.0.0.9'):
+            with pytest.raises(RESTClientConnectionError):
+                tatlin.get('some/path')
+
+        # Result: Request was sent only to the changed host
+        assert get_hosts(open_url_mock) == ['10.0.0.9']
@@ -9,14 +9,17 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import json
 import pytest
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.host import Host
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.resource import ResourceBlock
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
     TatlinClientError,
 )
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
-    HOST_CLASS,
+    HOST_CLASS, TATLIN_API_CLIENT_CLASS,
 )
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.utils import (
     check_called_with,
@@ -267,6 +270,82 @@ class TestHost:
         assert host.tags == ['tag1', 'tag2']
         assert host.username == 'hostname'
 
+    def test_host_get_resources(self, tatlin, make_mock):
+        # Create Host object
+        host = Host(client=tatlin, id='host_id')
+
+        # Mock open_url response with resource mapping
+        open_url_mock = make_mock(OPEN_URL_FUNC, return_value=[
+            {'resource_id': 'res2', 'host_id': 'host_id'},
+            {'resource_id': 'res1', 'host_id': 'another_host_id'},
+            {'resource_id': 'res3', 'host_group_id': 'host_id'},
+            {'resource_id': 'res1', 'host_id': 'host_id'},
+        ])
+
+        # Mock get_resources
+        make_mock(
+            TATLIN_API_CLIENT_CLASS + '.get_resources',
+            return_value=[
+                ResourceBlock(client=tatlin, pool=None, id=resource_id)
+                for resource_id in ('res1', 'res2', 'res3')
+            ]
+        )
+
+        # Get host`s resources
+        resources = host.get_resources()
+
+        # Result: Only mapped resources were returned in resources order
+        assert [resource.id for resource in resources] == ['res1', 'res2']
+
+        # Result: Mapping was requested once
+        assert open_url_mock.call_count == 1
+        assert open_url_mock.call_args[1]['url'].endswith(
+            eps.PERSONALITIES_RESOURCE_MAPPING_ENDPOINT)
+
+    def test_hosts_get_resources_requests(
+        self, tatlin, make_mock, drives_groups_data, pools_data,
+        resources_data,
+    ):
+        hosts_count = 5
+
+        # Create Host objects, every host has one mapped resource
+        hosts = [
+            Host(client=tatlin, id='host_id{0}'.format(i))
+            for i in range(hosts_count)
+        ]
+        mapping_data = [
+            {'resource_id': resources_data[i % len(resources_data)]['id'],
+             'host_id': host.id}
+            for i, host in enumerate(hosts)
+        ]
+
+        responses = {
+            eps.PERSONALITIES_RESOURCE_MAPPING_ENDPOINT: mapping_data,
+            eps.HEALTH_MEDIAS_ENDPOINT: drives_groups_data,
+            eps.HEALTH_POOLS_ENDPOINT: pools_data,
+            eps.HEALTH_PERSONALITIES_ENDPOINT: resources_data,
+        }
+
+        def open_url(url, **kwargs):
+            response = MagicMock()
+            response.read.return_value = json.dumps(
+                responses[url.split('/', 3)[3]]
+            )
+            return response
+
+        # Mock open_url with response for every endpoint
+        open_url_mock = make_mock(OPEN_URL_FUNC, side_effect=open_url)
+
+        # Get resources of every host
+        hosts_resources = [host.get_resources() for host in hosts]
+
+        # Result: Every endpoint was requested once for all hosts
+        assert open_url_mock.call_count == len(responses)
+
+        # Result: Every host got its mapped resource
+        for mapping_item, resources in zip(mapping_data, hosts_resources):
+            assert [r.id for r in resources] == [mapping_item['resource_id']]
+
     def test_host_update(
         self, tatlin, make_mock, open_url_kwargs, hosts_data,
     ):
@@ -221,3 +221,53 @@ class TestHostGroup:
 
         check_called_with(open_url_mock, **open_url_kwargs)
         load_mock.assert_called_once()
+
+    def test_host_group_set_tags_write_through(
+        self, tatlin, make_mock, host_groups_data,
+    ):
+        # Enable write-through mode
+        tatlin.write_through = True
+
+        # Create HostGroup object
+        host_group = HostGroup(client=tatlin, **host_groups_data[0])
+
+        # Mock open_url response without data
+        open_url_mock = make_mock(OPEN_URL_FUNC)
+
+        # Mock load method
+        load_mock = make_mock(HOST_GROUP_CLASS + '.load')
+
+        # Set new tags
+        host_group.set_tags(tags=['tag3'])
+
+        # Result: Tags were applied without load
+        assert host_group.tags == ['tag3']
+        assert host_group.name == 'hostgroup1'
+        assert open_url_mock.call_count == 1
+        load_mock.assert_not_called()
+
+    def test_host_group_set_hosts_echoed(
+        self, tatlin, make_mock, host_groups_data, hosts_data,
+    ):
+        # Enable write-through mode
+        tatlin.write_through = True
+
+        # Create HostGroup and Host objects
+        host_group = HostGroup(client=tatlin, **host_groups_data[0])
+        host = Host(client=tatlin, **hosts_data[0])
+
+        # Mock open_url response with changed host group
+        echoed_data = dict(
+            host_groups_data[0], host_ids=[host.id], tags=['echoed'],
+        )
+        make_mock(OPEN_URL_FUNC, return_value=echoed_data)
+
+        # Mock load method
+        load_mock = make_mock(HOST_GROUP_CLASS + '.load')
+
+        # Set new host
+        host_group.set_hosts(host)
+
+        # Result: Data sent back by Tatlin was applied without load
+        assert host_group.tags == ['echoed']
+        load_mock.assert_not_called()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import pytest
+from base64 import b64decode, b64encode
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.tatlin_client import TatlinClient
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import RESTClientNotFoundError
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import OPEN_URL_FUNC
+
+
+def make_connection(status=200, body=None):
+    connection = MagicMock()
+    connection.send_request.return_value = {
+        'status': status,
+        'reason': 'reason',
+        'headers': {},
+        'body': b64encode(json.dumps(body or {}).encode()).decode(),
+    }
+    return connection
+
+
+@pytest.fixture
+def tatlin_httpapi():
+    return TatlinClient(
+        base_url='localhost',
+        auth_method=None,
+        connection=make_connection(body={'id': 1}),
+    )
+
+
+class TestHttpApiTransport:
+
+    def test_request_through_connection(self, tatlin_httpapi, make_mock):
+        open_url_mock = make_mock(OPEN_URL_FUNC)
+
+        # Authorize and send request with body
+        tatlin_httpapi.authorize()
+        data = tatlin_httpapi.post(
+            'some/endpoint', body={'key': 'value'},
+        ).json
+
+        # Result: Request was sent through connection with relative path
+        send_request = tatlin_httpapi._connection.send_request
+        assert send_request.call_count == 1
+        kwargs = send_request.call_args[1]
+        assert kwargs['path'] == '/some/endpoint'
+        assert kwargs['method'] == 'POST'
+        assert json.loads(b64decode(kwargs['body'])) == {'key': 'value'}
+        assert data == {'id': 1}
+
+        # Result: Client didn't login and open_url was not used
+        assert 'X-Auth-Token' not in kwargs['headers']
+        assert open_url_mock.call_count == 0
+
+    def test_error_status(self):
+        tatlin = TatlinClient(
+            base_url='localhost',
+            auth_method=None,
+            connection=make_connection(status=404),
+        )
+
+        # Result: Error statuses are handled as for direct requests
+        with pytest.raises(RESTClientNotFoundError):
+            tatlin.get('missing')
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import gc
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.identity_map import IdentityMap
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory import POOLS
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.host import Host
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import OPEN_URL_FUNC
+
+
+class TestIdentityMap:
+
+    def test_hosts_materialized_once(self, tatlin, make_mock, hosts_data):
+        # Mock open_url with hosts data
+        make_mock(OPEN_URL_FUNC, return_value=hosts_data)
+
+        # Get hosts
+        hosts = tatlin.get_hosts()
+
+        # Mock open_url with changed hosts data
+        hosts_data[0]['tags'] = ['new_tag']
+        make_mock(OPEN_URL_FUNC, return_value=hosts_data)
+
+        # Get hosts again
+        new_hosts = tatlin.get_hosts()
+
+        # Result: The same instances were returned
+        assert len(new_hosts) == len(hosts)
+        for host, new_host in zip(hosts, new_hosts):
+            assert new_host is host
+
+        # Result: Instances were refreshed in place
+        assert hosts[0].tags == ['new_tag']
+
+    def test_ports_materialized_once(self, tatlin, make_mock, ports_data):
+        # Mock open_url with ports data
+        make_mock(OPEN_URL_FUNC, return_value=ports_data)
+
+        # Get port and mock open_url with changed ports data
+        port = tatlin.get_ports()[0]
+        ports_data[0]['params']['mtu'] = 9000
+        make_mock(OPEN_URL_FUNC, return_value=ports_data)
+
+        # Result: The same port was returned with new data
+        assert tatlin.get_ports()[0] is port
+        assert port.mtu == 9000
+
+    def test_resources_share_pool_objects(
+        self, tatlin, make_mock, drives_groups_data, pools_data,
+        resources_data,
+    ):
+        # Mock open_url with drive groups, pools and resources data
+        make_mock(
+            OPEN_URL_FUNC,
+            return_value=[drives_groups_data, pools_data, resources_data],
+            chain_calls=True,
+        )
+
+        # Get resources
+        resource = tatlin.get_resources()[0]
+        old_pool = resource.pool
+
+        # Get resources again
+        make_mock(
+            OPEN_URL_FUNC,
+            return_value=[drives_groups_data, pools_data, resources_data],
+            chain_calls=True,
+        )
+        new_resources = tatlin.get_resources()
+
+        # Result: Resource was not built again
+        assert new_resources[0] is resource
+
+        # Result: Resource refers to the latest pool object
+        assert resource.pool is not old_pool
+        assert tatlin.inventory.get_by_id(POOLS, old_pool.id) is resource.pool
+
+    def test_objects_without_id_not_tracked(self, tatlin):
+        identity_map = IdentityMap()
+
+        # Resolve object without id twice
+        host1 = identity_map.resolve(
+            Host, None, {}, lambda: Host(client=tatlin),
+        )
+        host2 = identity_map.resolve(
+            Host, None, {}, lambda: Host(client=tatlin),
+        )
+
+        # Result: Objects were not shared
+        assert host1 is not host2
+        assert len(identity_map) == 0
+
+    def test_unused_objects_released(self, tatlin, hosts_data):
+        identity_map = IdentityMap()
+
+        # Resolve host and drop all references to it
+        host_data = hosts_data[0]
+        identity_map.resolve(
+            Host, host_data['id'], host_data,
+            lambda: Host(client=tatlin, **host_data),
+        )
+        gc.collect()
+
+        # Result: Host was forgotten
+        assert identity_map.get(Host, host_data['id']) is None
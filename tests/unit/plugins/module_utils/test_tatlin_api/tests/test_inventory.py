@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory import (
+    TatlinInventory, HOSTS, PORTS,
+)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.host import Host
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import OPEN_URL_FUNC
+
+
+class TestInventory:
+
+    def test_lookup_uses_snapshot(self, tatlin, make_mock, hosts_data):
+        # Mock open_url with hosts data
+        open_url_mock = make_mock(OPEN_URL_FUNC, return_value=hosts_data)
+
+        # Get hosts by name several times
+        host1 = tatlin.get_host('host1')
+        host2 = tatlin.get_host('host2')
+        missing = tatlin.get_host('missing')
+
+        # Result: Hosts were fetched once
+        assert open_url_mock.call_count == 1
+        assert host1.id == '7ab276b8-59a3-416b-8f28-191e91b4e20b'
+        assert host2.id == '9355f65d-a8a2-4df9-8459-98a5c20725f3'
+        assert missing is None
+
+        # Result: Hosts are indexed by id
+        assert tatlin.inventory.get_by_id(HOSTS, host1.id) is host1
+
+    def test_mutation_invalidates_snapshot(
+        self, tatlin, make_mock, hosts_data,
+    ):
+        # Mock open_url with hosts data
+        open_url_mock = make_mock(OPEN_URL_FUNC, return_value=hosts_data)
+
+        # Load snapshot and change something on Tatlin
+        tatlin.get_host('host1')
+        tatlin.post('some/endpoint', body={'key': 'value'})
+
+        # Result: Snapshot was invalidated
+        assert not tatlin.inventory.is_loaded(HOSTS)
+
+        # Result: Hosts are fetched again
+        tatlin.get_host('host1')
+        assert open_url_mock.call_count == 3
+
+    def test_list_getter_refreshes_snapshot(
+        self, tatlin, make_mock, hosts_data,
+    ):
+        # Load snapshot
+        make_mock(OPEN_URL_FUNC, return_value=hosts_data)
+        tatlin.get_host('host1')
+
+        # Rename host on Tatlin and get hosts list
+        hosts_data[0]['name'] = 'renamed'
+        make_mock(OPEN_URL_FUNC, return_value=hosts_data)
+        tatlin.get_hosts()
+
+        # Result: Snapshot contains new data
+        assert tatlin.get_host('host1') is None
+        assert tatlin.get_host('renamed') is not None
+
+    def test_invalidate_inventory(self, tatlin, make_mock, ports_data):
+        # Mock open_url with ports data
+        open_url_mock = make_mock(OPEN_URL_FUNC, return_value=ports_data)
+
+        # Get port, invalidate ports and get port again
+        tatlin.get_port('p01')
+        tatlin.invalidate_inventory(PORTS)
+        port = tatlin.get_port('p01')
+
+        # Result: Ports were fetched twice
+        assert open_url_mock.call_count == 2
+        assert tatlin.inventory.get_by_id(PORTS, 'p01') is port
+
+    def test_unknown_collection(self, tatlin):
+        inventory = TatlinInventory()
+
+        # Result: Unknown collection is rejected
+        with pytest.raises(ValueError):
+            inventory.update('unknown', [Host(client=tatlin, id='1')])
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import pytest
+from io import BytesIO
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.rest_client import (
+    iter_json_array,
+)
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    OPEN_URL_FUNC,
+)
+
+
+ITEMS = [
+    {'id': 'a', 'name': u'хост', 'tags': ['x', 'y'], 'size': 12345},
+    {'id': 'b', 'nested': {'list': [1, 2.5, None, True], 'str': ']"['}},
+    17,
+    'plain',
+    [],
+]
+
+NUMBERS_BODY = b'[10.5, -2, 1e5, -0.25E-3,7,true ,null]'
+
+
+def split_reader(body, offset):
+    """Returns read function which gives body in two chunks
+    split at offset whatever size is requested"""
+    chunks = [body[:offset], body[offset:]]
+
+    def read(size):
+        return chunks.pop(0) if chunks else b''
+
+    return read
+
+
+class TestJsonStream:
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 65536])
+    def test_chunk_boundaries(self, chunk_size):
+        body = json.dumps(ITEMS, ensure_ascii=False).encode('utf-8')
+
+        # Decode array with different chunk sizes
+        rv = list(iter_json_array(BytesIO(body).read, chunk_size))
+
+        # Result: Elements are the same regardless of chunk boundaries
+        assert rv == ITEMS
+
+    def test_number_at_chunk_end(self):
+        # Result: Number which ends with the chunk is not cut
+        assert list(iter_json_array(BytesIO(b'[12, 345]').read, 3)) == [12, 345]
+
+    @pytest.mark.parametrize('offset', range(1, len(NUMBERS_BODY)))
+    def test_numbers_split_at_offset(self, offset):
+        # Decode array split at offset
+        rv = list(iter_json_array(split_reader(NUMBERS_BODY, offset)))
+
+        # Result: Numbers cut at dot, sign or exponent are not truncated
+        assert rv == json.loads(NUMBERS_BODY.decode('utf-8'))
+
+    def test_empty_body_and_array(self):
+        # Result: Empty body and empty array give no elements
+        assert list(iter_json_array(BytesIO(b'').read)) == []
+        assert list(iter_json_array(BytesIO(b' [ ] ').read, 1)) == []
+
+    @pytest.mark.parametrize('body', [b'{"id": 1}', b'[1, 2', b'[1 2]', b'[1,'])
+    def test_invalid_body(self, body):
+        # Result: Not an array or broken array raises ValueError
+        with pytest.raises(ValueError):
+            list(iter_json_array(BytesIO(body).read, 2))
+
+    def test_client_get_hosts_stream(self, tatlin, mocker):
+        hosts_data = [
+            {'id': str(i), 'name': 'host{0}'.format(i), 'tags': []}
+            for i in range(50)
+        ]
+        response = MagicMock()
+        response.read = BytesIO(json.dumps(hosts_data).encode()).read
+        open_url_mock = mocker.patch(OPEN_URL_FUNC, return_value=response)
+        tatlin.stream_json = True
+
+        # Get hosts
+        hosts = tatlin.get_hosts()
+
+        # Result: Hosts were requested once and decoded from stream
+        assert open_url_mock.call_count == 1
+        assert open_url_mock.call_args[1]['url'] == 'https://localhost/{0}'.format(
+            eps.PERSONALITIES_HOSTS_ENDPOINT)
+        assert [host.name for host in hosts] == [
+            'host{0}'.format(i) for i in range(50)
+        ]
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import pytest
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
+    RESTClientNotFoundError,
+)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.metrics import (
+    MetricsMiddleware, endpoint_template,
+)
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    OPEN_URL_FUNC,
+)
+
+
+def make_response(body):
+    response = MagicMock()
+    response.getcode.return_value = 200
+    response.read.return_value = body
+    return response
+
+
+class TestMetrics:
+
+    @pytest.mark.parametrize('path, expected', [
+        (
+            eps.HEALTH_POOLS_ENDPOINT + '/28118216-74eb-4ba2-8e01-be894b878de1',
+            eps.HEALTH_POOLS_ENDPOINT + '/{id}',
+        ),
+        (eps.USERS_ENDPOINT + '/admin', eps.USERS_ENDPOINT + '/{name}'),
+        (eps.PORTS_ENDPOINT + '/eth/p01/status', eps.PORTS_ENDPOINT + '/eth/{name}/status'),
+        (eps.PORTS_STATUS_ENDPOINT, eps.PORTS_STATUS_ENDPOINT),
+        (eps.DASHBOARD_TASKS_ENDPOINT + '/42?x=1', eps.DASHBOARD_TASKS_ENDPOINT + '/{id}'),
+        (eps.REBOOT_ENDPOINT.format(node='sp-0'), eps.REBOOT_ENDPOINT),
+    ])
+    def test_endpoint_template(self, path, expected):
+        # Result: Ids and names were replaced with placeholders
+        assert endpoint_template(path) == expected
+
+    def test_summary(self, tatlin, mocker):
+        not_found = HTTPError('url', 404, 'Not found', {}, None)
+        mocker.patch(OPEN_URL_FUNC, side_effect=[
+            make_response(b'[1, 2, 3]'),
+            make_response(b'[]'),
+            not_found,
+        ])
+        metrics = MetricsMiddleware()
+        tatlin.add_middleware(metrics)
+
+        # Make requests to pools
+        tatlin.get(eps.HEALTH_POOLS_ENDPOINT + '/1')
+        tatlin.post(eps.HEALTH_POOLS_ENDPOINT + '/2', body={'a': 1})
+        with pytest.raises(RESTClientNotFoundError):
+            tatlin.get(eps.HEALTH_POOLS_ENDPOINT + '/3')
+
+        summary = dict(
+            ((g['method'], g['status']), g) for g in metrics.summary()
+        )
+
+        # Result: Requests were aggregated by method and status
+        assert set(summary) == set([('GET', 200), ('POST', 200), ('GET', 404)])
+        ok = summary[('GET', 200)]
+        assert ok['endpoint'] == eps.HEALTH_POOLS_ENDPOINT + '/{id}'
+        assert ok['count'] == 1 and ok['errors'] == 0
+        assert ok['response_bytes'] == len(b'[1, 2, 3]')
+        assert sum(ok['latency_histogram'].values()) == 1
+
+        # Result: Request bytes and errors were counted
+        assert summary[('POST', 200)]['request_bytes'] == len(b'{"a": 1}')
+        assert summary[('GET', 404)]['errors'] == 1
+
+    def test_dump(self, tatlin, mocker, tmp_path):
+        mocker.patch(OPEN_URL_FUNC, return_value=make_response(b'[]'))
+        metrics = MetricsMiddleware()
+        tatlin.add_middleware(metrics)
+        path = str(tmp_path / 'metrics.jsonl')
+
+        # Make request and dump metrics
+        tatlin.get(eps.HEALTH_POOLS_ENDPOINT)
+        metrics.dump(path)
+
+        # Result: Every request was written as JSON line
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == 1
+        assert lines[0]['endpoint'] == eps.HEALTH_POOLS_ENDPOINT
+        assert lines[0]['method'] == 'GET'
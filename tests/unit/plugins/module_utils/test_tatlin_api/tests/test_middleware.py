@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+import pytest
+from ansible.module_utils.six.moves.urllib.error import URLError
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.connection_pool import PooledResponse
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
+    RESTClientConnectionError,
+)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import (
+    LoggingMiddleware,
+    Middleware,
+    ResponseCacheMiddleware,
+    RetryMiddleware,
+    TimingMiddleware,
+)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.retry import RetryPolicy
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    OPEN_URL_FUNC, RETRY_MODULE,
+)
+
+
+class RecordingMiddleware(Middleware):
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def before_request(self, request):
+        self.calls.append(('before', self.name))
+        request.headers['X-' + self.name] = '1'
+
+    def after_response(self, request, response):
+        self.calls.append(('after', self.name))
+        return response
+
+
+def make_response(body=b'{}'):
+    response = MagicMock()
+    response.getcode.return_value = 200
+    response.read.return_value = body
+    return response
+
+
+class TestMiddleware:
+
+    def test_hooks_order(self, tatlin, make_mock):
+        open_url_mock = make_mock(OPEN_URL_FUNC, return_value={'id': 1})
+        calls = []
+        tatlin.add_middleware(RecordingMiddleware('A', calls))
+        tatlin.add_middleware(RecordingMiddleware('B', calls))
+
+        # Make request
+        rv = tatlin.get('some/path').json
+
+        # Result: Hooks were called in chain order around the request
+        assert calls == [
+            ('before', 'A'), ('before', 'B'), ('after', 'B'), ('after', 'A'),
+        ]
+
+        # Result: Changes of middlewares were sent
+        headers = open_url_mock.call_args[1]['headers']
+        assert headers['X-A'] == '1' and headers['X-B'] == '1'
+        assert rv == {'id': 1}
+
+    def test_before_request_returns_response(self, tatlin, make_mock):
+        open_url_mock = make_mock(OPEN_URL_FUNC)
+
+        class ShortCircuit(Middleware):
+            def before_request(self, request):
+                return PooledResponse(200, 'OK', {}, b'{"cached": true}')
+
+        tatlin.add_middleware(ShortCircuit())
+
+        # Make request
+        rv = tatlin.get('some/path').json
+
+        # Result: Request was not sent
+        assert open_url_mock.call_count == 0
+        assert rv == {'cached': True}
+
+    def test_retry_connection_error(self, tatlin, make_mock):
+        sleep_mock = make_mock(RETRY_MODULE + '.time.sleep')
+        open_url_mock = make_mock(
+            OPEN_URL_FUNC,
+            side_effect=[URLError('down'), URLError('down'), make_response()],
+        )
+        tatlin.add_middleware(RetryMiddleware(
+            RetryPolicy(max_attempts=3, backoff_factor=1, jitter=False),
+        ))
+
+        # Make GET request
+        tatlin.get('some/path')
+
+        # Result: Request was repeated with growing delay
+        assert open_url_mock.call_count == 3
+        assert [c[0][0] for c in sleep_mock.call_args_list] == [1, 2]
+
+    def test_retry_not_idempotent(self, tatlin, make_mock):
+        make_mock(RETRY_MODULE + '.time.sleep')
+        open_url_mock = make_mock(OPEN_URL_FUNC, side_effect=URLError('down'))
+        tatlin.add_middleware(RetryMiddleware(RetryPolicy(max_attempts=3)))
+
+        # Make POST request
+        with pytest.raises(RESTClientConnectionError):
+            tatlin.post('some/path', body={'a': 1})
+
+        # Result: POST was not repeated
+        assert open_url_mock.call_count == 1
+
+    def test_response_cache(self, tatlin, mocker):
+        open_url_mock = mocker.patch(
+            OPEN_URL_FUNC, return_value=make_response(b'{"id": 1}'),
+        )
+        tatlin.add_middleware(ResponseCacheMiddleware(ttl=60))
+
+        # Make the same GET twice
+        first = tatlin.get('some/path').json
+        second = tatlin.get('some/path').json
+
+        # Result: Second response was served from cache
+        assert open_url_mock.call_count == 1
+        assert first == second == {'id': 1}
+
+        # Make POST and GET again
+        tatlin.post('other/path', body={'a': 1})
+        tatlin.get('some/path')
+
+        # Result: POST dropped cached response
+        assert open_url_mock.call_count == 3
+
+    def test_timing_and_logging(self, tatlin, make_mock):
+        make_mock(OPEN_URL_FUNC)
+        log = MagicMock()
+        timing = TimingMiddleware()
+        tatlin.add_middleware(timing)
+        tatlin.add_middleware(LoggingMiddleware(log=log))
+
+        # Make request
+        tatlin.get('some/path')
+
+        # Result: Request was timed and logged
+        assert [r[:2] for r in timing.records] == [('GET', 'some/path')]
+        assert timing.total >= 0
+        assert log.call_count == 1
+        assert log.call_args[0][0].startswith('GET some/path')
+
+    def test_single_flight_window(self, tatlin, make_mock, mocker):
+        open_url_mock = make_mock(OPEN_URL_FUNC, return_value={'id': 1})
+        tatlin.single_flight.window = 60
+
+        # Make the same GET twice
+        first = tatlin.get('some/path').json
+        second = tatlin.get('some/path').json
+
+        # Result: Response was shared, every caller got its own object
+        assert open_url_mock.call_count == 1
+        assert first == second == {'id': 1}
+        assert first is not second
+
+        # Make POST and GET again
+        tatlin.post('other/path', body={'a': 1})
+        tatlin.get('some/path')
+
+        # Result: POST dropped shared response
+        assert open_url_mock.call_count == 3
+
+    def test_single_flight_in_flight(self, tatlin, mocker):
+        started = threading.Event()
+        release = threading.Event()
+
+        def open_url(**kwargs):
+            started.set()
+            release.wait(5)
+            return make_response(b'{"id": 1}')
+
+        open_url_mock = mocker.patch(OPEN_URL_FUNC, side_effect=open_url)
+        results = []
+
+        def get():
+            results.append(tatlin.get('some/path').json)
+
+        # Make the same GET while the first one is in flight
+        first = threading.Thread(target=get)
+        first.start()
+        started.wait(5)
+        second = threading.Thread(target=get)
+        second.start()
+        time.sleep(0.2)
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        # Result: One request was sent for both callers
+        assert open_url_mock.call_count == 1
+        assert results == [{'id': 1}, {'id': 1}]
+
+    def test_single_flight_excluded(self, tatlin, make_mock):
+        open_url_mock = make_mock(OPEN_URL_FUNC, return_value=[])
+        tatlin.single_flight.window = 60
+
+        # Get tasks twice
+        tatlin.get_tasks()
+        tatlin.get_tasks()
+
+        # Result: Polled endpoint was requested every time
+        assert open_url_mock.call_count == 2
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import weakref
+import pytest
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.drive import Drive
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.host import Host
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.host_group import HostGroup
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.port import (
+    Node, NodeAddress, VirtualAddress)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.resource import (
+    ResourceBlock, ResourceFile)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.subnet import Subnet
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.task import Task
+
+
+MODELS_COUNT = 10000
+
+# Slotted models should take noticeably less memory
+# than the same objects with per-instance __dict__
+MEMORY_RATIO = 0.9
+
+
+class _DictDrive:
+    """Drive with attributes in __dict__, like models before __slots__"""
+
+    def __init__(self, client, drive_group, pool, **drive_data):
+        self._client = client
+        self._state = drive_data['state']
+        self._topology_path = drive_data['topology_path']
+        self._bay = None
+
+        self.drive_group = drive_group
+        self.id = drive_data['id']
+        self.model = drive_data['model']
+        self.serial_number = drive_data['sn']
+        self.size = drive_data['size']
+        self.slot = drive_data['slot']
+        self.pool = pool
+
+
+class _DictNodeAddress:
+    """NodeAddress with attributes in __dict__"""
+
+    def __init__(self, ip, mask, address_id, status):
+        self.ip = ip
+        self.mask = mask
+        self.address_id = address_id
+        self.status = status
+
+
+def measure_memory(factory, count=MODELS_COUNT):
+    """Returns memory allocated for count objects made by factory"""
+    tracemalloc = pytest.importorskip('tracemalloc')
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objects = [factory() for i in range(count)]
+        rv = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+
+    assert len(objects) == count
+    return rv
+
+
+class TestModelsMemory:
+
+    def make_models(
+        self, tatlin, drives_groups_data, hosts_data, host_groups_data,
+        resources_data, subnets_data,
+    ):
+        drive_data = drives_groups_data['HDD_209715200']['disks'][0]
+        return [
+            Drive(client=tatlin, drive_group=None, pool=None, **drive_data),
+            Host(client=tatlin, **hosts_data[0]),
+            HostGroup(client=tatlin, **host_groups_data[0]),
+            Node(client=tatlin, port=None, name='sp-0', addresses=[]),
+            NodeAddress('1.1.1.1', '24', 'addr_id', 'online'),
+            VirtualAddress('1.1.1.2', '24'),
+            ResourceBlock(client=tatlin, pool=None, **resources_data[0]),
+            ResourceFile(client=tatlin, pool=None, **resources_data[0]),
+            Subnet(client=tatlin, **subnets_data[0]),
+            Task(client=tatlin, id=1, state='done'),
+        ]
+
+    def test_models_have_no_dict(
+        self, tatlin, drives_groups_data, hosts_data, host_groups_data,
+        resources_data, subnets_data,
+    ):
+        models = self.make_models(
+            tatlin, drives_groups_data, hosts_data, host_groups_data,
+            resources_data, subnets_data,
+        )
+
+        # Result: Models keep attributes in slots only
+        for model in models:
+            assert not hasattr(model, '__dict__'), type(model).__name__
+
+    def test_mapped_models_weak_referenced(
+        self, tatlin, drives_groups_data, hosts_data, host_groups_data,
+        resources_data, subnets_data,
+    ):
+        models = self.make_models(
+            tatlin, drives_groups_data, hosts_data, host_groups_data,
+            resources_data, subnets_data,
+        )
+        mapped_classes = (Host, HostGroup, ResourceBlock, ResourceFile, Subnet)
+
+        # Result: Models kept by IdentityMap have a slot for weak references
+        for model in models:
+            if isinstance(model, mapped_classes):
+                assert weakref.ref(model)() is model, type(model).__name__
+
+    def test_drives_memory(self, tatlin, drives_groups_data):
+        drive_data = drives_groups_data['HDD_209715200']['disks'][0]
+
+        # Measure memory of slotted and dict-based drives
+        slotted = measure_memory(lambda: Drive(
+            client=tatlin, drive_group=None, pool=None, **drive_data
+        ))
+        dict_based = measure_memory(lambda: _DictDrive(
+            client=tatlin, drive_group=None, pool=None, **drive_data
+        ))
+
+        # Result: Slotted drives take less memory
+        assert slotted < dict_based * MEMORY_RATIO
+
+    def test_node_addresses_memory(self):
+        # Measure memory of slotted and dict-based addresses
+        slotted = measure_memory(
+            lambda: NodeAddress('1.1.1.1', '24', 'addr_id', 'online'),
+        )
+        dict_based = measure_memory(
+            lambda: _DictNodeAddress('1.1.1.1', '24', 'addr_id', 'online'),
+        )
+
+        # Result: Slotted addresses take less memory
+        assert slotted < dict_based * MEMORY_RATIO
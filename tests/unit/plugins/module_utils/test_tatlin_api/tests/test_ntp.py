@@ -185,3 +185,26 @@ class TestNtp:
 
         # Result: open_url was called with expected params
         open_url_mock.assert_called_with(**open_url_kwargs)
+
+    def test_set_servers_write_through(self, tatlin, make_mock):
+        # Enable write-through mode
+        tatlin.write_through = True
+
+        # Mock open_url with servers data
+        make_mock(
+            target=OPEN_URL_FUNC,
+            return_value={'ntp_server_list': ['1.1.1.1']},
+        )
+
+        # Create NtpConfig object
+        ntp_config = NtpConfig(tatlin)
+
+        # Mock open_url without data
+        open_url_mock = make_mock(target=OPEN_URL_FUNC)
+
+        # Set servers
+        ntp_config.set_servers(['yadro.com'])
+
+        # Result: Servers were applied with single request
+        assert ntp_config.servers == ['yadro.com']
+        assert open_url_mock.call_count == 1
@@ -12,7 +12,9 @@ __metaclass__ = type
 import pytest
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.pool import Pool
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.drive import Drive
-from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import HEALTH_POOLS_ENDPOINT
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import (
+    HEALTH_PERSONALITIES_ENDPOINT, HEALTH_POOLS_ENDPOINT,
+)
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinClientError
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.utils import check_called_with
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
@@ -94,6 +96,67 @@ class TestPool:
         # Result: Resources list is not empty
         assert len(resources) > 0
 
+    def test_get_resources_of_all_pools(
+        self, tatlin, make_mock, drives_groups_data, pools_data,
+        resources_data,
+    ):
+        # Add second pool and move one resource to it
+        second_pool = dict(pools_data[0], id='second_pool_id', disks_list=[])
+        pools_data.append(second_pool)
+        resources_data[0]['poolId'] = second_pool['id']
+
+        # Mock open_url with drive groups, pools and resources data
+        open_url_mock = make_mock(
+            OPEN_URL_FUNC,
+            return_value=[drives_groups_data, pools_data, resources_data],
+            chain_calls=True,
+        )
+
+        # Get resources of all pools
+        resources = tatlin.get_resources()
+
+        # Result: Personalities were fetched once for both pools
+        assert open_url_mock.call_count == 3
+
+        # Result: Resources were bound to their pools
+        assert len(resources) == len(resources_data)
+        for resource in resources:
+            exp_pool_id = next(
+                data['poolId'] for data in resources_data
+                if data['id'] == resource.id
+            )
+            assert resource.pool.id == exp_pool_id
+
+    def test_get_resources_cached(
+        self, tatlin, make_mock, pools_data, resources_data,
+    ):
+        # Add second pool and move one resource to it
+        second_pool = dict(pools_data[0], id='second_pool_id', disks_list=[])
+        pools_data.append(second_pool)
+        resources_data[0]['poolId'] = second_pool['id']
+
+        # Mock open_url with resources data
+        open_url_mock = make_mock(OPEN_URL_FUNC, return_value=resources_data)
+
+        # Get resources of every pool one by one
+        pools = [
+            Pool(client=tatlin, drive_group=None, **data)
+            for data in pools_data
+        ]
+        pools_resources = [pool.get_resources() for pool in pools]
+
+        # Result: Only personalities were fetched, once for both pools
+        assert open_url_mock.call_count == 1
+        assert open_url_mock.call_args[1]['url'].endswith(
+            HEALTH_PERSONALITIES_ENDPOINT)
+
+        # Result: Every pool got its own resources
+        assert [r.id for r in pools_resources[1]] == [resources_data[0]['id']]
+        assert len(pools_resources[0]) == len(resources_data) - 1
+        for pool, resources in zip(pools, pools_resources):
+            for resource in resources:
+                assert resource.pool is pool
+
     def test_remove(self, tatlin, make_mock, open_url_kwargs, pools_data):
         # Create pool object
         pool = Pool(client=tatlin, drive_group=None, **pools_data[0])
@@ -295,6 +358,25 @@ class TestPool:
         # Result: open_url was called with expected params
         check_called_with(open_url_mock, **open_url_kwargs)
 
+    def test_set_spare_count_write_through(self, tatlin, make_mock):
+        # Enable write-through mode
+        tatlin.write_through = True
+
+        # Mock load method
+        load_mock = make_mock(POOL_CLASS + '.load')
+
+        # Create pool object
+        pool = Pool(client=tatlin, drive_group=None, id='pool_id')
+
+        # Mock open_url without data
+        make_mock(target=OPEN_URL_FUNC)
+
+        # Set new spare count
+        pool.set_spare_count(10)
+
+        # Result: Pool was loaded, capacity is computed by Tatlin
+        load_mock.assert_called_once()
+
     def test_set_thresholds(self, tatlin, make_mock, open_url_kwargs):
         # Mock load method
         make_mock(POOL_CLASS + '.load')
@@ -14,7 +14,7 @@ import pytest
 from hamcrest import assert_that, has_entries
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.utils import check_obj
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
-    OPEN_URL_FUNC, PORT_CLASS, MODELS_PACKAGE,
+    OPEN_URL_FUNC, PORT_CLASS, RETRY_MODULE,
 )
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import PORTS_ENDPOINT
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.port import (
@@ -504,6 +504,31 @@ class TestPort:
         }
         assert_that(call_data, has_entries(expected_call_data))
 
+    def test_update_mgmt_load_after_reset(
+        self, tatlin, make_mock, ports_data,
+    ):
+        # Create mgmt port object
+        port_data = next(data for data in ports_data
+                         if data['id'] == 'mgmt')
+        port = Port(client=tatlin, port_data=port_data)
+
+        # Mock sleeping, open_url and waiting interfaces method
+        make_mock(target=RETRY_MODULE + '.time.sleep')
+        make_mock(target=OPEN_URL_FUNC)
+        make_mock(target=PORT_CLASS + '._wait_interfaces_up')
+
+        # Mock load method, first load hits connection reset
+        load_mock = make_mock(
+            PORT_CLASS + '.load',
+            side_effect=[RESTClientConnectionError('reset'), None],
+        )
+
+        # Change port virtual address
+        port.update(virtual_address='192.168.1.111/24')
+
+        # Result: Port was loaded again after the reset
+        assert load_mock.call_count == 2
+
     @pytest.mark.parametrize('port_name', ['mgmt', 'p01'])
     def test_update_sp_addresses(
         self, tatlin, make_mock, open_url_kwargs,
@@ -575,7 +600,7 @@ class TestPort:
         port = Port(client=tatlin, port_data=ports_data[1])
 
         # Mock sleeping
-        make_mock(target=MODELS_PACKAGE + '.port.time.sleep')
+        make_mock(target=RETRY_MODULE + '.time.sleep')
 
         # Mock open_url without data
         open_url_mock = make_mock(target=OPEN_URL_FUNC)
@@ -614,7 +639,7 @@ class TestPort:
         port = Port(client=tatlin, port_data=ports_data[1])
 
         # Mock sleeping
-        make_mock(target=MODELS_PACKAGE + '.port.time.sleep')
+        make_mock(target=RETRY_MODULE + '.time.sleep')
 
         # Mock open_url with exception
         make_mock(
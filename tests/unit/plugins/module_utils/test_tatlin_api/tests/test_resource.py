@@ -11,7 +11,9 @@ __metaclass__ = type
 
 import pytest
 import json
+import threading
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.concurrent_client import ConcurrentTatlinClient
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinClientError
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.host_group import HostGroup
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.host import Host
@@ -23,6 +25,7 @@ from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.resource import (
     ResourceBlock, ResourceFile,
 )
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.utils import check_called_with
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
     OPEN_URL_FUNC,
@@ -930,6 +933,59 @@ class TestResource:
         # Result: Calls with expected params was sent
         open_url_mock.assert_has_calls(calls=calls, any_order=True)
 
+    def test_update_block_hosts_concurrently(self, make_mock, mocker):
+        tatlin = ConcurrentTatlinClient(base_url='localhost', max_concurrency=2)
+        barrier = threading.Barrier(2, timeout=5)
+
+        # Create ResourceBlock and Host objects
+        resource = ResourceBlock(
+            client=tatlin, pool=None, id='resource_id', ports=[],
+        )
+        hosts_to_remove = [
+            Host(client=tatlin, id='remove_id{0}'.format(i),
+                 name='remove{0}'.format(i))
+            for i in range(2)
+        ]
+        hosts_to_add = [
+            Host(client=tatlin, id='add_id{0}'.format(i),
+                 name='add{0}'.format(i))
+            for i in range(2)
+        ]
+
+        # Mock hosts property and host list getter
+        mocker.patch(
+            RESOURCE_BLOCK_CLASS + '.hosts',
+            new_callable=mocker.PropertyMock,
+            return_value=hosts_to_remove,
+        )
+        get_hosts_mock = make_mock(TATLIN_API_CLIENT_CLASS + '.get_hosts')
+
+        def open_url(url, method, **kwargs):
+            # Requests of every step wait for each other,
+            # so serial requests would break the barrier
+            barrier.wait()
+            response = MagicMock()
+            response.read.return_value = ''
+            return response
+
+        open_url_mock = make_mock(OPEN_URL_FUNC, side_effect=open_url)
+
+        # Update resource hosts
+        resource._set_hosts(hosts_to_add)
+
+        # Result: Hosts were removed and then added
+        calls = [
+            (c[1]['method'], c[1]['url'].rsplit('/', 1)[-1])
+            for c in open_url_mock.call_args_list
+        ]
+        assert sorted(calls[:2]) == [
+            ('DELETE', 'remove_id0'), ('DELETE', 'remove_id1'),
+        ]
+        assert sorted(calls[2:]) == [('PUT', 'add_id0'), ('PUT', 'add_id1')]
+
+        # Result: Removed host ids were taken from mapped hosts
+        get_hosts_mock.assert_not_called()
+
     def test_update_file(
         self,
         tatlin,
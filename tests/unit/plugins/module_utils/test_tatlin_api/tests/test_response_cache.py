@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import stat
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.connection_pool import PooledResponse
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.response_cache import (
+    ConditionalCacheMiddleware,
+)
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    OPEN_URL_FUNC, RESPONSE_CACHE_MODULE,
+)
+
+
+def make_response(body, headers=None, status=200):
+    return PooledResponse(status, 'OK', headers or {}, body)
+
+
+class TestConditionalCache:
+
+    def make_cache(self, tatlin, tmp_path, **kwargs):
+        cache = ConditionalCacheMiddleware(
+            base_url=tatlin.base_url,
+            username='admin',
+            path=str(tmp_path),
+            **kwargs
+        )
+        tatlin.add_middleware(cache)
+        return cache
+
+    def test_etag_revalidation(self, tatlin, mocker, tmp_path):
+        open_url_mock = mocker.patch(OPEN_URL_FUNC, side_effect=[
+            make_response(b'[{"id": 1}]', {'ETag': '"v1"'}),
+            HTTPError('url', 304, 'Not Modified', {}, None),
+        ])
+        cache = self.make_cache(tatlin, tmp_path)
+
+        # Get hosts twice
+        first = tatlin.get(eps.PERSONALITIES_HOSTS_ENDPOINT).json
+        second = tatlin.get(eps.PERSONALITIES_HOSTS_ENDPOINT).json
+
+        # Result: Second request was conditional and served from cache
+        assert 'If-None-Match' not in open_url_mock.call_args_list[0][1]['headers']
+        assert open_url_mock.call_args_list[1][1]['headers']['If-None-Match'] == '"v1"'
+        assert first == second == [{'id': 1}]
+
+        # Result: Cache file is readable by owner only
+        files = os.listdir(cache.path)
+        assert len(files) == 1
+        mode = os.stat(os.path.join(cache.path, files[0])).st_mode
+        assert stat.S_IMODE(mode) == 0o600
+
+    def test_last_modified_pooled_304(self, tatlin, mocker, tmp_path):
+        modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        open_url_mock = mocker.patch(OPEN_URL_FUNC, side_effect=[
+            make_response(b'[1]', {'Last-Modified': modified}),
+            make_response(b'', status=304),
+        ])
+        self.make_cache(tatlin, tmp_path)
+
+        # Get drives twice
+        tatlin.get(eps.HEALTH_MEDIAS_ENDPOINT)
+        rv = tatlin.get(eps.HEALTH_MEDIAS_ENDPOINT).json
+
+        # Result: 304 status returned by transport was served from cache
+        headers = open_url_mock.call_args_list[1][1]['headers']
+        assert headers['If-Modified-Since'] == modified
+        assert rv == [1]
+
+    def test_no_validators_ttl(self, tatlin, mocker, make_mock, tmp_path):
+        time_mock = make_mock(RESPONSE_CACHE_MODULE + '.time.time', return_value=100)
+        open_url_mock = mocker.patch(
+            OPEN_URL_FUNC, side_effect=lambda **kw: make_response(b'[1]'),
+        )
+        self.make_cache(tatlin, tmp_path, ttl=10)
+
+        # Get ports twice within ttl
+        tatlin.get(eps.PORTS_STATUS_ENDPOINT)
+        rv = tatlin.get(eps.PORTS_STATUS_ENDPOINT).json
+
+        # Result: Response was served without request
+        assert open_url_mock.call_count == 1
+        assert rv == [1]
+
+        # Get ports after ttl
+        time_mock.return_value = 111
+        tatlin.get(eps.PORTS_STATUS_ENDPOINT)
+
+        # Result: Response was requested again
+        assert open_url_mock.call_count == 2
+
+    def test_invalidation_and_other_endpoints(self, tatlin, mocker, tmp_path):
+        open_url_mock = mocker.patch(
+            OPEN_URL_FUNC, side_effect=lambda **kw: make_response(b'[1]'),
+        )
+        cache = self.make_cache(tatlin, tmp_path)
+
+        # Get uncached endpoint and login
+        tatlin.get(eps.LDAP_CONFIG_ENDOPINT)
+        tatlin.get(eps.PORTS_STATUS_ENDPOINT)
+        tatlin.post(eps.LOGIN_ENDPOINT, body={'name': 'admin'})
+
+        # Result: Only cached endpoint was stored, login kept it
+        assert len(os.listdir(cache.path)) == 1
+
+        # Change hosts
+        tatlin.put(eps.PERSONALITIES_HOSTS_ENDPOINT, body={'name': 'host'})
+
+        # Result: Cached responses were dropped
+        assert os.listdir(cache.path) == []
+        tatlin.get(eps.PORTS_STATUS_ENDPOINT)
+        assert open_url_mock.call_count == 5
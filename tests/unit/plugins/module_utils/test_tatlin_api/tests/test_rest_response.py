@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.rest_client import RestResponse
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    REST_CLIENT_MODULE,
+)
+
+
+def make_response(body):
+    response = MagicMock()
+    response.read.return_value = body
+    response.headers = {'Content-Type': 'application/json'}
+    return response
+
+
+class TestRestResponse:
+
+    def test_json_decoded_once(self, make_mock):
+        loads_mock = make_mock(
+            REST_CLIENT_MODULE + '.json_backend.loads',
+            return_value={'id': 1},
+        )
+        response = RestResponse(make_response(b'{"id": 1}'))
+
+        # Get json several times
+        first = response.json
+        second = response.json
+
+        # Result: Body was decoded once and the same object was returned
+        assert loads_mock.call_count == 1
+        assert first is second
+
+    def test_content_and_headers(self):
+        response = RestResponse(make_response(b'{"id": 1}'))
+
+        # Result: Raw body and headers are available
+        assert response.content == b'{"id": 1}'
+        assert response.json == {'id': 1}
+        assert response.headers == {'Content-Type': 'application/json'}
+        assert response.headers is response.headers
+
+    def test_empty_and_invalid_body(self):
+        # Result: Empty body is decoded as empty object
+        assert RestResponse(make_response(b'')).json == {}
+
+        # Result: Invalid body raises ValueError
+        with pytest.raises(ValueError):
+            RestResponse(make_response(b'not json')).json
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import (
+    RESTClientBadRequest,
+    RESTClientConnectionError,
+    RESTClientRequestError,
+)
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.middleware import RetryMiddleware
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.retry import RetryPolicy
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    OPEN_URL_FUNC, RETRY_MODULE,
+)
+
+
+def make_error(status):
+    error = RESTClientRequestError('error')
+    error.status = status
+    return error
+
+
+class TestRetryPolicy:
+
+    def test_backoff(self, make_mock):
+        uniform_mock = make_mock(RETRY_MODULE + '.random.uniform', return_value=0.3)
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+
+        # Result: Delay grows exponentially up to the limit
+        assert [policy.get_backoff(a) for a in range(1, 6)] == [0.5, 1, 2, 3, 3]
+
+        # Result: Jitter takes random delay up to the exponential one
+        policy.jitter = True
+        assert policy.get_backoff(3) == 0.3
+        uniform_mock.assert_called_with(0, 2)
+
+    @pytest.mark.parametrize('error, method, expected', [
+        (RESTClientConnectionError(), 'GET', True),
+        (RESTClientConnectionError(), 'PUT', True),
+        (RESTClientConnectionError(), 'POST', False),
+        (make_error(503), 'GET', True),
+        (make_error(500), 'GET', False),
+        (RESTClientBadRequest(), 'GET', False),
+        (RESTClientConnectionError(), None, True),
+    ])
+    def test_is_retryable(self, error, method, expected):
+        # Result: Only transient errors of idempotent methods are retried
+        assert RetryPolicy().is_retryable(error, method) is expected
+
+    def test_call_attempts_are_over(self, make_mock):
+        sleep_mock = make_mock(RETRY_MODULE + '.time.sleep')
+        func = MagicMock(side_effect=RESTClientConnectionError)
+
+        # Result: The last error is raised when attempts are over
+        with pytest.raises(RESTClientConnectionError):
+            RetryPolicy(max_attempts=4).call(func, method='GET')
+        assert func.call_count == 4
+        assert sleep_mock.call_count == 3
+
+    def test_client_retries_status(self, tatlin, make_mock, mocker):
+        make_mock(RETRY_MODULE + '.time.sleep')
+        response = MagicMock()
+        response.read.return_value = b'{"id": 1}'
+        open_url_mock = mocker.patch(OPEN_URL_FUNC, side_effect=[
+            HTTPError('url', 503, 'Unavailable', {}, None),
+            response,
+        ])
+        tatlin.add_middleware(RetryMiddleware(RetryPolicy()))
+
+        # Make request
+        rv = tatlin.get('some/path').json
+
+        # Result: Request was repeated after 503 status
+        assert open_url_mock.call_count == 2
+        assert rv == {'id': 1}
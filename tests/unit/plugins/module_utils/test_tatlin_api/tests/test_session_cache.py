@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import stat
+import pytest
+from io import BytesIO
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.session_cache import SessionCache
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.tatlin_client import TatlinClient
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    OPEN_URL_FUNC, SESSION_CACHE_MODULE,
+)
+
+
+@pytest.fixture
+def session_cache(tmp_path):
+    return SessionCache(path=str(tmp_path / 'sessions.json'))
+
+
+def make_client(session_cache):
+    return TatlinClient(
+        base_url='localhost',
+        username='admin',
+        password='admin',
+        session_cache=session_cache,
+    )
+
+
+def make_response(data):
+    response = MagicMock()
+    response.read.return_value = json.dumps(data)
+    return response
+
+
+class TestSessionCache:
+
+    def test_get_set(self, session_cache):
+        # Save token
+        session_cache.set('https://localhost', 'admin', 'secret', 'token')
+
+        # Result: Token is returned for the same credentials only
+        assert session_cache.get(
+            'https://localhost', 'admin', 'secret') == 'token'
+        assert session_cache.get(
+            'https://localhost', 'admin', 'wrong') is None
+        assert session_cache.get(
+            'https://localhost', 'other', 'secret') is None
+        assert session_cache.get(
+            'https://otherhost', 'admin', 'secret') is None
+
+        # Result: File is readable by owner only
+        mode = stat.S_IMODE(os.stat(session_cache.path).st_mode)
+        assert mode == 0o600
+
+    def test_password_not_stored(self, session_cache):
+        # Save the same token twice
+        session_cache.set('https://localhost', 'admin', 'secret', 'token')
+        with open(session_cache.path) as f:
+            first = list(json.load(f).values())[0]
+        session_cache.set('https://localhost', 'admin', 'secret', 'token')
+        with open(session_cache.path) as f:
+            second = list(json.load(f).values())[0]
+
+        # Result: Neither password nor its plain hash was stored
+        plain_hash = hashlib.sha256(b'token\0secret').hexdigest()
+        for session in (first, second):
+            assert 'secret' not in session.values()
+            assert session['secret'] != plain_hash
+
+        # Result: Every saved token got its own salt
+        assert first['salt'] != second['salt']
+        assert first['secret'] != second['secret']
+
+    def test_custom_ttl(self, tmp_path, make_mock):
+        session_cache = SessionCache(path=str(tmp_path / 'sessions.json'), ttl=30)
+
+        # Mock time and save token
+        time_mock = make_mock(SESSION_CACHE_MODULE + '.time.time', return_value=100)
+        session_cache.set('https://localhost', 'admin', 'secret', 'token')
+
+        # Result: Token lives for ttl seconds
+        time_mock.return_value = 129
+        assert session_cache.get(
+            'https://localhost', 'admin', 'secret') == 'token'
+        time_mock.return_value = 131
+        assert session_cache.get(
+            'https://localhost', 'admin', 'secret') is None
+
+    def test_expiry(self, session_cache, make_mock):
+        time_mock = make_mock(
+            SESSION_CACHE_MODULE + '.time.time', return_value=100,
+        )
+
+        # Save token
+        session_cache.set('https://localhost', 'admin', 'secret', 'token')
+
+        # Result: Token is not returned after ttl
+        time_mock.return_value = 100 + session_cache.ttl + 1
+        assert session_cache.get(
+            'https://localhost', 'admin', 'secret') is None
+
+    def test_token_reused(self, session_cache, make_mock):
+        open_url_mock = make_mock(OPEN_URL_FUNC, return_value={'token': 't1'})
+
+        # Authorize with two clients
+        make_client(session_cache).authorize()
+        tatlin = make_client(session_cache)
+        tatlin.authorize()
+
+        # Result: Login was made once, second client reused token
+        assert open_url_mock.call_count == 1
+        assert tatlin._token == 't1'
+
+    def test_login_again_after_401(self, session_cache, make_mock):
+        session_cache.set('https://localhost', 'admin', 'admin', 'expired')
+        tatlin = make_client(session_cache)
+        tatlin.authorize()
+
+        # Mock open_url: expired token is rejected, login returns new one
+        open_url_mock = make_mock(OPEN_URL_FUNC, side_effect=[
+            HTTPError('url', 401, 'Unauthorized', {}, BytesIO(b'')),
+            make_response({'token': 'new'}),
+            make_response({'id': 1}),
+        ])
+
+        data = tatlin.get('some/endpoint').json
+
+        # Result: Request was repeated with new token
+        assert data == {'id': 1}
+        assert open_url_mock.call_args_list[1][1]['url'].endswith(
+            eps.LOGIN_ENDPOINT)
+        assert open_url_mock.call_args[1]['headers']['X-Auth-Token'] == 'new'
+
+        # Result: New token was saved
+        assert session_cache.get(
+            'https://localhost', 'admin', 'admin') == 'new'
+
+    def test_logout_drops_token(self, session_cache, make_mock):
+        make_mock(OPEN_URL_FUNC, return_value={'token': 't1'})
+        tatlin = make_client(session_cache)
+        tatlin.authorize()
+
+        # Logout
+        tatlin.logout()
+
+        # Result: Token was removed from cache
+        assert session_cache.get(
+            'https://localhost', 'admin', 'admin') is None
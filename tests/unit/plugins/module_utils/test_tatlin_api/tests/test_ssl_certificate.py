@@ -11,6 +11,8 @@ __metaclass__ = type
 
 from ansible.module_utils.six import PY3
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints import CERTIFICATE_ENDPOINT
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.rest_client import MultipartEncoder
+from ansible_collections.yadro.tatlin_uni.tests.unit.compat.mock import MagicMock
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import OPEN_URL_FUNC
 
 
@@ -74,3 +76,61 @@ class TestSslCertificate:
 
         # Result: Request with expected parameters was sent to tatlin
         open_url_mock.assert_called_with(**open_url_kwargs)
+
+    def test_upload_ssl_certificate_files(self, tatlin, make_mock, tmp_path):
+        # Create files with binary content and different line endings
+        crt_content = b'-----BEGIN CERTIFICATE-----\r\nAB\nCD\r\n\xff'
+        key_content = b'key\n' * 50000
+        (tmp_path / 'crt').write_bytes(crt_content)
+        (tmp_path / 'key').write_bytes(key_content)
+
+        sent = {}
+
+        def open_url(**kwargs):
+            # Body is read by chunks as transport does
+            body = kwargs['data']
+            chunks = []
+            while True:
+                chunk = body.read(8192)
+                if not chunk:
+                    break
+                assert len(chunk) <= 8192
+                chunks.append(chunk)
+            sent['body'] = b''.join(chunks)
+            sent['headers'] = kwargs['headers']
+            response = MagicMock()
+            response.read.return_value = b'{}'
+            return response
+
+        make_mock(target=OPEN_URL_FUNC, side_effect=open_url)
+
+        with open(str(tmp_path / 'crt'), 'rb') as crt:
+            with open(str(tmp_path / 'key'), 'rb') as key:
+                tatlin.upload_ssl_certificate(crt=crt, key=key)
+
+        boundary = sent['headers']['Content-Type'].split('boundary=')[1]
+        body = sent['body']
+
+        # Result: Content-Length was calculated before sending
+        assert sent['headers']['Content-Length'] == str(len(body))
+
+        # Result: File contents were sent byte-exact
+        assert b'filename="crt"\r\n\r\n' + crt_content + b'\r\n--' + boundary.encode() in body
+        assert b'filename="key"\r\n\r\n' + key_content + b'\r\n--' + boundary.encode() in body
+        assert body.endswith('--{0}--\r\n'.format(boundary).encode())
+
+    def test_multipart_text_line_endings(self):
+        # Encode in-memory text with LF line endings
+        body = MultipartEncoder(
+            {'crt': 'line1\nline2\n'}, boundary='boundary',
+        ).read()
+
+        # Result: Text was sent as is, line endings were not rewritten
+        # to CRLF and trailing line ending was kept
+        assert body == \
+            b'--boundary\r\n' \
+            b'Content-Type: application/octet-stream\r\n' \
+            b'Content-Disposition: form-data; ' \
+            b'name="crt"; filename="crt"\r\n\r\n' \
+            b'line1\nline2\n\r\n' \
+            b'--boundary--\r\n'
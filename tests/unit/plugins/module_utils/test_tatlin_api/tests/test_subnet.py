@@ -11,6 +11,7 @@ __metaclass__ = type
 
 import pytest
 import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.subnet import Subnet
 from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.task import Task
 from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.utils import check_called_with
@@ -86,6 +87,22 @@ class TestSubnet:
         assert subnets[1].ip_start == '8.8.8.8'
         assert subnets[1].ip_end == '9.9.9.9'
 
+    def test_get_subnets_keeps_resources_cache(
+        self, tatlin, make_mock, subnets_data,
+    ):
+        # Mock open_url with subnets data
+        make_mock(OPEN_URL_FUNC, return_value=subnets_data)
+
+        # Get subnets and fill cache with resources
+        tatlin.get_subnets()
+        tatlin.cache.set(inv.RESOURCES, [inv.RESOURCES])
+
+        # Get subnets again, known subnets are refreshed in place
+        tatlin.get_subnets()
+
+        # Result: Resources cache was kept
+        assert tatlin.cache.get(inv.RESOURCES) == [inv.RESOURCES]
+
     def test_get_subnet(self, tatlin, make_mock, subnets_data):
 
         # Mock open_url with subnets data
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# YADRO Tatlin Unified Ansible Collection
+# Version 1.0.0
+# Copyright (c) 2022 YADRO (KNS Group LLC)
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.endpoints as eps
+import ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.inventory as inv
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.models.task import Task
+from ansible_collections.yadro.tatlin_uni.plugins.module_utils.tatlin_api.exception import TatlinTaskError
+from ansible_collections.yadro.tatlin_uni.tests.unit.plugins.module_utils.test_tatlin_api.constants import (
+    OPEN_URL_FUNC, TASK_MODULE,
+)
+
+
+class TestTask:
+
+    def test_wait_tasks(self, tatlin, make_mock):
+        # Mock sleeping
+        sleep_mock = make_mock(TASK_MODULE + '.time.sleep')
+
+        # Create tasks
+        tasks = [
+            Task(client=tatlin, id=1, state='in_progress'),
+            Task(client=tatlin, id=2, state='in_progress'),
+            Task(client=tatlin, id=3, state='in_progress'),
+        ]
+
+        # Mock open_url with tasks list data
+        open_url_mock = make_mock(
+            OPEN_URL_FUNC,
+            chain_calls=True,
+            return_value=[
+                [{'id': 1, 'state': 'done'},
+                 {'id': 2, 'state': 'in_progress'},
+                 {'id': 3, 'state': 'in_progress'}],
+                [{'id': 2, 'state': 'error'},
+                 {'id': 3, 'state': 'in_progress'}],
+                {'id': 3, 'state': 'done'},
+            ],
+        )
+
+        # Wait tasks
+        outcomes = tatlin.wait_tasks(tasks)
+
+        # Result: Every task has its final state
+        assert outcomes == {1: 'done', 2: 'error', 3: 'done'}
+
+        # Result: Tasks list was requested once per poll,
+        # the last pending task was requested by id
+        urls = [c[1]['url'] for c in open_url_mock.call_args_list]
+        assert urls[0].endswith(eps.DASHBOARD_TASKS_ENDPOINT)
+        assert urls[1].endswith(eps.DASHBOARD_TASKS_ENDPOINT)
+        assert urls[2].endswith(eps.DASHBOARD_TASKS_ENDPOINT + '/3')
+
+        # Result: Poll interval grew
+        intervals = [c[0][0] for c in sleep_mock.call_args_list]
+        assert intervals == sorted(intervals)
+        assert intervals[0] < intervals[-1]
+
+    def test_wait_tasks_timeout(self, tatlin, make_mock):
+        # Mock sleeping and time
+        make_mock(TASK_MODULE + '.time.sleep')
+        make_mock(TASK_MODULE + '.time.time', side_effect=[0, 0, 10])
+
+        # Mock open_url with running task data
+        make_mock(OPEN_URL_FUNC, return_value={'id': 1, 'state': 'running'})
+
+        # Wait task
+        task = Task(client=tatlin, id=1, state='running')
+        outcomes = tatlin.wait_tasks([task], timeout=5)
+
+        # Result: Task has timeout state
+        assert outcomes == {1: 'timeout'}
+
+    def test_wait_tasks_invalidates_affected(self, tatlin, make_mock):
+        # Mock sleeping
+        make_mock(TASK_MODULE + '.time.sleep')
+
+        # Fill cache with collections
+        for collection in (inv.USERS, inv.SUBNETS, inv.RESOURCES):
+            tatlin.cache.set(collection, [collection])
+
+        # Mock open_url with finished task data
+        make_mock(OPEN_URL_FUNC, return_value={'id': 1, 'state': 'done'})
+
+        # Wait subnet task
+        task = Task(
+            client=tatlin,
+            path=eps.DASHBOARD_SUBNETS_ENDPOINT,
+            id=1,
+            state='running',
+        )
+        tatlin.wait_tasks([task])
+
+        # Result: Only collections changed by the task were dropped
+        assert tatlin.cache.get(inv.SUBNETS) is None
+        assert tatlin.cache.get(inv.RESOURCES) is None
+        assert tatlin.cache.get(inv.USERS) == [inv.USERS]
+
+    def test_wait_finished_tasks_keeps_cache(self, tatlin, make_mock):
+        # Fill cache with collection
+        tatlin.cache.set(inv.SUBNETS, [inv.SUBNETS])
+
+        # Mock open_url without data
+        open_url_mock = make_mock(OPEN_URL_FUNC)
+
+        # Wait task which was finished before
+        task = Task(
+            client=tatlin,
+            path=eps.DASHBOARD_SUBNETS_ENDPOINT,
+            id=1,
+            state='done',
+        )
+        outcomes = tatlin.wait_tasks([task])
+
+        # Result: Task was not requested and cache was kept
+        assert outcomes == {1: 'done'}
+        assert open_url_mock.call_count == 0
+        assert tatlin.cache.get(inv.SUBNETS) == [inv.SUBNETS]
+
+    def test_wait_until_complete_error(self, tatlin, make_mock):
+        # Mock sleeping
+        make_mock(TASK_MODULE + '.time.sleep')
+
+        # Mock open_url with failed task data
+        make_mock(OPEN_URL_FUNC, return_value={'id': 1, 'state': 'error'})
+
+        # Result: Error is raised for failed task
+        task = Task(client=tatlin, id=1, state='running')
+        with pytest.raises(TatlinTaskError):
+            task.wait_until_complete()
@@ -212,6 +212,30 @@ class TestUser:
         # Result: Request with expected parameters was sent to tatlin
         open_url_mock.assert_called_with(**open_url_kwargs)
 
+    def test_update_write_through(self, tatlin, make_mock):
+        # Enable write-through mode
+        tatlin.write_through = True
+
+        # Mock open_url without data
+        open_url_mock = make_mock(target=OPEN_URL_FUNC)
+
+        # Create user
+        user = User(
+            client=tatlin,
+            name='testuser',
+            uid=11111,
+            enabled=True,
+            member_of=['testuser'],
+        )
+
+        # Update user
+        user.update(password='123', enabled=False, groups=['admin'])
+
+        # Result: Changes were applied with single request
+        assert user.enabled is False
+        assert user._member_of == ['admin']
+        assert open_url_mock.call_count == 1
+
     def test_update_no_arguments(self, tatlin):
         # Create user
         user = User(
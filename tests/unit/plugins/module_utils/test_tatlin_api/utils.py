@@ -36,9 +36,10 @@ def check_obj(objects, exp_params, ignore_order=None):
         if isinstance(exp_params, list) else [exp_params]
 
     objects = objects if isinstance(objects, list) else [objects]
+    # Models use __slots__, so attributes are read one by one
     fact_params_list = [
-        dict((k, v) for k, v in obj.__dict__.items()
-             if k in exp_params_list[0]) for obj in objects
+        dict((k, getattr(obj, k)) for k in exp_params_list[0]
+             if hasattr(obj, k)) for obj in objects
     ]
 
     if ignore_order is not None: